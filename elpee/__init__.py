@@ -1,7 +1,11 @@
 from .utils.protocols.st_problem import StandardProblem
 from .utils.protocols.lp_problem import LinearProblem
+from .utils.solve_session import SolveSession
+from .utils.settings import Settings, use_settings
 from .elpee_solver import ElpeeSolver as elpee_solver
 from .datahandler import data_handler
 from .datahandler import yaml_handler
 from .datahandler import json_handler
+from .datahandler import mps_handler
+from .datahandler import lp_handler
 from .utils import configs
\ No newline at end of file
@@ -1,6 +1,8 @@
 # elpee/algorithms/__init__.py
 
 from .all_stack_starter import AllStackStarter
+from .revised_simplex import RevisedSimplexSolver
+from .batch_simplex import BatchSimplexSolver
 """
 Export Algorithms to solve Linear Programming Problems
 
@@ -9,5 +11,7 @@ Modeules exported by this package:
 - `AllStackStarter` : Provide implementation for All Atack Starting Method
 - `bigM_handler` : Provide implementation for Big M method
 - `DualSimplexSolver` : Provide implementation for Dual Simplex method
+- `RevisedSimplexSolver` : Provide implementation for Revised Simplex method
+- `BatchSimplexSolver` : Provide implementation for solving same shape problems in lockstep
 
 """
@@ -1,15 +1,23 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Literal, Union
-from elpee.datahandler.data_handler import save_file
+from typing import Generator, List, Literal, Union
+import numpy as np
 from elpee.utils.protocols.handler import DataHandler
 from elpee.utils.feasible import FeasibleHandler
 from elpee.utils.protocols.lp_problem import LinearProblem
 from elpee.utils.protocols.st_problem import StandardProblem
 from elpee.alternator import AlternateSolver
 from elpee.algorithms.big_m import check_artificial_basic_vars
-from elpee.utils.utilities import create_ratio_col, round_off_simplex_matrix, select_pivot_col, subsitute_big_M_for_row
+from elpee.algorithms.dual_simplex import DualSimplexSolver
+from elpee.algorithms.degeneracy import perturb_rhs, remove_rhs_perturbation
+from elpee.algorithms.pricing import BlandPricing, PricingRule, get_pricing_rule
+from elpee.utils.bigm import make_big_m
+from elpee.utils.events import NULL_SINK, EventsOption, get_event_sink
+from elpee.utils.protocols.solve_step import SolveStep, run_steps
+from elpee.utils.ratio_test import DUAL_TOLERANCE, PIVOT_TOLERANCE, PRIMAL_TOLERANCE, select_leaving_row
+from elpee.utils.settings import Settings, get_settings
+from elpee.utils.utilities import round_off_simplex_matrix, subsitute_big_M_for_row
 from elpee.utils.printer import SimplexPrinter
 
 class AllStackStarter():
@@ -40,24 +48,85 @@ class AllStackStarter():
     simplex_printer : elpee.utils.SimplexPrinter 
         An instance of printer to visualize the simplex table
         of given LP problem
+    settings : elpee.utils.settings.Settings
+        Settings of the displayed and saved steps
+    events : elpee.utils.events.EventSink
+        Sink receiving the messages of the solve
     feasible_handler : elpee.utils.FeasibleHandler
         An instance of handler object to retain feasibility of
         LP problem and its solutions
+    pricing : elpee.algorithms.pricing.PricingRule
+        Pricing rule used to select the entering variable
+    tie_break : str
+        Rule used to select among the rows tied in the ratio test
+    max_iterations : int
+        Limit on the number of pivots
+    n_iterations : int
+        Number of pivots applied
+    n_degenerate_pivots : int
+        Number of pivots on a zero solution value
+    n_cycles_detected : int
+        Number of times a basis was repeated in the optimization steps
 
     Methods
     -------
     solver() -> elpee.StandardProblem
         Solves the Standardized LP problem given to AllStackStarter instance
+    iter_solver() -> Generator[SolveStep, None, elpee.StandardProblem]
+        Solves the Standardized LP problem one step at a time
     """
 
-    def __init__(self, problem: Union[StandardProblem, LinearProblem]):
+    def __init__(self, problem: Union[StandardProblem, LinearProblem], 
+                 pricing: Union[Literal['dantzig', 'partial', 'multiple', 'devex', 'steepest-edge', 'bland'], PricingRule] = 'dantzig',
+                 primal_tolerance: float = PRIMAL_TOLERANCE, pivot_tolerance: float = PIVOT_TOLERANCE,
+                 max_iterations: int = None, anti_cycling: Literal['bland', 'lexicographic', None] = 'bland',
+                 perturbation: float = 0.0, seed: int = None, dual_tolerance: float = DUAL_TOLERANCE,
+                 settings: Settings = None):
         """
         Parameters
         ----------
         problem : elpee.StandardProblem
             LP problem to be solved using All Stack Starting Method
+        pricing : str | elpee.algorithms.pricing.PricingRule (default : "dantzig")
+            Pricing rule used to select the entering variable. Expected options are
+            "dantzig"       : Largest improving coefficient of the objective row
+            "partial"       : Largest improving coefficient within blocks of columns
+            "multiple"      : Partial pricing retaining the best columns of a block
+            "devex"         : Largest reduced cost relative to Devex reference weights
+            "steepest-edge" : Largest reduced cost relative to the exact norm of the edge
+            "bland"         : Improving column with the smallest index
+        primal_tolerance : float (default : 1e-9)
+            Tolerance allowed on the solution values in the ratio test
+        pivot_tolerance : float (default : 1e-9)
+            Smallest absolute value of the pivot column accepted as a pivot element
+        max_iterations : int (default : None)
+            Limit on the number of pivots. Defaults to 50 times the size of the 
+            simplex table
+        anti_cycling : str (default : "bland") (Options : ["bland","lexicographic",None])
+            Rule switched to when a basis is repeated in the optimization steps 
+            (the method is cycling). Expected options are
+            "bland"         : Bland's rule for both the entering and leaving variables
+            "lexicographic" : Lexicographic tie breaking of the ratio test keeping 
+                              the pricing rule
+            None            : Stop optimizing when cycling is detected
+        perturbation : float (default : 0.0)
+            Relative bound of a random perturbation added to the solution values 
+            before the optimization steps to avoid degenerate pivots. The 
+            perturbation is removed once the optimization steps end. Not used if 0
+        seed : int (default : None)
+            Seed of the random perturbation
+        dual_tolerance : float (default : 1e-9)
+            Tolerance allowed on the objective row in the dual simplex steps
+        settings : elpee.utils.settings.Settings (default : None)
+            Settings giving the decimals and cell width of the displayed and saved 
+            steps. Uses the current settings if None
         """
 
+        if anti_cycling not in ['bland', 'lexicographic', None]:
+            raise ValueError(f"{anti_cycling} is an invalid argument for anti_cycling parameter.")
+        if perturbation < 0:
+            raise ValueError(f"Perturbation must not be negative. Received {perturbation}.")
+
         self.problem = problem
         self.is_max = problem.is_max
         self.n_decision_vars = problem.n_decision_vars
@@ -68,9 +137,31 @@ class AllStackStarter():
         self.feasible_count = 0
         self.infeasible_sol_count = 0
 
-        self.simplex_printer = SimplexPrinter()
-        self.feasible_handler = FeasibleHandler()
+        self.pricing = get_pricing_rule(pricing)
+        self.primal_tolerance = primal_tolerance
+        self.dual_tolerance = dual_tolerance
+        self.pivot_tolerance = pivot_tolerance
+        self.settings = settings if settings is not None else get_settings()
+        self.tie_break = 'largest-pivot'
+        self.reference_vars = None
+
+        self.max_iterations = max_iterations if max_iterations is not None else \
+            50 * (self.n_constraints + self.n_cols)
+        self.anti_cycling = anti_cycling
+        self.perturbation = perturbation
+        self.rng = np.random.default_rng(seed)
+        self.n_iterations = 0
+        self.n_degenerate_pivots = 0
+        self.n_cycles_detected = 0
+        self.__visited_bases = set()
+        self.__perturbed = None
+
+        self.simplex_printer = SimplexPrinter(settings=self.settings)
+        self.events = NULL_SINK
+        self.feasible_handler = FeasibleHandler(events=self.events, primal_tolerance=primal_tolerance,
+                                                dual_tolerance=dual_tolerance, pivot_tolerance=pivot_tolerance)
         self.data_handler = None
+        self.include_tableau = False
 
     def __is_optimal(self) -> bool:
         """
@@ -78,6 +169,9 @@ class AllStackStarter():
         solution value) indicates optimal solution 
         """
 
+        if self.problem.tableau is not None:
+            return self.problem.tableau.is_optimal(self.is_max)
+
         # substituting for M with large number (1,000,000) before doing comparision
 
         if self.is_max:
@@ -93,36 +187,133 @@ class AllStackStarter():
         When matrix cannot be optimized will return None
         """
 
-        M = 1000000
         blocked_cols = []
         while len(blocked_cols) < self.n_cols:
-            pivot_col_var = select_pivot_col(self.problem.obj_row, self.is_max, blocked_cols)
+            pivot_col_var = self.pricing.select_pivot_col(self.problem, blocked_cols)
             if pivot_col_var == -1:
-                # No suitable pivot column available
-                print("\nNo suitable entering varaible for selection")
+                if blocked_cols:
+                    # all improving columns were blocked without a limiting constraint
+                    self.events.emit("unbounded", "No limiting constraint for the entering variables - the solution is unbounded")
+                else:
+                    # No suitable pivot column available
+                    self.events.emit("no_entering_var", "No suitable entering varaible for selection")
                 
                 # unsuccessfully optimized
                 return False
-            ratio_col = create_ratio_col(self.problem.matrix, pivot_col_var)
-            if ratio_col == []:
-                # if the ratio column cannot be created due to a lack of constraints
-                print("\nNo constraints for optimization - the solution is unbounded")
+            if self.n_constraints == 0:
+                # if the ratio test cannot be done due to a lack of constraints
+                self.events.emit("unbounded", "No constraints for optimization - the solution is unbounded")
 
                 # return cannot optimize
                 return False
-            if min(ratio_col) == M:
-                # invalid ratio column with no suitable selections to be made
+            pivot_row_var, unbounded = select_leaving_row(self.problem, pivot_col_var, 
+                                                          self.primal_tolerance, self.pivot_tolerance,
+                                                          self.tie_break, self.reference_vars)
+            if unbounded:
+                # no row limits the entering variable
                 # will block the pivot col from being selected again 
                 # and find an alternate entering variable
                 blocked_cols.append(pivot_col_var)
             else:
                 # leaving varaible identified
-                pivot_row_var = ratio_col.index(min(ratio_col)) + 1
                 break
-        self.problem.basic_vars[pivot_row_var] = pivot_col_var
+        else:
+            self.events.emit("unbounded", "No limiting constraint for the entering variables - the solution is unbounded")
+            return False
+        if self.__get_sol_value(pivot_row_var) <= self.primal_tolerance:
+            # the entering variable enters at zero - the solution does not move
+            self.n_degenerate_pivots += 1
+        self.pricing.before_pivot(self.problem, pivot_row_var, pivot_col_var)
+        self.problem.pivot(pivot_row_var, pivot_col_var)
+        self.n_iterations += 1
+        self.__update_pivot_counts()
         
         # successfully optimized
         return True
+
+    def __get_sol_value(self, row: int) -> float:
+        """
+        Obtains the solution value of the constraint row `row` (1-based)
+        """
+
+        if self.problem.tableau is not None:
+            return float(self.problem.tableau.rhs[row-1])
+        return float(self.problem.matrix[row][-1])
+
+    def __is_cycling(self) -> bool:
+        """
+        Records the hash of the current basis and returns true if the basis 
+        was already visited in the optimization steps. As the objective value
+        does not get worse, a repeated basis means the method is cycling
+        through degenerate pivots
+        """
+
+        basis_hash = hash(tuple(self.problem.basic_vars))
+        if basis_hash in self.__visited_bases:
+            return True
+        self.__visited_bases.add(basis_hash)
+        return False
+
+    def __start_anti_cycling(self) -> bool:
+        """
+        Switches to the anti cycling rule once cycling is detected. Returns 
+        false if no rule is left to be switched to
+        """
+
+        self.n_cycles_detected += 1
+        if (self.anti_cycling is None) or (self.tie_break != 'largest-pivot'):
+            return False
+
+        if self.anti_cycling == 'bland':
+            self.events.emit("anti_cycling", "Cycling detected - switching to Bland's rule")
+            self.pricing = BlandPricing()
+            self.tie_break = 'bland'
+        else:
+            self.events.emit("anti_cycling", "Cycling detected - switching to lexicographic ratio test")
+            self.tie_break = 'lexicographic'
+            self.reference_vars = self.problem.basic_vars[1:].copy()
+        self.__visited_bases = {hash(tuple(self.problem.basic_vars))}
+        return True
+
+    def __perturb(self) -> None:
+        """
+        Adds the random perturbation to the solution values before the 
+        optimization steps
+        """
+
+        if (self.perturbation > 0) and (self.__perturbed is None) and (self.n_constraints != 0):
+            self.__perturbed = perturb_rhs(self.problem, self.perturbation, self.rng)
+
+    def __remove_perturbation(self) -> None:
+        """
+        Removes the random perturbation from the solution values. Solution values
+        turning negative are fixed with dual simplex steps, which keep the 
+        objective row unchanged in optimality
+        """
+
+        if self.__perturbed is None:
+            return
+        remove_rhs_perturbation(self.problem, *self.__perturbed)
+        self.__perturbed = None
+
+        while not self.feasible_handler.is_feasible(self.problem, canonical=True):
+            if self.n_iterations >= self.max_iterations:
+                self.problem.update_optimal_reachability_status(False)
+                break
+            self.problem = DualSimplexSolver(self.problem, primal_tolerance=self.primal_tolerance,
+                                             dual_tolerance=self.dual_tolerance, pivot_tolerance=self.pivot_tolerance,
+                                             events=self.events).solver()
+            self.n_iterations += 1
+            if not self.problem.is_feasible:
+                break
+        self.__update_pivot_counts()
+
+    def __update_pivot_counts(self) -> None:
+        """
+        Function to record the pivot counts on the StandardProblem object
+        """
+
+        self.problem.update_pivot_counts(self.n_iterations, self.n_degenerate_pivots)
     
     def __generate_initial_feasible_sol_step(self) -> None:
         """
@@ -130,8 +321,10 @@ class AllStackStarter():
         """
 
         self.infeasible_sol_count += 1
+        self.n_iterations += 1
+        self.__update_pivot_counts()
         if self.data_handler.freq == "all":
-            save_file(self.problem, file_format=self.data_handler.file_format, file_path=f"solution/infeasible_sol_{self.infeasible_sol_count}.{self.data_handler.file_format}")
+            self.data_handler.save_step(self.problem, f"infeasible_sol_{self.infeasible_sol_count}")
         self.__make_feasible()
     
     def __optimize_step(self) -> None:
@@ -142,27 +335,44 @@ class AllStackStarter():
         old_basic_vars = self.problem.basic_vars.copy()
         optimizable = self.__optimize()
         if not optimizable:
-            print("\nCannot be optimized further")
+            self.events.emit("not_optimizable", "Cannot be optimized further")
         else:
-            self.simplex_printer.print_entering_leaving_vars(old_basic_vars, self.problem)
+            self.__emit_pivot(old_basic_vars)
         self.problem.update_optimal_reachability_status(optimizable)
     
-    def __make_feasible(self) -> None:
+    def __make_feasible(self, pivoted: bool = False) -> None:
         """
         Function that converts the optimal solution to a feasible optimal 
-        solution
+        solution. When the matrix was `pivoted` from a feasible solution the
+        0-1 pattern is retained and only the feasibility status is updated
         """
 
         old_basic_vars = self.problem.basic_vars.copy()
-        self.problem = self.feasible_handler.get_feasible(self.problem)
-        self.problem.update_feasible_status(self.feasible_handler.is_feasible(self.problem))
+        if not pivoted:
+            self.problem = self.feasible_handler.get_feasible(self.problem)
+        self.problem.update_feasible_status(self.feasible_handler.is_feasible(self.problem, canonical=pivoted))
         if not self.problem.is_optimal_reachable:
             if self.feasible_count != 0:
-                print("\nNo further feasible solution found")
+                self.events.emit("infeasible", "No further feasible solution found")
             else:
-                print("\nNo feasible solution found")
+                self.events.emit("infeasible", "No feasible solution found")
         else:
-            self.simplex_printer.print_entering_leaving_vars(old_basic_vars, self.problem)
+            self.__emit_pivot(old_basic_vars)
+
+    def __emit_pivot(self, old_basic_vars: List[int]) -> None:
+        """
+        Reports the entering and leaving variables of the change from `old_basic_vars`.
+        The variable names are only looked up when the events are handled
+        """
+
+        if not self.events.enabled:
+            return
+        for before_var_idx, after_var_idx in zip(old_basic_vars, self.problem.basic_vars):
+            if before_var_idx != after_var_idx:
+                self.events.emit("pivot", "Taking %s = 0; Entering %s as a new basic variable;",
+                                 self.simplex_printer.print_var_name(before_var_idx, self.problem),
+                                 self.simplex_printer.print_var_name(after_var_idx, self.problem))
+                return
 
     def __increment_feasible_sol_num(self) -> None:
         """
@@ -181,10 +391,30 @@ class AllStackStarter():
         """
 
         self.__increment_feasible_sol_num()
-        print(f"\nFeasible Solution # {self.feasible_count}")
+        self.events.emit("feasible_solution", "Feasible Solution # %d", self.feasible_count)
         self.simplex_printer.print_simplex_table_cli(self.problem)
         if self.data_handler.freq == "all":
-            save_file(self.problem, file_format=self.data_handler.file_format, file_path=f"solution/sol_step_{self.feasible_count}.{self.data_handler.file_format}")
+            self.data_handler.save_step(self.problem, f"sol_step_{self.feasible_count}")
+
+    def __round_off_matrix(self) -> None:
+        """
+        Function to round off the values of the simplex matrix. Tableaus are
+        rounded off in place
+        """
+
+        if self.problem.tableau is not None:
+            self.problem.tableau.round(self.settings.get_decimals())
+        else:
+            self.problem.matrix = round_off_simplex_matrix(self.problem.matrix, self.settings.get_decimals())
+
+    def __stop_at_iteration_limit(self) -> None:
+        """
+        Function to stop solving once the limit on the number of pivots is reached
+        """
+
+        self.events.emit("iteration_limit", "Iteration limit of %d reached - cannot be optimized further", self.max_iterations)
+        self.problem.update_optimal_reachability_status(False)
+        self.__round_off_matrix()
 
     def __set_infeasible_status(self) -> None:
         """
@@ -196,17 +426,75 @@ class AllStackStarter():
         self.problem.update_optimal_reachability_status(False)
         self.problem.update_optimal_status(False)
 
+    def __get_objective_value(self):
+        """
+        Obtains the value of the objective function in the simplex matrix
+        """
+
+        tableau = self.problem.tableau
+        if tableau is None:
+            return self.problem.matrix[0][-1]
+        if tableau.m_row is not None:
+            return make_big_m(float(tableau.objective[-1]), float(tableau.m_row[-1]))
+        return float(tableau.objective[-1])
+
+    def __create_step(self, phase: str, old_basic_vars: List[int]) -> SolveStep:
+        """
+        Creates the record of the step changing the basis from `old_basic_vars`
+        """
+
+        entering, leaving = None, None
+        for before_var_idx, after_var_idx in zip(old_basic_vars, self.problem.basic_vars):
+            if before_var_idx != after_var_idx:
+                leaving = self.problem.get_variable_name(before_var_idx)
+                entering = self.problem.get_variable_name(after_var_idx)
+                break
+        tableau = None
+        if self.include_tableau:
+            tableau = self.problem.tableau if self.problem.tableau is not None else self.problem.matrix
+        return SolveStep(phase, self.n_iterations, entering, leaving, self.__get_objective_value(), tableau)
+
     def solver(
             self, 
             do_step : bool = False, 
             show_steps : bool =True, 
             show_interpret : bool =True,
             file_format: Literal['json', 'yaml', None] = None,
-            freq: Literal['all','final', None] = None) -> StandardProblem:
+            freq: Literal['all','final', None] = None,
+            events: EventsOption = None) -> StandardProblem:
         """
         Executing function to solve the linear programming problems using 
         all stack starting method 
 
+        Parameters
+        ---------
+        Same as `iter_solver`
+
+        Return
+        ------
+        StandardProblem object after optimizing using the all stack starting 
+        method. Will return a suboptimal or infeasible StandardProblem object if
+        the problem cannot be optimized. 
+        """
+
+        return run_steps(self.iter_solver(do_step, show_steps, show_interpret, file_format, freq, events=events))
+
+    def iter_solver(
+            self, 
+            do_step : bool = False, 
+            show_steps : bool =True, 
+            show_interpret : bool =True,
+            file_format: Literal['json', 'yaml', 'trajectory', 'history', None] = None,
+            freq: Literal['all','final', None] = None,
+            include_tableau: bool = False,
+            events: EventsOption = None,
+            data_handler: DataHandler = None) -> Generator[SolveStep, None, StandardProblem]:
+        """
+        Generator solving the linear programming problems using all stack 
+        starting method. A `SolveStep` record is yielded after each step 
+        generating the initial feasible solution and after each optimization 
+        pivot, so the solve can be suspended between steps or stopped early
+
         Parameters
         ---------
         do_step : `bool` (default : `False`)
@@ -215,8 +503,8 @@ class AllStackStarter():
             Display all iterations occurring in the simplex matrix
         show_interpret : `bool` (default : `True`)
             Display the interpretation of the solution at each iteration
-        file_format : `str` (default : `None`) (Options : ["yaml","json",`None`]) 
-            Save the steps on solution in `json` or `yaml` file formats if provided
+        file_format : `str` (default : `None`) (Options : ["yaml","json","trajectory","history",`None`]) 
+            Save the steps on solution in `json` or `yaml` files or to a trajectory or history file if provided
         freq : str (default : None) (Options : ["all","final",`None`]) 
             Save the steps in the solved LP problem. The freuency is 
             overidden to None if the file_format is `None`. The frequency 
@@ -225,71 +513,128 @@ class AllStackStarter():
             "all"   : For saving all steps
             "final" : For saving final result only
             None    : No saving
+        include_tableau : `bool` (default : `False`)
+            Include the simplex matrix in the `SolveStep` records
+        events : `elpee.utils.events.EventSink` | `logging.Logger` | Callable (default : `None`)
+            Sink receiving the messages of the solve, a logger or a function called 
+            with each `SolverEvent`. If `None`, the messages are printed when the 
+            steps or the interpretation are displayed and ignored otherwise
+        data_handler : `elpee.utils.protocols.handler.DataHandler` (default : `None`)
+            Handler saving the steps, used instead of file_format and freq. The 
+            handler is closed by the caller. A handler for file_format and freq 
+            is created and closed once solved if None
 
         Return
         ------
-        StandardProblem object after optimizing using the all stack starting 
-        method. Will return a suboptimal or infeasible StandardProblem object if
-        the problem cannot be optimized. 
+        StandardProblem object after optimizing (as the value of the StopIteration) 
+        using the all stack starting method. Will return a suboptimal or infeasible 
+        StandardProblem object if the problem cannot be optimized. 
         """
 
-        self.simplex_printer = SimplexPrinter(show_steps, show_interpret)
-        self.data_handler = DataHandler(file_format=file_format, freq=freq)
+        self.simplex_printer = SimplexPrinter(show_steps, show_interpret, self.settings)
+        self.include_tableau = include_tableau
+        self.events = get_event_sink(events, verbose=(show_steps or show_interpret))
+        self.feasible_handler.events = self.events
+
+        if data_handler is not None:
+            self.data_handler = data_handler
+            return (yield from self.__iter_steps(do_step))
+
+        self.data_handler = DataHandler(file_format=file_format, freq=freq, settings=self.settings)
+        try:
+            return (yield from self.__iter_steps(do_step))
+        finally:
+            self.data_handler.close()
+
+    def __iter_steps(self, do_step: bool) -> Generator[SolveStep, None, StandardProblem]:
+        """
+        Generator applying the steps of the all stack starting method
+        """
 
         while not(self.feasible_handler.is_feasible(self.problem)):
             self.problem.update_feasible_status(False)
-            print("\n...Generating Initial Feasible Solution for")
+            if self.n_iterations >= self.max_iterations:
+                self.__stop_at_iteration_limit()
+                self.__set_infeasible_status()
+                return self.problem
+            self.events.emit("initial_feasible", "...Generating Initial Feasible Solution for")
             self.simplex_printer.print_simplex_table_cli(self.problem) 
+            old_basic_vars = self.problem.basic_vars.copy()
             self.__generate_initial_feasible_sol_step()
             if not self.problem.is_optimal_reachable:
-                self.problem.matrix = round_off_simplex_matrix(self.problem.matrix)
+                self.__round_off_matrix()
                 if self.data_handler.freq == "all":
-                    save_file(self.problem, file_format=self.data_handler.file_format, file_path=f"solution/infeasible_sol_{self.infeasible_sol_count}.{self.data_handler.file_format}")
+                    self.data_handler.save_step(self.problem, f"infeasible_sol_{self.infeasible_sol_count}")
                 # no feasible solution
                 return self.problem
+            yield self.__create_step('feasibility', old_basic_vars)
         
         self.problem.update_feasible_status(True)
         if self.feasible_count != 0:
             self.feasible_count -= 1
         self.__display_new_feasible_sol()
-        
+
+        self.__perturb()
+        self.__is_cycling()
         while not(self.__is_optimal()):
+            if self.n_iterations >= self.max_iterations:
+                self.__remove_perturbation()
+                self.__stop_at_iteration_limit()
+                return self.problem
+
+            old_basic_vars = self.problem.basic_vars.copy()
             self.__optimize_step()
             if not self.problem.is_optimal_reachable:
+                self.__remove_perturbation()
                 # update the last file saved with reachability status
-                if freq == "all":
-                    save_file(self.problem, file_format=self.data_handler.file_format, file_path=f"solution/sol_step_{self.feasible_count}.{self.data_handler.file_format}")
-                self.problem.matrix = round_off_simplex_matrix(self.problem.matrix)
+                if self.data_handler.freq == "all":
+                    self.data_handler.save_step(self.problem, f"sol_step_{self.feasible_count}")
+                self.__round_off_matrix()
                 # cannot be optimized
                 return self.problem
+
+            if self.__is_cycling() and not self.__start_anti_cycling():
+                self.events.emit("cycling", "Cycling detected - cannot be optimized further")
+                self.__remove_perturbation()
+                self.problem.update_optimal_reachability_status(False)
+                self.__round_off_matrix()
+                return self.problem
         
-            self.__make_feasible()
+            self.__make_feasible(pivoted=True)
             if not self.problem.is_feasible:
-                self.problem.matrix = round_off_simplex_matrix(self.problem.matrix)
+                self.__remove_perturbation()
+                self.__round_off_matrix()
                 # no further feasible solution
                 return self.problem
             
             self.__display_new_feasible_sol()
+            yield self.__create_step('optimization', old_basic_vars)
             if do_step:
                 break
+
+        self.__remove_perturbation()
+        if not self.problem.is_optimal_reachable:
+            self.__round_off_matrix()
+            # cannot be optimized after removing the perturbation
+            return self.problem
         
         if (self.__is_optimal()):
             if (check_artificial_basic_vars(self.problem)):
-                self.problem.matrix = round_off_simplex_matrix(self.problem.matrix)
+                self.__round_off_matrix()
                 self.__set_infeasible_status()
-                if freq == "all":
-                    save_file(self.problem, file_format=self.data_handler.file_format, file_path=f"solution/sol_step_{self.feasible_count}.{self.data_handler.file_format}")
-                print("\nArtificial variables found in optimal soltion.\nProblem is infeasible.")
+                if self.data_handler.freq == "all":
+                    self.data_handler.save_step(self.problem, f"sol_step_{self.feasible_count}")
+                self.events.emit("infeasible", "Artificial variables found in optimal soltion.\nProblem is infeasible.")
                 return self.problem
             else:
                 self.problem.update_optimal_status(True)
-                if freq == "all":
-                    save_file(self.problem, file_format=self.data_handler.file_format, file_path=f"solution/sol_step_{self.feasible_count}.{self.data_handler.file_format}")
-                print("\nOptimized Solution Received!")
+                if self.data_handler.freq == "all":
+                    self.data_handler.save_step(self.problem, f"sol_step_{self.feasible_count}")
+                self.events.emit("optimal", "Optimized Solution Received!")
         
-        alternator = AlternateSolver(self.problem)
+        alternator = AlternateSolver(self.problem, events=self.events)
         if alternator.n_alternates != 0:
-            print(f"There are {alternator.n_alternates} Alternate Solutions for this problem!")
+            self.events.emit("alternates", "There are %d Alternate Solutions for this problem!", alternator.n_alternates)
             # print(f">> Use alternate_solutions.extract_alternate_solution() method using version numbers from 1 to {num_alternate_sols}.")
             # print(f">> Use alternate_solutions.display_all_alternate_solutions() method to display all alternate solutions")
 
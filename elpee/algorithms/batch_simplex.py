@@ -0,0 +1,429 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Literal, Sequence, Union
+
+import numpy as np
+
+from elpee.alternator import AlternateSolver
+from elpee.utils.bigm import M_COEFF_TOLERANCE
+from elpee.utils.protocols.lp_problem import LinearProblem
+from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.protocols.tableau import DenseTableau
+from elpee.utils.ratio_test import DUAL_TOLERANCE, PIVOT_TOLERANCE, PRIMAL_TOLERANCE
+from elpee.utils.settings import get_settings
+
+class BatchSimplexSolver():
+    """
+    A class used to solve a batch of LP problems with simplex matrices of the
+    same shape in lockstep
+
+    The simplex matrices are stacked into a single 3-D array and the steps of
+    the all stack starting method (dual simplex steps to a feasible solution,
+    Dantzig pricing, Harris ratio test and Bland's rule once cycling is
+    detected) are applied to all problems at once. Problems that are solved,
+    unbounded or infeasible are masked out of the following steps.
+
+    Attributes
+    ----------
+    tableaus : numpy.ndarray
+        n_problems x (n_constraints + 1) x (n_cols + 1) array of the simplex matrices
+    m_rows : numpy.ndarray
+        n_problems x (n_cols + 1) array of the coefficients of M in the objective rows
+    basic_vars : numpy.ndarray
+        n_problems x (n_constraints + 1) array of the basic variables
+    max_iterations : int
+        Limit on the number of pivots of each problem
+    anti_cycling : str
+        Rule switched to when a basis is repeated ('bland' or None)
+    n_iterations : numpy.ndarray
+        Number of pivots applied to each problem
+    n_degenerate_pivots : numpy.ndarray
+        Number of pivots on a zero solution value of each problem
+
+    Methods
+    -------
+    solver() -> List[elpee.StandardProblem]
+        Solves the batch of Standardized LP problems
+    """
+
+    def __init__(self, problems: Sequence[Union[StandardProblem, LinearProblem]],
+                 primal_tolerance: float = PRIMAL_TOLERANCE, pivot_tolerance: float = PIVOT_TOLERANCE,
+                 max_iterations: int = None, anti_cycling: Literal['bland', None] = 'bland',
+                 decimals: int = None):
+        """
+        Parameters
+        ----------
+        problems : Sequence[elpee.StandardProblem | elpee.LinearProblem]
+            LP problems to be solved. The simplex matrices must have the same shape
+        primal_tolerance : float (default : 1e-9)
+            Tolerance allowed on the solution values in the ratio test
+        pivot_tolerance : float (default : 1e-9)
+            Smallest absolute value of the pivot column accepted as a pivot element
+        max_iterations : int (default : None)
+            Limit on the number of pivots of each problem. Defaults to 50 times
+            the size of the simplex table
+        anti_cycling : str (default : "bland") (Options : ["bland",None])
+            Rule switched to when a basis is repeated in the optimization steps.
+            Expected options are
+            "bland" : Bland's rule for both the entering and leaving variables
+            None    : Stop optimizing when cycling is detected
+        decimals : int (default : None)
+            Number of decimal places the simplex matrices of the problems stopped
+            without an optimal solution are rounded off to. Uses the decimals of the
+            current settings if None
+        """
+
+        if anti_cycling not in ['bland', None]:
+            raise ValueError(f"{anti_cycling} is an invalid argument for anti_cycling parameter.")
+        if len(problems) == 0:
+            raise ValueError("At least one LP problem must be given to be solved.")
+
+        problems = [problem.standardize_problem() if isinstance(problem, LinearProblem) else problem
+                    for problem in problems]
+        tableaus = [self.__get_dense_tableau(problem) for problem in problems]
+        shape = tableaus[0].array.shape
+        for i, tableau in enumerate(tableaus):
+            if tableau.array.shape != shape:
+                raise ValueError(f"Simplex matrix of problem {i} has the shape {tableau.array.shape}. " +
+                                 f"Expected the shape {shape} of the first problem.")
+
+        self.problems = problems
+        self.tableaus = np.stack([tableau.array for tableau in tableaus])
+        self.m_rows = np.stack([tableau.m_row if tableau.m_row is not None else np.zeros(shape[1])
+                                for tableau in tableaus])
+        self.has_m_row = np.array([tableau.m_row is not None for tableau in tableaus])
+        self.basic_vars = np.array([problem.basic_vars for problem in problems], dtype=np.int64)
+        self.signs = np.array([1.0 if problem.is_max else -1.0 for problem in problems])
+        # first artificial variable of each problem
+        self.artificial_start = np.array([problem.n_decision_vars + problem.n_slack_vars + 1 for problem in problems])
+
+        self.n_problems, self.n_rows, _ = self.tableaus.shape
+        self.n_constraints = self.n_rows - 1
+        self.n_cols = shape[1] - 1
+        self.primal_tolerance = primal_tolerance
+        self.pivot_tolerance = pivot_tolerance
+        self.decimals = decimals if decimals is not None else get_settings().get_decimals()
+        self.max_iterations = max_iterations if max_iterations is not None else \
+            50 * (self.n_constraints + self.n_cols)
+        self.anti_cycling = anti_cycling
+
+        self.n_iterations = np.zeros(self.n_problems, dtype=np.int64)
+        self.n_degenerate_pivots = np.zeros(self.n_problems, dtype=np.int64)
+        self.n_cycles_detected = np.zeros(self.n_problems, dtype=np.int64)
+        self.is_feasible = np.ones(self.n_problems, dtype=bool)
+        self.is_optimal_reachable = np.ones(self.n_problems, dtype=bool)
+        self.is_optimal = np.zeros(self.n_problems, dtype=bool)
+        self.use_bland = np.zeros(self.n_problems, dtype=bool)
+        self.__basis_weights = np.random.default_rng(0).integers(1, 2**63, self.n_rows, dtype=np.uint64)
+
+    @staticmethod
+    def __get_dense_tableau(problem: StandardProblem) -> DenseTableau:
+        """
+        Obtains the simplex matrix of the problem as a dense tableau
+        """
+        if isinstance(problem.tableau, DenseTableau):
+            return problem.tableau
+        if problem.tableau is not None:
+            return problem.tableau.to_dense()
+        return DenseTableau(problem.matrix)
+
+    def __pivot(self, idx: np.ndarray, pivot_rows: np.ndarray, pivot_cols: np.ndarray) -> np.ndarray:
+        """
+        Applies a Gauss-Jordan pivot on the cell (pivot_rows[i], pivot_cols[i])
+        (0-based columns) of each problem idx[i]. Problems with a zero pivot
+        element are not pivoted and returned as a mask
+        """
+        cells = self.tableaus[idx, pivot_rows, pivot_cols]
+        failed = cells == 0
+        if failed.any():
+            idx, pivot_rows, pivot_cols, cells = idx[~failed], pivot_rows[~failed], pivot_cols[~failed], cells[~failed]
+
+        all_ = np.arange(idx.size)
+        tableaus = self.tableaus[idx]
+        tableaus[all_, pivot_rows] /= cells[:, None]
+        pivot_row_values = tableaus[all_, pivot_rows]
+        factors = tableaus[all_, :, pivot_cols]
+        factors[all_, pivot_rows] = 0
+        tableaus -= factors[:, :, None] * pivot_row_values[:, None, :]
+        self.tableaus[idx] = tableaus
+
+        m_rows = self.m_rows[idx]
+        m_rows -= m_rows[all_, pivot_cols][:, None] * pivot_row_values
+        m_rows[np.abs(m_rows) <= M_COEFF_TOLERANCE] = 0
+        self.m_rows[idx] = m_rows
+
+        self.basic_vars[idx, pivot_rows] = pivot_cols + 1
+        return failed
+
+    def __is_canonical(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Checks if the columns of the basic variables have the 0-1 pattern
+        """
+        cols = self.basic_vars[idx, 1:] - 1
+        basic_cols = np.take_along_axis(self.tableaus[idx, :, :-1], np.repeat(cols[:, None, :], self.n_rows, axis=1), axis=2)
+        expected = np.eye(self.n_rows, self.n_constraints, k=-1)
+        m_coeffs = np.take_along_axis(self.m_rows[idx], cols, axis=1)
+        return (basic_cols == expected).all(axis=(1, 2)) & ~m_coeffs.any(axis=1)
+
+    def __has_negative_rhs(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Checks if any constraint row has a solution value below the primal tolerance
+        """
+        return (self.tableaus[idx, 1:, -1] < -self.primal_tolerance).any(axis=1)
+
+    def __canonicalize(self, idx: np.ndarray) -> None:
+        """
+        Fixes the 0-1 pattern for the columns of the basic variables in the
+        order of the rows they belong to
+        """
+        for row_i in range(1, self.n_rows):
+            failed = self.__pivot(idx, np.full(idx.size, row_i), self.basic_vars[idx, row_i] - 1)
+            self.is_optimal_reachable[idx[failed]] = False
+
+    def __dual_simplex_step(self, idx: np.ndarray) -> None:
+        """
+        Applies a dual simplex pivot on the most negative solution value having
+        a negative entry in its row, with the dual Harris ratio test for the
+        entering variable. Problems without such a row are infeasible
+        """
+        tableaus = self.tableaus[idx]
+        all_ = np.arange(idx.size)
+        rhs = tableaus[:, 1:, -1]
+        costs = np.abs(tableaus[:, 0, :-1])
+        costs[self.m_rows[idx, :-1] != 0] = np.inf
+
+        # negated rows as the divisors of the ratio test
+        divisors = -tableaus[:, 1:, :-1]
+        eligible = (divisors > self.pivot_tolerance) & np.isfinite(costs)[:, None, :]
+        candidate_rows = (rhs < -self.primal_tolerance) & eligible.any(axis=2)
+        has_row = candidate_rows.any(axis=1)
+        self.is_feasible[idx[~has_row]] = False
+        self.is_optimal_reachable[idx[~has_row]] = False
+
+        pivot_rows = np.argmin(np.where(candidate_rows, rhs, np.inf), axis=1)
+        divisors = divisors[all_, pivot_rows]
+        eligible = eligible[all_, pivot_rows]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step_bound = np.where(eligible, (costs + DUAL_TOLERANCE) / divisors, np.inf).min(axis=1)
+            candidates = eligible & (costs / divisors <= step_bound[:, None])
+        pivot_cols = np.argmax(np.where(candidates, divisors, -np.inf), axis=1)
+
+        failed = self.__pivot(idx[has_row], pivot_rows[has_row] + 1, pivot_cols[has_row])
+        self.is_optimal_reachable[idx[has_row][failed]] = False
+
+    def __round_off(self, idx: np.ndarray) -> None:
+        """
+        Rounds off the simplex matrices of the problems stopped without an optimal solution
+        """
+        self.tableaus[idx] = np.round(self.tableaus[idx], self.decimals)
+        self.m_rows[idx] = np.round(self.m_rows[idx], self.decimals)
+
+    def __stop(self, active: np.ndarray, idx: np.ndarray, round_off: bool = True) -> None:
+        """
+        Masks the problems out of the following steps
+        """
+        active[idx] = False
+        if round_off and idx.size:
+            self.__round_off(idx)
+
+    def __generate_initial_feasible_sols(self) -> np.ndarray:
+        """
+        Applies dual simplex steps and fixes the 0-1 pattern until each problem
+        has a feasible solution. Returns the mask of problems with a feasible solution
+        """
+        active = np.ones(self.n_problems, dtype=bool)
+        while active.any():
+            idx = np.flatnonzero(active)
+            is_infeasible = self.__has_negative_rhs(idx)
+            not_feasible = is_infeasible | ~self.__is_canonical(idx)
+            active[idx[~not_feasible]] = False
+            idx, is_infeasible = idx[not_feasible], is_infeasible[not_feasible]
+            if idx.size == 0:
+                break
+
+            at_limit = self.n_iterations[idx] >= self.max_iterations
+            if at_limit.any():
+                self.is_feasible[idx[at_limit]] = False
+                self.is_optimal_reachable[idx[at_limit]] = False
+                self.__stop(active, idx[at_limit])
+                idx, is_infeasible = idx[~at_limit], is_infeasible[~at_limit]
+
+            self.n_iterations[idx] += 1
+            if is_infeasible.any():
+                self.__dual_simplex_step(idx[is_infeasible])
+            not_canonical = ~self.__is_canonical(idx)
+            self.__canonicalize(idx[not_canonical])
+
+            unreachable = idx[~self.is_optimal_reachable[idx]]
+            self.is_feasible[unreachable] = False
+            self.__stop(active, unreachable)
+
+        self.is_feasible &= self.is_optimal_reachable
+        return self.is_optimal_reachable.copy()
+
+    def __basis_hashes(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Hashes the basic variables of the problems
+        """
+        return (self.basic_vars[idx].astype(np.uint64) * self.__basis_weights).sum(axis=1)
+
+    def __select_pivot_cols(self, idx: np.ndarray):
+        """
+        Selects the entering variable of each problem as the most improving
+        column (or the improving column with the smallest index under Bland's
+        rule) having a positive entry to limit it. Returns the 0-based columns,
+        the mask of optimal problems and the mask of unbounded problems
+        """
+        signs = self.signs[idx, None]
+        m_keys = signs * self.m_rows[idx, :-1]
+        constants = signs * self.tableaus[idx, 0, :-1]
+        improving = (m_keys < 0) | ((m_keys == 0) & (constants < 0))
+        is_optimal = ~improving.any(axis=1)
+
+        # improving columns without a limiting row are blocked
+        selectable = improving & (self.tableaus[idx, 1:, :-1] > self.pivot_tolerance).any(axis=1)
+        is_unbounded = ~is_optimal & ~selectable.any(axis=1)
+
+        order = np.lexsort((constants, m_keys), axis=1)
+        bland = self.use_bland[idx, None]
+        order = np.where(bland, np.arange(self.n_cols), order)
+        pivot_cols = np.take_along_axis(order, np.argmax(np.take_along_axis(selectable, order, axis=1), axis=1)[:, None],
+                                        axis=1)[:, 0]
+        return pivot_cols, is_optimal, is_unbounded
+
+    def __select_pivot_rows(self, idx: np.ndarray, pivot_cols: np.ndarray) -> np.ndarray:
+        """
+        Selects the leaving row (1-based) of each problem with the Harris ratio
+        test, breaking ties by the largest pivot element (or the smallest basic
+        variable under Bland's rule)
+        """
+        all_ = np.arange(idx.size)
+        cols = self.tableaus[idx, 1:, pivot_cols]
+        rhs = self.tableaus[idx, 1:, -1]
+        eligible = cols > self.pivot_tolerance
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step_bound = np.where(eligible, (rhs + self.primal_tolerance) / cols, np.inf).min(axis=1)
+            candidates = eligible & (rhs / cols <= step_bound[:, None])
+
+        largest_pivot = np.argmax(np.where(candidates, cols, -np.inf), axis=1)
+        smallest_basic = np.argmin(np.where(candidates, self.basic_vars[idx, 1:], np.iinfo(np.int64).max), axis=1)
+        pivot_rows = np.where(self.use_bland[idx], smallest_basic, largest_pivot)
+        return pivot_rows + 1
+
+    def __optimize(self, active: np.ndarray) -> None:
+        """
+        Applies primal simplex pivots to the problems with feasible solutions
+        until each problem is optimal or cannot be optimized further
+        """
+        # a basis can only repeat within a run of degenerate pivots, as the other
+        # pivots improve the objective value. The hashes of the bases are kept
+        # from the start of the run of each problem
+        history = [self.__basis_hashes(np.arange(self.n_problems))]
+        history_start = 0
+        run_start = np.zeros(self.n_problems, dtype=np.int64)
+
+        while active.any():
+            idx = np.flatnonzero(active)
+            at_limit = self.n_iterations[idx] >= self.max_iterations
+            pivot_cols, is_optimal, is_unbounded = self.__select_pivot_cols(idx)
+            is_optimal &= ~at_limit
+            active[idx[is_optimal]] = False
+
+            stopped = at_limit | (~is_optimal & (is_unbounded | (self.n_constraints == 0)))
+            self.is_optimal_reachable[idx[stopped]] = False
+            self.__stop(active, idx[stopped])
+
+            step = ~(is_optimal | stopped)
+            idx, pivot_cols = idx[step], pivot_cols[step]
+            if idx.size == 0:
+                break
+
+            pivot_rows = self.__select_pivot_rows(idx, pivot_cols)
+            is_degenerate = self.tableaus[idx, pivot_rows, -1] <= self.primal_tolerance
+            self.n_degenerate_pivots[idx[is_degenerate]] += 1
+            failed = self.__pivot(idx, pivot_rows, pivot_cols)
+            self.is_optimal_reachable[idx[failed]] = False
+            self.__stop(active, idx[failed])
+            idx, is_degenerate = idx[~failed], is_degenerate[~failed]
+            self.n_iterations[idx] += 1
+
+            # cycling detection over the current runs of degenerate pivots
+            hashes = np.zeros(self.n_problems, dtype=np.uint64)
+            hashes[idx] = self.__basis_hashes(idx)
+            n_steps = history_start + len(history)
+            run_start[idx[~is_degenerate]] = n_steps
+            degenerate_idx = idx[is_degenerate]
+            is_cycling = np.zeros(degenerate_idx.size, dtype=bool)
+            for t in range(int(run_start[degenerate_idx].min(initial=n_steps)), n_steps):
+                is_cycling |= (history[t - history_start][degenerate_idx] == hashes[degenerate_idx]) & \
+                              (run_start[degenerate_idx] <= t)
+            history.append(hashes)
+
+            cycling_idx = degenerate_idx[is_cycling]
+            self.n_cycles_detected[cycling_idx] += 1
+            switching = cycling_idx[~self.use_bland[cycling_idx]] if self.anti_cycling == 'bland' else cycling_idx[:0]
+            self.use_bland[switching] = True
+            run_start[switching] = n_steps
+            cycling_idx = np.setdiff1d(cycling_idx, switching)
+            self.is_optimal_reachable[cycling_idx] = False
+            self.__stop(active, cycling_idx)
+
+            infeasible = idx[active[idx] & self.__has_negative_rhs(idx)]
+            self.is_feasible[infeasible] = False
+            self.__stop(active, infeasible)
+
+            # dropping the hashes before the runs of all problems
+            if active.any():
+                oldest = int(run_start[active].min())
+                del history[:max(0, oldest - history_start)]
+                history_start = max(history_start, oldest)
+
+    def __check_artificial_basic_vars(self, idx: np.ndarray) -> None:
+        """
+        Marks the optimal problems with artificial basic variables as infeasible
+        """
+        has_artificial = (self.basic_vars[idx] >= self.artificial_start[idx, None]).any(axis=1)
+        infeasible = idx[has_artificial]
+        self.is_feasible[infeasible] = False
+        self.is_optimal_reachable[infeasible] = False
+        self.__round_off(infeasible)
+        self.is_optimal[idx[~has_artificial]] = True
+
+    def __create_problem(self, i: int) -> StandardProblem:
+        """
+        Creates the StandardProblem object of the simplex matrix of problem i
+        """
+        problem = self.problems[i]
+        solution = StandardProblem(
+            matrix=DenseTableau(self.tableaus[i], self.m_rows[i] if self.has_m_row[i] else None),
+            basic_vars=self.basic_vars[i].tolist(),
+            n_decision_vars=problem.n_decision_vars,
+            is_max=problem.is_max,
+            n_artificials=problem.n_artificials,
+            var_name_list=problem.var_name_list.copy()
+        )
+        solution.update_feasible_status(bool(self.is_feasible[i]))
+        solution.update_optimal_reachability_status(bool(self.is_optimal_reachable[i]))
+        solution.update_optimal_status(bool(self.is_optimal[i]))
+        solution.update_pivot_counts(int(self.n_iterations[i]), int(self.n_degenerate_pivots[i]))
+        if self.is_optimal[i]:
+            AlternateSolver(solution)
+        return solution
+
+    def solver(self) -> List[StandardProblem]:
+        """
+        Executing function to solve the batch of LP problems
+
+        Return
+        ------
+        List of StandardProblem objects after optimizing each problem in the
+        order of the given problems. Will contain suboptimal or infeasible
+        StandardProblem objects for the problems that cannot be optimized.
+        """
+
+        active = self.__generate_initial_feasible_sols()
+        self.__optimize(active.copy())
+        optimal = np.flatnonzero(active & self.is_optimal_reachable & self.is_feasible)
+        self.__check_artificial_basic_vars(optimal)
+        return [self.__create_problem(i) for i in range(self.n_problems)]
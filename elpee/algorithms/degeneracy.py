@@ -0,0 +1,84 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Tuple
+
+import numpy as np
+from sympy import Basic, Symbol, expand
+
+from elpee.utils.bigm import M_COEFF_TOLERANCE
+from elpee.utils.protocols.st_problem import StandardProblem
+
+M = Symbol('M')
+
+def perturb_rhs(problem: StandardProblem, perturbation: float,
+                rng: np.random.Generator = None) -> Tuple[List[int], np.ndarray]:
+    """
+    Adds a bounded random perturbation to the solution values of the constraint
+    rows so that no solution value stays at zero. Each row `i` is shifted by a
+    value drawn uniformly from `(0, perturbation * (1 + |b_i|)]`
+
+    The problem is expected to be in the canonical form. The columns of the current
+    basic variables then record how the perturbation is carried through the
+    following pivots, which is used by `remove_rhs_perturbation`
+
+    Parameters
+    ----------
+    problem : `elpee.StandardProblem`
+        canonical problem to be perturbed in place
+    perturbation : `float`
+        relative bound of the perturbation
+    rng : `numpy.random.Generator` (default : `None`)
+        random generator used to draw the perturbation
+
+    Return
+    ------
+    Tuple of the basic variables at the time of the perturbation and the
+    perturbation added to each constraint row
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    reference_vars = problem.basic_vars[1:].copy()
+    if problem.tableau is not None:
+        rhs = problem.tableau.rhs
+        deltas = perturbation * (1 + np.abs(rhs)) * (1 - rng.random(len(rhs)))
+        rhs += deltas
+    else:
+        matrix = problem.matrix
+        rhs = np.array([row[-1] for row in matrix[1:]], dtype=np.float64)
+        deltas = perturbation * (1 + np.abs(rhs)) * (1 - rng.random(len(rhs)))
+        for row, delta in zip(matrix[1:], deltas.tolist()):
+            row[-1] = row[-1] + delta
+    return reference_vars, deltas
+
+def remove_rhs_perturbation(problem: StandardProblem, reference_vars: List[int], deltas: np.ndarray) -> None:
+    """
+    Removes the perturbation added by `perturb_rhs` from the solution column
+    (including the objective value) of the current basis. The columns of the
+    `reference_vars` hold the accumulated row operations applied since the
+    perturbation, so the perturbation carried to each row is the combination
+    of those columns weighted by `deltas`
+    """
+    if problem.tableau is not None:
+        tableau = problem.tableau
+        cols = [var-1 for var in reference_vars]
+        shift = np.zeros(len(tableau.rhs))
+        for var, delta in zip(reference_vars, deltas):
+            shift += delta * tableau.column(var)
+        tableau.rhs[:] = tableau.rhs - shift
+        tableau.objective[-1] -= tableau.objective[cols] @ deltas
+        if tableau.m_row is not None:
+            tableau.m_row[-1] -= tableau.m_row[cols] @ deltas
+            tableau._clean_m_row()
+        return
+
+    matrix = problem.matrix
+    for row in matrix:
+        value = row[-1] - sum(row[var-1] * delta for var, delta in zip(reference_vars, deltas.tolist()))
+        if isinstance(value, Basic):
+            value = expand(value)
+            if abs(float(value.coeff(M))) <= M_COEFF_TOLERANCE:
+                # big M terms cancelled out up to round off residues
+                value = float(value.subs(M, 0))
+        row[-1] = value
@@ -1,73 +1,45 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List
-
-import sympy
+import numpy as np
+from elpee.utils.events import EventSink, get_event_sink
 from elpee.utils.protocols.st_problem import StandardProblem
-
-M = 1000000
+from elpee.utils.ratio_test import DUAL_TOLERANCE, PIVOT_TOLERANCE, PRIMAL_TOLERANCE, select_entering_col_dual
 
 class DualSimplexSolver():
     """
     Class Description of Dual Simplex Solving Algorithm
     Used when the solution column of the matrix has negative values
+
+    The entering variable is selected with the dual Harris ratio test over the
+    negative entries of the pivot row
     """
-    def __init__(self, problem: StandardProblem):
+    def __init__(self, problem: StandardProblem, primal_tolerance: float = PRIMAL_TOLERANCE, 
+                 dual_tolerance: float = DUAL_TOLERANCE, pivot_tolerance: float = PIVOT_TOLERANCE,
+                 events: EventSink = None):
         self.problem = problem
-
-    def __select_pivot_col_dual_simplex(self, ratio_row:List, blocked_cols:List):
-        """
-        Selects the pivot column based on ratio row and not in blocked list
-        """
-        sorted_idx = sorted(range(len(ratio_row)), key=lambda k: ratio_row[k])
-        for n in sorted_idx:
-            pivot_col_var = n + 1
-            if pivot_col_var not in blocked_cols:
-                return pivot_col_var
-        print("\nNo suitable pivot column - Choosing another pivot row")
-        return -1
+        self.events = get_event_sink(events)
+        self.primal_tolerance = primal_tolerance
+        self.dual_tolerance = dual_tolerance
+        self.pivot_tolerance = pivot_tolerance
 
     def __select_pivot_row_dual_simplex(self, blocked_rows):
         """
         Selects the appropriate pivot row that has a negative solution value and not in blocked list
         """
-        sol_col = []
-        neg_sol = 0
-        for i, row in enumerate(self.problem.matrix):
-            if i !=0:
-                sol_col.append(row[-1])
-                if row[-1] < 0:
-                    neg_sol += 1
-        sorted_idx = sorted(range(len(sol_col)), key=lambda k: sol_col[k])
+        if self.problem.tableau is not None:
+            sol_col = self.problem.tableau.rhs
+        else:
+            sol_col = np.array([row[-1] for row in self.problem.matrix[1:]], dtype=np.float64)
 
-        for i in range(neg_sol):
-            if sorted_idx[i]+1 not in blocked_rows:
-                return sorted_idx[i]+1
-        print("\nNo suitable pivot row - Cannot make feasible solution")
+        # rows with negative solution values from the most negative value
+        neg_rows = np.flatnonzero(sol_col < -self.primal_tolerance)
+        for i in neg_rows[np.argsort(sol_col[neg_rows], kind='stable')]:
+            if int(i)+1 not in blocked_rows:
+                return int(i)+1
+        self.events.emit("no_pivot_row", "No suitable pivot row - Cannot make feasible solution")
         return -1
     
-    def __create_ratio_row(self, pivot_row:int, pivot_row_var:int):
-        """
-        Creates the ratio row given the selected pivot row as 
-            absolute value of (objective_row / pivot row)
-        Marks 0 and infinity ratios as M
-        """
-        obj_row = self.problem.obj_row
-        ratio_row = [0]*len(obj_row)
-        for i in range(len(obj_row)):
-            if self.problem.matrix[pivot_row][i] == 0:
-                ratio_row[i] = M
-            elif obj_row[i] == 0:
-                ratio_row[i] = M
-            else:
-                ratio_row[i] = abs(obj_row[i] / self.problem.matrix[pivot_row][i])
-        ratio_row[pivot_row_var-1] = M
-
-        ratio_row = [M if isinstance(item, sympy.Basic) else item for item in ratio_row]
-
-        return ratio_row
-    
     def __set_infeasible_status(self):
         self.problem.update_feasible_status(False)
         self.problem.update_optimal_reachability_status(False)
@@ -79,34 +51,23 @@ class DualSimplexSolver():
         """
         blocked_rows = []
         n_rows = self.problem.n_constraints + 1
-        n_cols = len(self.problem.obj_row)
         while len(blocked_rows) < n_rows:
             pivot_row = self.__select_pivot_row_dual_simplex(blocked_rows)
             if pivot_row == -1:
                 # print("\nNo further feasible solution")
                 self.__set_infeasible_status()
                 return self.problem
-            pivot_row_var = self.problem.basic_vars[pivot_row]
 
-            blocked_cols = []
+            pivot_col_var, no_negative_entries = select_entering_col_dual(
+                self.problem, pivot_row, self.dual_tolerance, self.pivot_tolerance)
+            if no_negative_entries:
+                self.events.emit("no_pivot_col", "No suitable pivot column - Choosing another pivot row")
+                blocked_rows.append(pivot_row)
+                continue
 
-            ratio_row = self.__create_ratio_row(pivot_row, pivot_row_var)
-            
-            j = 1
-            while (j <= n_cols) & (sorted(ratio_row)[j-1] != M): 
-                pivot_col_var = self.__select_pivot_col_dual_simplex(ratio_row, blocked_cols)
-                if pivot_col_var != -1:
-                    pivot_cell = self.problem.matrix[pivot_row][pivot_col_var-1]
-                    if pivot_cell > 0:
-                        blocked_cols.append(pivot_col_var)
-                        j += 1
-                    else:
-                        self.problem.basic_vars[pivot_row] = pivot_col_var
-                        self.problem.update_feasible_status(True)
-                        return self.problem
-                else:
-                    continue
-            blocked_rows.append(pivot_row)
+            self.problem.pivot(pivot_row, pivot_col_var)
+            self.problem.update_feasible_status(True)
+            return self.problem
         # print("\nNo further feasible solution")
         self.__set_infeasible_status()
         return self.problem
@@ -0,0 +1,289 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABC, abstractmethod
+from typing import List, Literal, Union
+
+import numpy as np
+
+from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.protocols.tableau import split_big_m_row
+from elpee.utils.utilities import select_pivot_col
+
+def get_n_cols(problem: StandardProblem) -> int:
+    """
+    Obtains the number of variable columns (excluding the solution column) of the problem
+    """
+    if problem.tableau is not None:
+        return problem.tableau.n_cols
+    return len(problem.matrix[0]) - 1
+
+def get_reduced_cost_keys(problem: StandardProblem, cols: np.ndarray = None):
+    """
+    Obtains the (M coefficient, constant) keys of the objective row of the problem
+    signed such that negative keys indicate improving columns. Only the keys of
+    the 0-based columns `cols` are obtained if given
+    """
+    if problem.tableau is not None:
+        return problem.tableau.reduced_cost_keys(problem.is_max, cols)
+    obj_row = problem.matrix[0]
+    if cols is not None:
+        obj_row = [obj_row[col] for col in cols]
+    else:
+        obj_row = obj_row[:-1]
+    constants, m_coeffs = split_big_m_row(obj_row)
+    sign = 1 if problem.is_max else -1
+    return sign * np.array(m_coeffs, dtype=np.float64), sign * np.array(constants, dtype=np.float64)
+
+def get_candidate_keys(problem: StandardProblem, blocked_cols: List[int], cols: np.ndarray = None):
+    """
+    Obtains the improving columns that are not blocked along with their reduced
+    cost. If any improving column has a big M coefficient only those columns are
+    considered with the M coefficient as the reduced cost. Only the 0-based
+    columns `cols` are priced if given
+
+    Return
+    ------
+    Tuple of 0-based column indexes and reduced costs of the candidate columns
+    """
+    m_keys, constants = get_reduced_cost_keys(problem, cols)
+    blocked = [col_var-1 for col_var in blocked_cols]
+    allowed = np.ones(len(constants), dtype=bool)
+    if cols is None:
+        allowed[blocked] = False
+    elif blocked:
+        allowed &= ~np.isin(cols, blocked)
+
+    candidates = np.flatnonzero(allowed & (m_keys < 0))
+    costs = m_keys[candidates]
+    if candidates.size == 0:
+        candidates = np.flatnonzero(allowed & (m_keys == 0) & (constants < 0))
+        costs = constants[candidates]
+    if cols is not None:
+        candidates = cols[candidates]
+    return candidates, costs
+
+class PricingRule(ABC):
+    """
+    An abstract class for the pricing rules used to select the entering
+    variable (pivot column) of the simplex method
+
+    Methods
+    -------
+    select_pivot_col(problem, blocked_cols) -> int
+        Selects the pivot column that is not blocked. Returns -1 if there is no
+        such column
+    before_pivot(problem, pivot_row, pivot_col_var) -> None
+        Updates the state of the pricing rule with the pivot about to be applied
+    """
+
+    @abstractmethod
+    def select_pivot_col(self, problem: StandardProblem, blocked_cols: List[int]) -> int:
+        """
+        Selects the pivot column (1-based) that is not blocked. Returns -1 if
+        there is no such column
+        """
+
+    def before_pivot(self, problem: StandardProblem, pivot_row: int, pivot_col_var: int) -> None:
+        """
+        Updates the state of the pricing rule with the pivot about to be applied
+        """
+
+class DantzigPricing(PricingRule):
+    """
+    Pricing rule selecting the column with the largest improving coefficient
+    in the objective row
+    """
+
+    def select_pivot_col(self, problem: StandardProblem, blocked_cols: List[int]) -> int:
+        if problem.tableau is not None:
+            return problem.tableau.select_pivot_col(problem.is_max, blocked_cols)
+        return select_pivot_col(problem.obj_row, problem.is_max, blocked_cols)
+
+class PartialPricing(PricingRule):
+    """
+    Pricing rule scanning the columns in blocks. Only the reduced costs of the
+    scanned block are computed, moving to the next block when the block has no
+    improving column. The column with the largest improving coefficient of the
+    first block having an improving column is selected and the next scan starts
+    from the following block
+
+    Attributes
+    ----------
+    block_size : `int` | `None`
+        number of columns in a block. Uses the square root of the number of
+        columns (at least 10) if `None`
+    """
+
+    def __init__(self, block_size: int = None):
+        if (block_size is not None) and (block_size < 1):
+            raise ValueError(f"Block size must be a positive integer. Received {block_size}.")
+        self.block_size = block_size
+        self._start = 0
+
+    def _get_block_size(self, n_cols: int) -> int:
+        if self.block_size is not None:
+            return self.block_size
+        return max(10, int(np.sqrt(n_cols)))
+
+    def _scan_blocks(self, problem: StandardProblem, blocked_cols: List[int]):
+        """
+        Scans the blocks from the last position until a block has candidate
+        columns. Returns the candidate columns and their reduced costs
+        """
+        n_cols = get_n_cols(problem)
+        block_size = self._get_block_size(n_cols)
+        n_blocks = -(-n_cols // block_size)
+        for i in range(n_blocks):
+            block = (self._start + i) % n_blocks
+            cols = np.arange(block * block_size, min((block + 1) * block_size, n_cols))
+            candidates, costs = get_candidate_keys(problem, blocked_cols, cols)
+            if candidates.size:
+                self._start = (block + 1) % n_blocks
+                return candidates, costs
+        return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    def select_pivot_col(self, problem: StandardProblem, blocked_cols: List[int]) -> int:
+        candidates, costs = self._scan_blocks(problem, blocked_cols)
+        if candidates.size == 0:
+            return -1
+        return int(candidates[np.argmin(costs)]) + 1
+
+class MultiplePricing(PartialPricing):
+    """
+    Partial pricing rule retaining the best `n_candidates` columns of the
+    scanned block. Following iterations select from the retained columns
+    that are still improving before scanning the next block
+
+    Attributes
+    ----------
+    n_candidates : `int`
+        number of columns retained from a scanned block
+    block_size : `int` | `None`
+        number of columns in a block
+    """
+
+    def __init__(self, n_candidates: int = 5, block_size: int = None):
+        super().__init__(block_size)
+        if n_candidates < 1:
+            raise ValueError(f"Number of candidates must be a positive integer. Received {n_candidates}.")
+        self.n_candidates = n_candidates
+        self.__retained = np.zeros(0, dtype=np.int64)
+
+    def select_pivot_col(self, problem: StandardProblem, blocked_cols: List[int]) -> int:
+        candidates, costs = np.zeros(0, dtype=np.int64), np.zeros(0)
+        if self.__retained.size:
+            # only the retained columns are priced again
+            candidates, costs = get_candidate_keys(problem, blocked_cols, self.__retained)
+        if candidates.size == 0:
+            candidates, costs = self._scan_blocks(problem, blocked_cols)
+            if candidates.size == 0:
+                return -1
+            order = np.argsort(costs, kind='stable')[:self.n_candidates]
+            candidates, costs = candidates[order], costs[order]
+            self.__retained = candidates
+
+        pivot_col = int(candidates[np.argmin(costs)])
+        self.__retained = self.__retained[self.__retained != pivot_col]
+        return pivot_col + 1
+
+class DevexPricing(PricingRule):
+    """
+    Pricing rule selecting the column with the largest squared reduced cost
+    relative to approximate reference weights of the steepest edge. Weights
+    start at 1 and are updated with each pivot
+    """
+
+    def __init__(self):
+        self.weights = None
+
+    def __get_weights(self, n_cols: int) -> np.ndarray:
+        if (self.weights is None) or (len(self.weights) != n_cols):
+            self.weights = np.ones(n_cols)
+        return self.weights
+
+    def select_pivot_col(self, problem: StandardProblem, blocked_cols: List[int]) -> int:
+        candidates, costs = get_candidate_keys(problem, blocked_cols)
+        if candidates.size == 0:
+            return -1
+        weights = self.__get_weights(len(problem.obj_row))
+        return int(candidates[np.argmax(costs**2 / weights[candidates])]) + 1
+
+    def before_pivot(self, problem: StandardProblem, pivot_row: int, pivot_col_var: int) -> None:
+        if problem.tableau is not None:
+            row = np.array(problem.tableau.row(pivot_row))
+        else:
+            row = np.array(problem.matrix[pivot_row][:-1], dtype=np.float64)
+
+        weights = self.__get_weights(len(row))
+        pivot_cell = row[pivot_col_var-1]
+        pivot_weight = weights[pivot_col_var-1]
+
+        np.maximum(weights, (row / pivot_cell)**2 * pivot_weight, out=weights)
+        leaving_col = problem.basic_vars[pivot_row] - 1
+        weights[leaving_col] = max(pivot_weight / pivot_cell**2, 1)
+
+class SteepestEdgePricing(PricingRule):
+    """
+    Pricing rule selecting the column with the largest squared reduced cost
+    relative to the squared norm of the edge direction `1 + ||column||^2`.
+
+    This is exact steepest edge: the norms are not kept as reference weights
+    updated with each pivot, they are computed from the current simplex matrix
+    for the improving columns at each iteration. Computing the norms costs up to
+    a pass over the simplex matrix (about as much as a pivot) when most columns
+    are improving. Use `DevexPricing` for the approximate weights updated with
+    each pivot
+    """
+
+    def select_pivot_col(self, problem: StandardProblem, blocked_cols: List[int]) -> int:
+        candidates, costs = get_candidate_keys(problem, blocked_cols)
+        if candidates.size == 0:
+            return -1
+        if problem.tableau is not None:
+            norms = problem.tableau.col_norms(candidates)
+        else:
+            constraints = np.array([[row[col] for col in candidates] for row in problem.matrix[1:]],
+                                   dtype=np.float64)
+            norms = (constraints**2).sum(axis=0) if constraints.size else np.zeros(candidates.size)
+        return int(candidates[np.argmax(costs**2 / (1 + norms))]) + 1
+
+class BlandPricing(PricingRule):
+    """
+    Pricing rule selecting the improving column with the smallest index
+    (Bland's rule). Together with the smallest basic variable among the tied
+    leaving rows the simplex method cannot cycle
+    """
+
+    def select_pivot_col(self, problem: StandardProblem, blocked_cols: List[int]) -> int:
+        m_keys, constants = get_reduced_cost_keys(problem)
+        improving = (m_keys < 0) | ((m_keys == 0) & (constants < 0))
+        improving[[col_var-1 for col_var in blocked_cols]] = False
+        candidates = np.flatnonzero(improving)
+        if candidates.size == 0:
+            return -1
+        return int(candidates[0]) + 1
+
+PRICING_RULES = {
+    'dantzig': DantzigPricing,
+    'partial': PartialPricing,
+    'multiple': MultiplePricing,
+    'devex': DevexPricing,
+    'steepest-edge': SteepestEdgePricing,
+    'bland': BlandPricing
+}
+
+def get_pricing_rule(pricing: Union[Literal['dantzig', 'partial', 'multiple', 'devex', 'steepest-edge', 'bland'], PricingRule]) -> PricingRule:
+    """
+    Obtains the pricing rule for the given name. Instances of `PricingRule` are returned as is
+
+    Parameters
+    ----------
+    pricing : `str` | `PricingRule` (Options : ["dantzig","partial","multiple","devex","steepest-edge","bland"])
+        Name of the pricing rule or a pricing rule instance
+    """
+    if isinstance(pricing, PricingRule):
+        return pricing
+    if pricing not in PRICING_RULES:
+        raise ValueError(f"{pricing} is an invalid argument for pricing parameter.")
+    return PRICING_RULES[pricing]()
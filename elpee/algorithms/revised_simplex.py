@@ -0,0 +1,463 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Union
+
+import numpy as np
+
+from elpee.utils.events import NULL_SINK, EventsOption, get_event_sink
+from elpee.utils.printer import SimplexPrinter
+from elpee.utils.settings import Settings, get_settings
+from elpee.utils.protocols.lp_problem import LinearProblem
+from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.protocols.sparse_tableau import SparseTableau
+from elpee.utils.protocols.tableau import DenseTableau
+from elpee.utils.bigm import M_COEFF_TOLERANCE
+
+class BasisFactorization():
+    """
+    A class to maintain the inverse of the basis matrix as an LU factorization
+    with partial pivoting followed by a file of product form eta updates
+
+    Attributes
+    ----------
+    refactor_frequency : int
+        Number of eta updates allowed before the basis is factorized again
+
+    Methods
+    -------
+    factorize(basis_matrix)
+        Computes a fresh LU factorization of the basis matrix
+    ftran(vector) -> numpy.ndarray
+        Solves B x = vector
+    btran(vector) -> numpy.ndarray
+        Solves B^T y = vector
+    update(pivot_row, alpha) -> bool
+        Appends an eta update for the basis change. Returns True when the
+        basis has to be factorized again
+    """
+
+    def __init__(self, refactor_frequency: int = 50, pivot_tolerance: float = 1e-11):
+        self.refactor_frequency = refactor_frequency
+        self.pivot_tolerance = pivot_tolerance
+        self.lu = None
+        self.perm = None
+        self.etas = []
+
+    def factorize(self, basis_matrix: np.ndarray) -> None:
+        """
+        Computes the LU factorization P B = L U of the basis matrix
+        """
+        lu = np.array(basis_matrix, dtype=np.float64)
+        n = lu.shape[0]
+        perm = np.arange(n)
+
+        for k in range(n):
+            pivot_idx = k + int(np.argmax(np.abs(lu[k:, k])))
+            if abs(lu[pivot_idx, k]) <= self.pivot_tolerance:
+                raise np.linalg.LinAlgError("Basis matrix is singular")
+            if pivot_idx != k:
+                lu[[k, pivot_idx]] = lu[[pivot_idx, k]]
+                perm[[k, pivot_idx]] = perm[[pivot_idx, k]]
+            lu[k+1:, k] /= lu[k, k]
+            lu[k+1:, k+1:] -= np.outer(lu[k+1:, k], lu[k, k+1:])
+
+        self.lu = lu
+        self.perm = perm
+        self.etas = []
+
+    def __lu_solve(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Solves B x = vector using the LU factors
+        """
+        lu = self.lu
+        x = vector[self.perm].astype(np.float64)
+        n = lu.shape[0]
+        # forward substitution with the unit lower triangular factor
+        for i in range(1, n):
+            x[i] -= lu[i, :i] @ x[:i]
+        # backward substitution with the upper triangular factor
+        for i in range(n-1, -1, -1):
+            x[i] = (x[i] - lu[i, i+1:] @ x[i+1:]) / lu[i, i]
+        return x
+
+    def __lu_solve_transposed(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Solves B^T y = vector using the LU factors
+        """
+        lu = self.lu
+        w = vector.astype(np.float64)
+        n = lu.shape[0]
+        # forward substitution with U^T
+        for i in range(n):
+            w[i] = (w[i] - lu[:i, i] @ w[:i]) / lu[i, i]
+        # backward substitution with the unit upper triangular L^T
+        for i in range(n-2, -1, -1):
+            w[i] -= lu[i+1:, i] @ w[i+1:]
+        y = np.empty_like(w)
+        y[self.perm] = w
+        return y
+
+    def ftran(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Forward transformation. Solves B x = vector for the current basis
+        """
+        x = self.__lu_solve(vector)
+        for pivot_row, alpha in self.etas:
+            x_r = x[pivot_row] / alpha[pivot_row]
+            x -= np.multiply.outer(alpha, x_r) if x.ndim > 1 else alpha * x_r
+            x[pivot_row] = x_r
+        return x
+
+    def btran(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Backward transformation. Solves B^T y = vector for the current basis
+        """
+        y = vector.astype(np.float64)
+        for pivot_row, alpha in reversed(self.etas):
+            others = alpha.copy()
+            others[pivot_row] = 0
+            y[pivot_row] = (y[pivot_row] - others @ y) / alpha[pivot_row]
+        return self.__lu_solve_transposed(y)
+
+    def update(self, pivot_row: int, alpha: np.ndarray) -> bool:
+        """
+        Appends the eta update for replacing the basic variable at `pivot_row`
+        with the column whose transformed values are `alpha`
+        """
+        self.etas.append((pivot_row, alpha.copy()))
+        return len(self.etas) >= self.refactor_frequency
+
+
+class RevisedSimplexSolver():
+    """
+    A class used to solve problems using the Revised Simplex Method
+
+    Only the original constraint data and a factorization of the basis
+    are kept. Reduced costs and the entering column are computed on demand
+    instead of updating the full simplex matrix at each iteration.
+
+    Attributes
+    ----------
+    problem : elpee.StandardProblem
+        The problem given to the RevisedSimplexSolver to be solved
+    is_max : bool
+        Whether given LP problem is a maximization or
+        minimization problem
+    n_constraints : int
+        Number of constraints in given LP problem
+    n_cols : int
+        Number of variables present in the simplex table of
+        the LP problem
+    n_iterations : int
+        Number of basis changes applied to reach the solution
+    n_degenerate_pivots : int
+        Number of basis changes on a zero basic variable value
+    factorization : elpee.algorithms.revised_simplex.BasisFactorization
+        LU factorization of the current basis with eta updates
+    max_iterations : int
+        Limit on the number of basis changes
+    events : elpee.utils.events.EventSink
+        Sink receiving the messages of the solve
+
+    Methods
+    -------
+    solver() -> elpee.StandardProblem
+        Solves the Standardized LP problem given to RevisedSimplexSolver instance
+    """
+
+    def __init__(self, problem: Union[StandardProblem, LinearProblem], refactor_frequency: int = 50,
+                 tolerance: float = 1e-9, max_iterations: int = None, settings: Settings = None):
+        """
+        Parameters
+        ----------
+        problem : elpee.StandardProblem
+            LP problem to be solved using Revised Simplex Method
+        refactor_frequency : int (default : 50)
+            Number of eta updates before the basis is factorized again
+        tolerance : float (default : 1e-9)
+            Tolerance used for the feasibility, optimality and pivot checks
+        max_iterations : int (default : None)
+            Limit on the number of basis changes. Defaults to 50 times the
+            size of the simplex table
+        settings : elpee.utils.settings.Settings (default : None)
+            Settings giving the decimals and cell width of the displayed solution.
+            Uses the current settings if None
+        """
+
+        if isinstance(problem, LinearProblem):
+            problem = problem.standardize_problem()
+
+        self.problem = problem
+        self.is_max = problem.is_max
+        self.tolerance = tolerance
+        self.settings = settings if settings is not None else get_settings()
+        self.n_iterations = 0
+        self.n_degenerate_pivots = 0
+        self.factorization = BasisFactorization(refactor_frequency)
+
+        if isinstance(problem.tableau, SparseTableau):
+            tableau = problem.tableau.to_dense()
+        elif problem.tableau is not None:
+            tableau = problem.tableau.copy()
+        else:
+            tableau = DenseTableau(problem.matrix)
+        array = tableau.array
+
+        self.n_constraints = array.shape[0] - 1
+        self.n_cols = array.shape[1] - 1
+        self.max_iterations = max_iterations if max_iterations is not None else \
+            50 * (self.n_constraints + self.n_cols)
+
+        # original constraint data
+        self.A = array[1:, :-1]
+        self.b = array[1:, -1]
+
+        # objective row as (constant, M coefficient) planes
+        m_row = tableau.m_row if tableau.m_row is not None else np.zeros(self.n_cols + 1)
+        self.obj_planes = np.stack([array[0, :-1], m_row[:-1]], axis=1)
+        self.obj_value_planes = np.array([array[0, -1], m_row[-1]])
+        self.uses_big_m = tableau.m_row is not None
+
+        self.basis = [var - 1 for var in problem.basic_vars[1:]]
+        self.x_B = None
+
+        self.simplex_printer = SimplexPrinter(settings=self.settings)
+        self.events = NULL_SINK
+
+    def __refactorize(self) -> None:
+        """
+        Factorizes the basis from the original constraint columns and
+        recomputes the values of the basic variables
+        """
+        self.factorization.factorize(self.A[:, self.basis])
+        self.x_B = self.factorization.ftran(self.b)
+
+    def __reduced_costs(self) -> np.ndarray:
+        """
+        Pricing pass computing the objective row of the current simplex table
+        as (constant, M coefficient) planes for all columns
+        """
+        basic_costs = self.obj_planes[self.basis]
+        duals = self.factorization.btran(basic_costs)
+        reduced_costs = self.obj_planes - self.A.T @ duals
+        reduced_costs[np.abs(reduced_costs) <= self.tolerance] = 0
+        reduced_costs[self.basis] = 0
+        return reduced_costs
+
+    def __select_entering_col(self, reduced_costs: np.ndarray, blocked_cols: List[int]) -> int:
+        """
+        Selects the column with the most improving reduced cost compared
+        lexicographically by the M coefficient first. Returns -1 when optimal
+        """
+        sign = 1 if self.is_max else -1
+        constants = sign * reduced_costs[:, 0]
+        m_keys = sign * reduced_costs[:, 1]
+        if not self.uses_big_m:
+            m_keys = np.zeros_like(constants)
+
+        improving = (m_keys < 0) | ((m_keys == 0) & (constants < 0))
+        improving[blocked_cols] = False
+        if not improving.any():
+            return -1
+
+        candidates = np.flatnonzero(improving)
+        order = np.lexsort((constants[candidates], m_keys[candidates]))
+        return int(candidates[order[0]])
+
+    def __select_leaving_row(self, alpha: np.ndarray) -> int:
+        """
+        Minimum ratio test over the rows with a positive entry in the
+        entering column. Returns -1 when no row qualifies
+        """
+        eligible = alpha > self.tolerance
+        if not eligible.any():
+            return -1
+        ratios = np.full(alpha.shape, np.inf)
+        ratios[eligible] = np.maximum(self.x_B[eligible], 0) / alpha[eligible]
+        return int(np.argmin(ratios))
+
+    def __change_basis(self, pivot_row: int, entering_col: int, alpha: np.ndarray) -> None:
+        """
+        Replaces the basic variable at `pivot_row` with the entering column
+        """
+        if abs(self.x_B[pivot_row]) <= self.tolerance:
+            self.n_degenerate_pivots += 1
+        theta = self.x_B[pivot_row] / alpha[pivot_row]
+        self.x_B -= theta * alpha
+        self.x_B[pivot_row] = theta
+        self.basis[pivot_row] = entering_col
+        self.n_iterations += 1
+
+        if self.factorization.update(pivot_row, alpha):
+            self.__refactorize()
+
+    def __dual_phase(self) -> bool:
+        """
+        Dual simplex adjustments for basic variables with negative values
+        Returns False if no feasible solution can be obtained
+        """
+        while (self.x_B < -self.tolerance).any():
+            if self.n_iterations >= self.max_iterations:
+                return False
+
+            blocked_rows = []
+            while True:
+                candidates = np.flatnonzero(self.x_B < -self.tolerance)
+                candidates = [row for row in candidates if row not in blocked_rows]
+                if not candidates:
+                    self.events.emit("no_pivot_row", "No suitable pivot row - Cannot make feasible solution")
+                    return False
+                pivot_row = min(candidates, key=lambda row: self.x_B[row])
+
+                unit_row = np.zeros(self.n_constraints)
+                unit_row[pivot_row] = 1
+                row_alpha = self.A.T @ self.factorization.btran(unit_row)
+                row_alpha[self.basis] = 0
+
+                eligible = np.flatnonzero(row_alpha < -self.tolerance)
+                if eligible.size == 0:
+                    blocked_rows.append(pivot_row)
+                    continue
+
+                reduced_costs = self.__reduced_costs()
+                ratios = np.abs(reduced_costs[eligible, 1 if self.uses_big_m else 0] / row_alpha[eligible])
+                if self.uses_big_m:
+                    constants = np.abs(reduced_costs[eligible, 0] / row_alpha[eligible])
+                    entering_col = int(eligible[np.lexsort((constants, ratios))[0]])
+                else:
+                    entering_col = int(eligible[np.argmin(ratios)])
+                break
+
+            alpha = self.factorization.ftran(self.A[:, entering_col])
+            self.__change_basis(pivot_row, entering_col, alpha)
+        return True
+
+    def __primal_phase(self) -> bool:
+        """
+        Primal simplex iterations until the optimal solution is reached
+        Returns False if the problem cannot be optimized further
+        """
+        while self.n_iterations < self.max_iterations:
+            reduced_costs = self.__reduced_costs()
+            blocked_cols = []
+            while True:
+                entering_col = self.__select_entering_col(reduced_costs, blocked_cols)
+                if entering_col == -1:
+                    # optimal when nothing was blocked, else unbounded in all improving columns
+                    return len(blocked_cols) == 0
+                alpha = self.factorization.ftran(self.A[:, entering_col])
+                pivot_row = self.__select_leaving_row(alpha)
+                if pivot_row != -1:
+                    break
+                blocked_cols.append(entering_col)
+            self.__change_basis(pivot_row, entering_col, alpha)
+        return False
+
+    def __build_problem(self) -> StandardProblem:
+        """
+        Builds the StandardProblem of the simplex table for the current basis
+        """
+        constraint_rows = self.factorization.ftran(np.column_stack([self.A, self.b]))
+        reduced_costs = self.__reduced_costs()
+        duals = self.factorization.btran(self.obj_planes[self.basis])
+        obj_values = self.obj_value_planes - self.b @ duals
+
+        array = np.empty((self.n_constraints + 1, self.n_cols + 1))
+        array[0, :-1] = reduced_costs[:, 0]
+        array[0, -1] = obj_values[0]
+        array[1:] = constraint_rows
+
+        m_row = None
+        if self.uses_big_m:
+            m_row = np.append(reduced_costs[:, 1], obj_values[1])
+            m_row[np.abs(m_row) <= M_COEFF_TOLERANCE] = 0
+
+        tableau = DenseTableau(array, m_row)
+        if isinstance(self.problem.tableau, SparseTableau):
+            matrix = SparseTableau.from_dense(tableau)
+        elif self.problem.tableau is not None:
+            matrix = tableau
+        else:
+            matrix = tableau.to_list()
+        solution = StandardProblem(
+            matrix=matrix,
+            basic_vars=[0] + [col + 1 for col in self.basis],
+            n_decision_vars=self.problem.n_decision_vars,
+            is_max=self.is_max,
+            n_artificials=self.problem.n_artificials,
+            var_name_list=self.problem.var_name_list
+        )
+        solution.update_pivot_counts(self.n_iterations, self.n_degenerate_pivots)
+        return solution
+
+    def __has_positive_artificials(self, problem: StandardProblem) -> bool:
+        """
+        Checks if artificial variables remain basic with positive values. Artificial
+        variables basic at zero (common with equality constraints) do not make the
+        solution infeasible
+        """
+        artificials_start = problem.n_decision_vars + problem.n_slack_vars
+        return any((col >= artificials_start) and (self.x_B[row] > self.tolerance)
+                   for row, col in enumerate(self.basis))
+
+    def __set_infeasible_status(self, problem: StandardProblem) -> None:
+        """
+        Function to update the status attributes of the StandardProblem object
+        when the problem is infeasible to be solved
+        """
+        problem.update_feasible_status(False)
+        problem.update_optimal_reachability_status(False)
+        problem.update_optimal_status(False)
+
+    def solver(self, show_steps: bool = True, show_interpret: bool = True, events: EventsOption = None) -> StandardProblem:
+        """
+        Executing function to solve the linear programming problems using
+        the revised simplex method
+
+        Parameters
+        ---------
+        show_steps : `bool` (default : `True`)
+            Display the final simplex matrix
+        show_interpret : `bool` (default : `True`)
+            Display the interpretation of the final solution
+        events : `elpee.utils.events.EventSink` | `logging.Logger` | Callable (default : `None`)
+            Sink receiving the messages of the solve, a logger or a function called 
+            with each `SolverEvent`. If `None`, the messages are printed when the 
+            final solution is displayed and ignored otherwise
+
+        Return
+        ------
+        StandardProblem object of the simplex table for the final basis.
+        Will return a suboptimal or infeasible StandardProblem object if
+        the problem cannot be optimized.
+        """
+
+        self.simplex_printer = SimplexPrinter(show_steps, show_interpret, self.settings)
+        self.events = get_event_sink(events, verbose=(show_steps or show_interpret))
+        self.__refactorize()
+
+        is_feasible = self.__dual_phase()
+        is_optimal = is_feasible and self.__primal_phase()
+
+        solution = self.__build_problem()
+        self.problem = solution
+
+        if not is_feasible:
+            self.__set_infeasible_status(solution)
+            self.events.emit("infeasible", "No feasible solution found")
+        elif not is_optimal:
+            solution.update_optimal_reachability_status(False)
+            self.events.emit("not_optimizable", "Cannot be optimized further")
+        elif self.__has_positive_artificials(solution):
+            self.__set_infeasible_status(solution)
+            self.events.emit("infeasible", "Artificial variables found in optimal soltion.\nProblem is infeasible.")
+        else:
+            solution.update_optimal_status(True)
+
+        self.events.emit("iterations", "Solution after %d iteration(s)", self.n_iterations)
+        self.simplex_printer.print_simplex_table_cli(solution)
+        if solution.is_optimal:
+            self.events.emit("optimal", "Optimized Solution Received!")
+
+        return solution
@@ -1,10 +1,12 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
+from elpee.utils.events import EventSink, get_event_sink
 from elpee.utils.feasible import FeasibleHandler
 from elpee import StandardProblem
 from elpee.utils.printer import SimplexPrinter
-from elpee.utils.utilities import create_ratio_col, get_subsets
+from elpee.utils.ratio_test import select_leaving_row
+from elpee.utils.utilities import get_subsets
 
 class AlternateSolver():
     """
@@ -19,6 +21,8 @@ class AlternateSolver():
     simplex_printer : elpee.utils.SimplexPrinter 
         An instance of printer to visualize the simplex table
         of given LP problem
+    events : elpee.utils.events.EventSink
+        Sink receiving the messages of the simplex updates
     feasible_handler : elpee.utils.FeasibleHandler
         An instance of handler object to retain feasibility of
         LP problem and its solutions
@@ -34,10 +38,12 @@ class AlternateSolver():
         Displays all alternate solutions for given optimal problem
     """
 
-    def __init__(self, problem:StandardProblem, show_simplex_table : bool = True, show_interpret : bool = True):
+    def __init__(self, problem:StandardProblem, show_simplex_table : bool = True, show_interpret : bool = True,
+                 events: EventSink = None):
         self.problem = problem
         self.printer = SimplexPrinter(show_steps=show_simplex_table, show_interpret=show_interpret)
-        self.feasible_handler = FeasibleHandler()
+        self.events = get_event_sink(events)
+        self.feasible_handler = FeasibleHandler(events=self.events)
         self.n_alternates = len(self.get_alterations_combo_list())
         self.__update_num_alternates()
 
@@ -51,15 +57,21 @@ class AlternateSolver():
         """
 
         cols_for_alternates = []
-        for i in range(len(self.problem.obj_row)):
+        tableau = self.problem.tableau
+        matrix = self.problem.matrix if tableau is None else None
+        obj_row = self.problem.obj_row
+        for i in range(len(obj_row)):
             # for every zero in the objective row that is not a basic variable
             if i+1 not in self.problem.basic_vars:
-                if self.problem.obj_row[i] == 0:
+                if obj_row[i] == 0:
 
                     # check if that column has at least 1 non-zero value. 
-                    zero_col = []
-                    for j in range(self.problem.n_constraints):
-                        zero_col.append(self.problem.matrix[j+1][i])
+                    if tableau is not None:
+                        zero_col = tableau.column(i+1).tolist()
+                    else:
+                        zero_col = []
+                        for j in range(self.problem.n_constraints):
+                            zero_col.append(matrix[j+1][i])
                     if not all(element == 0 for element in zero_col):
                         cols_for_alternates.append(i+1)
                     # If the whole column is zero values - cannot do a pivot change
@@ -73,23 +85,19 @@ class AlternateSolver():
         Returns updated basic_vars list and matrix
         """
 
-        M = 1000000
-        
-        new_var_name = self.printer.print_var_name(pivot_col_var, self.problem)
-        # create a ratio column for the pivot col provided
-        ratio_col = create_ratio_col(self.problem.matrix, pivot_col_var)
-        if min(ratio_col) == M:
-            return None, None 
-        else:
-            # selecting the leaving variable
-            pivot_row = ratio_col.index(min(ratio_col)) + 1
-        pivot_row_name = self.printer.print_var_name(self.problem.basic_vars[pivot_row], self.problem)
-        print(f"Taking {pivot_row_name} = 0 for & setting {new_var_name} as a Basic Variable for the alternate solution")
-        # make the change in basic variables list
-        self.problem.basic_vars[pivot_row] = pivot_col_var
-        
-        # apply feasibility fixes for the matrix with basic variables updated
-        self.problem = self.feasible_handler.get_feasible(self.problem)
+        # selecting the leaving variable with the ratio test for the pivot col provided
+        pivot_row, unbounded = select_leaving_row(self.problem, pivot_col_var)
+        if unbounded:
+            return None, None
+        if self.events.enabled:
+            self.events.emit("alternate_pivot", "Taking %s = 0 for & setting %s as a Basic Variable for the alternate solution",
+                             self.printer.print_var_name(self.problem.basic_vars[pivot_row], self.problem),
+                             self.printer.print_var_name(pivot_col_var, self.problem))
+        # pivot on the entering variable to make the change in basic variables list
+        # the pivot retains the 0-1 pattern of the matrix with basic variables updated
+        self.problem.pivot(pivot_row, pivot_col_var)
+        if self.problem.tableau is not None:
+            return self.problem.basic_vars, self.problem.tableau
         if self.problem.matrix == None: 
             return None, None
         
@@ -104,8 +112,8 @@ class AlternateSolver():
 
         for pivot_col in alteration_combo:
             self.problem.basic_vars, self.problem.matrix = self.__apply_simplex_update(pivot_col)
-            if self.problem.matrix == None:
-                print("\nFeasible alternate solution not found")
+            if self.problem.basic_vars == None:
+                self.events.emit("no_alternate", "Feasible alternate solution not found")
                 return None, None
         # print the final alternate solution based on set of columns provided
         self.printer.print_simplex_table_cli(self.problem)
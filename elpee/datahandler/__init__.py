@@ -1,2 +1,4 @@
 from .yaml_handler import *
-from .json_handler import *
\ No newline at end of file
+from .json_handler import *
+from .mps_handler import *
+from .lp_handler import *
\ No newline at end of file
@@ -0,0 +1,121 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import queue
+import threading
+from typing import Callable
+
+from elpee.utils.protocols.st_problem import StandardProblem
+
+class BackgroundWriter():
+    """
+    Writer saving the steps of a solve in a background thread, so the solver does
+    not wait for the serialization and the disk writes of each step. A snapshot of
+    each step is queued for the thread. Once `max_pending` steps are queued, saving
+    a step waits for the thread to save a queued step (backpressure)
+
+    An error raised while saving a step stops the saving of the remaining steps and
+    is raised by `flush` or `close`, such as at the end of the solve
+
+    Attributes
+    ----------
+    max_pending : int
+        Largest number of steps queued to be saved
+    n_saved : int
+        Number of steps saved by the thread
+
+    Methods
+    -------
+    submit(problem, step_name)
+        Queues a snapshot of a step to be saved
+    flush()
+        Waits until all queued steps are saved
+    close()
+        Saves the queued steps and stops the thread
+    """
+
+    def __init__(self, save: Callable[[StandardProblem, str], None], max_pending: int = 8):
+        """
+        Parameters
+        ----------
+        save : Callable[[StandardProblem, str], None]
+            Function saving a step given the problem and the name of the step
+        max_pending : int (default : 8)
+            Largest number of steps queued to be saved
+        """
+
+        if max_pending < 1:
+            raise ValueError(f"{max_pending} is an invalid argument for max_pending parameter.")
+
+        self.max_pending = max_pending
+        self.n_saved = 0
+        self.__save = save
+        self.__error = None
+        self.__closed = False
+        self.__queue = queue.Queue(maxsize=max_pending)
+        self.__thread = threading.Thread(target=self.__run, name="elpee-writer", daemon=True)
+        self.__thread.start()
+
+    def __run(self) -> None:
+        """
+        Saves the queued steps until the closing sentinel (None) is received
+        """
+        while True:
+            item = self.__queue.get()
+            try:
+                if item is None:
+                    return
+                # queued steps are dropped once saving failed
+                if self.__error is None:
+                    self.__save(*item)
+                    self.n_saved += 1
+            except Exception as error:
+                self.__error = error
+            finally:
+                self.__queue.task_done()
+
+    def submit(self, problem: StandardProblem, step_name: str) -> None:
+        """
+        Queues a snapshot of the step to be saved. Waits while `max_pending` steps are queued
+
+        Parameters
+        ----------
+        problem : StandardProblem
+            Standardized LP problem after the step. The problem can be changed once queued
+        step_name : str
+            Name of the step (such as "sol_step_1")
+        """
+        if self.__closed:
+            raise ValueError("Steps cannot be saved by a closed writer.")
+        self.__queue.put((problem.snapshot(), step_name))
+
+    def __raise_error(self) -> None:
+        """
+        Raises the error of saving a step once
+        """
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def flush(self) -> None:
+        """
+        Waits until all queued steps are saved. Raises the error of saving a step if any
+        """
+        self.__queue.join()
+        self.__raise_error()
+
+    def close(self) -> None:
+        """
+        Saves the queued steps and stops the thread. Raises the error of saving a step if any
+        """
+        if not self.__closed:
+            self.__closed = True
+            self.__queue.put(None)
+            self.__thread.join()
+        self.__raise_error()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -8,9 +8,10 @@ import shutil
 from sympy import Symbol
 import yaml
 
-from elpee.datahandler import json_handler, yaml_handler
+from elpee.datahandler import json_handler, lp_handler, mps_handler, yaml_handler
 from elpee.utils.printer import SimplexPrinter
 from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.settings import Settings
 
 # TODO part of the refactor of handlers
 
@@ -42,7 +43,8 @@ def __check_file_type(file_path: str):
 
 def read_file(file_path: str) -> StandardProblem:
     """
-    Read the standardized problem configuration from the json/yaml file
+    Read the standardized problem configuration from the json/yaml file. 
+    Models in MPS (`.mps`) or CPLEX LP (`.lp`) files are read and standardized
 
     Parameters
     ----------
@@ -54,6 +56,12 @@ def read_file(file_path: str) -> StandardProblem:
     StandardProblem object of the LP problem in the file
     """
 
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".mps":
+        return mps_handler.read_mps(file_path).standardize_problem()
+    elif extension == ".lp":
+        return lp_handler.read_lp(file_path).standardize_problem()
+
     file_type = __check_file_type(file_path)
     if file_type == "json":
         return json_handler.read_json(file_path)
@@ -62,7 +70,7 @@ def read_file(file_path: str) -> StandardProblem:
     else:
         raise ValueError("Incorrect File Type received. File should be json or yaml type")
 
-def save_file(problem: StandardProblem, file_format: str, file_path:str):
+def save_file(problem: StandardProblem, file_format: str, file_path:str, settings: Settings = None):
     """
     Save the standardized problem configurations to specified file format 
 
@@ -74,16 +82,18 @@ def save_file(problem: StandardProblem, file_format: str, file_path:str):
         Specifies file type used for saving solution 
     file_path : string
         File path of file to be created 
+    settings : Settings (default : None)
+        Settings giving the decimals of the saved expressions. Uses the current settings if None
     """
     if file_format == "json":
-        json_handler.write_json(problem, file_path)
+        json_handler.write_json(problem, file_path, settings)
     elif file_format == "yaml":
-        yaml_handler.write_yaml(problem, file_path)
+        yaml_handler.write_yaml(problem, file_path, settings)
     else:
         raise ValueError("Incorrect File Type received. File should be json or yaml type")
 
 
-def print_lp_problem(file_path: str, show_interpreter: bool=True):
+def print_lp_problem(file_path: str, show_interpreter: bool=True, settings: Settings = None):
     """
     A function to print the StandardProblem from the file to command terminal
 
@@ -93,8 +103,10 @@ def print_lp_problem(file_path: str, show_interpreter: bool=True):
         File path to the solution file containing LP problem to be read   
     show_interpreter : bool (default = True)
         Provides interpretation of values in simplex table when True
+    settings : Settings (default : None)
+        Settings giving the decimals and cell width. Uses the current settings if None
     """
     problem = read_file(file_path)
 
-    printer = SimplexPrinter(show_interpret=show_interpreter)
+    printer = SimplexPrinter(show_interpret=show_interpreter, settings=settings)
     printer.print_simplex_table_cli(problem)
\ No newline at end of file
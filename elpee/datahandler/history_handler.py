@@ -0,0 +1,433 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from elpee.datahandler.snapshot_handler import decode_snapshot, encode_snapshot, get_dense_tableau
+from elpee.datahandler.trajectory_handler import (COMPRESSED_FLAG, FRAME_HEADER, INDEX_FLAG, TRAILER,
+                                                  TRAILER_MAGIC)
+from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.protocols.tableau import DenseTableau
+
+# A history file starts with the magic bytes followed by a frame for each step, framed
+# as in the trajectory files. The payload of a frame is the length of a json record of
+# the step (its name, phase, pivot and status) followed by the record. A checkpoint
+# frame appends a binary snapshot of the problem (zlib compressed if flagged) to the
+# record. Steps after a checkpoint only record the pivot (leaving row, entering column)
+# changing the previous step, so a step is rebuilt by replaying the pivots from the
+# nearest checkpoint. A closed file ends with an index frame and trailer as trajectory files
+HISTORY_MAGIC = b"ELPHST1\n"
+RECORD_LENGTH = struct.Struct("<I")
+
+CHECKPOINT_FLAG = 4
+
+HISTORY_TOLERANCE = 1e-9
+
+class HistoryWriter():
+    """
+    Writer saving the steps of a solve as a pivot log. The first step and periodic
+    checkpoints are saved as binary snapshots, while the other steps only save the
+    pivot changing the previous step
+
+    The pivots are replayed on a copy of the last checkpoint while writing. A step is
+    saved as a checkpoint if it is not a single pivot of the previous step or if the
+    replayed tableau differs from the tableau of the step by more than the tolerance
+    (such as after rounding off or removing a perturbation), so every saved step is
+    rebuilt by the reader
+
+    A step saved again under the name of the last step (such as the final step saved
+    with its optimal status) replaces the last step
+
+    Attributes
+    ----------
+    file_path : str
+        Path of the history file
+    checkpoint_every : int
+        Largest number of steps between checkpoints
+    n_records : int
+        Number of steps appended
+    n_checkpoints : int
+        Number of steps saved as checkpoints
+
+    Methods
+    -------
+    append(problem, step_name)
+        Appends a step
+    flush()
+        Writes the buffered steps to the file
+    close()
+        Writes the remaining steps and the index footer
+    """
+
+    def __init__(self, file_path: str, checkpoint_every: int = 32, compress: bool = False,
+                 flush_every: int = 16, tolerance: float = HISTORY_TOLERANCE):
+        """
+        Parameters
+        ----------
+        file_path : str
+            Path of the history file. An existing file is replaced
+        checkpoint_every : int (default : 32)
+            Largest number of steps between checkpoints. Rebuilding a step replays
+            at most `checkpoint_every - 1` pivots
+        compress : bool (default : False)
+            Compress the checkpoints with zlib
+        flush_every : int (default : 16)
+            Number of steps buffered before they are written to the file
+        tolerance : float (default : 1e-9)
+            Largest difference allowed between a replayed tableau and the tableau of the step
+        """
+
+        if checkpoint_every < 1:
+            raise ValueError(f"{checkpoint_every} is an invalid argument for checkpoint_every parameter.")
+        if flush_every < 1:
+            raise ValueError(f"{flush_every} is an invalid argument for flush_every parameter.")
+
+        self.file_path = file_path
+        self.checkpoint_every = checkpoint_every
+        self.compress = compress
+        self.flush_every = flush_every
+        self.tolerance = tolerance
+        self.n_records = 0
+        self.n_checkpoints = 0
+        self.__index = []
+        self.__pending = []
+        self.__offset = len(HISTORY_MAGIC)
+        self.__replayed = None
+        self.__basic_vars = None
+        self.__pivot = None
+        self.__n_since_checkpoint = 0
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__file = open(file_path, "wb")
+        self.__file.write(HISTORY_MAGIC)
+
+    def __write_frame(self, chunks: List[bytes], flags: int) -> int:
+        """
+        Buffers a frame of the payload chunks and returns its offset in the file
+        """
+        offset = self.__offset
+        length = sum(len(chunk) for chunk in chunks)
+        self.__pending.append(FRAME_HEADER.pack(length, flags))
+        self.__pending.extend(chunks)
+        self.__offset += FRAME_HEADER.size + length
+        return offset
+
+    def __rewind(self, offset: int) -> None:
+        """
+        Removes the frames from the offset to the end of the file. Frames still
+        buffered are dropped from the buffer, written frames are truncated
+        """
+        buffered_offset = self.__offset - sum(len(chunk) for chunk in self.__pending)
+        if offset >= buffered_offset:
+            size = self.__offset
+            while size > offset:
+                size -= len(self.__pending.pop())
+        else:
+            # the buffer is empty as the frames after the offset were written
+            self.__file.flush()
+            self.__file.seek(offset)
+            self.__file.truncate()
+        self.__offset = offset
+
+    def __create_record(self, problem: StandardProblem, step_name: str,
+                        pivot: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+        """
+        Creates the json record of a step. Steps of an infeasible problem belong to
+        the feasibility phase
+        """
+        return {
+            "step": step_name,
+            "phase": "optimization" if problem.is_feasible else "feasibility",
+            "pivot": list(pivot) if pivot is not None else None,
+            "feasibility": problem.is_feasible,
+            "optimal_status": problem.is_optimal,
+            "reachability_of_optimal": problem.is_optimal_reachable,
+            "n_alternates": problem.num_alternates,
+            "n_iterations": problem.n_iterations,
+            "n_degenerate_pivots": problem.n_degenerate_pivots
+        }
+
+    def __find_pivot(self, basic_vars: List[int]) -> Tuple[bool, Optional[Tuple[int, int]]]:
+        """
+        Finds the pivot changing the basic variables of the previous step. Returns
+        False if the basis changed by more than a single pivot
+        """
+        changed_rows = [row for row, (before, after) in enumerate(zip(self.__basic_vars, basic_vars))
+                        if before != after]
+        if len(changed_rows) == 0:
+            return True, None
+        if len(changed_rows) == 1:
+            return True, (changed_rows[0], int(basic_vars[changed_rows[0]]))
+        return False, None
+
+    def __is_replayed(self, tableau: DenseTableau, pivot: Optional[Tuple[int, int]]) -> bool:
+        """
+        Replays the pivot on the tableau of the previous step and checks if it matches
+        the tableau of the step
+        """
+        replayed = self.__replayed
+        if replayed.array.shape != tableau.array.shape:
+            return False
+        if pivot is not None:
+            if abs(replayed.array[pivot[0], pivot[1]-1]) <= self.tolerance:
+                return False
+            replayed.pivot(*pivot)
+        if not np.allclose(replayed.array, tableau.array, rtol=0, atol=self.tolerance):
+            return False
+        if (replayed.m_row is None) or (tableau.m_row is None):
+            return (replayed.m_row is None) and (tableau.m_row is None)
+        return np.allclose(replayed.m_row, tableau.m_row, rtol=0, atol=self.tolerance)
+
+    def append(self, problem: StandardProblem, step_name: str) -> None:
+        """
+        Appends a step of the solve
+
+        Parameters
+        ----------
+        problem : StandardProblem
+            Standardized LP problem after the step
+        step_name : str
+            Name of the step (such as "sol_step_1")
+        """
+        tableau = get_dense_tableau(problem)
+        is_delta, pivot = False, None
+        if self.__index and (self.__index[-1][1] == step_name):
+            # the step replaces the last step, keeping its pivot if only the status changed
+            offset, _, is_checkpoint = self.__index.pop()
+            self.__rewind(offset)
+            self.n_records -= 1
+            if is_checkpoint:
+                self.n_checkpoints -= 1
+            else:
+                self.__n_since_checkpoint -= 1
+                is_delta, changed_pivot = self.__find_pivot(problem.basic_vars)
+                is_delta = is_delta and (changed_pivot is None) and self.__is_replayed(tableau, None)
+                pivot = self.__pivot
+        elif (self.__replayed is not None) and (self.__n_since_checkpoint + 1 < self.checkpoint_every):
+            is_delta, pivot = self.__find_pivot(problem.basic_vars)
+            is_delta = is_delta and self.__is_replayed(tableau, pivot)
+
+        record = json.dumps(self.__create_record(problem, step_name, pivot), separators=(",", ":")).encode("utf-8")
+        chunks = [RECORD_LENGTH.pack(len(record)), record]
+        if is_delta:
+            flags = 0
+            self.__n_since_checkpoint += 1
+        else:
+            flags = CHECKPOINT_FLAG
+            snapshot = encode_snapshot(problem)
+            if self.compress:
+                snapshot = [zlib.compress(b"".join(snapshot))]
+                flags |= COMPRESSED_FLAG
+            chunks.extend(snapshot)
+            self.__replayed = tableau.copy()
+            self.__n_since_checkpoint = 0
+            self.n_checkpoints += 1
+        self.__basic_vars = list(problem.basic_vars)
+        self.__pivot = pivot
+
+        offset = self.__write_frame(chunks, flags)
+        self.__index.append([offset, step_name, flags & CHECKPOINT_FLAG != 0])
+        self.n_records += 1
+        if len(self.__index) % self.flush_every == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered steps to the file
+        """
+        if self.__pending:
+            self.__file.writelines(self.__pending)
+            self.__pending = []
+        self.__file.flush()
+
+    def close(self) -> None:
+        """
+        Writes the remaining steps followed by the index footer and closes the file
+        """
+        if self.__file.closed:
+            return
+        index_offset = self.__write_frame([json.dumps(self.__index).encode("utf-8")], INDEX_FLAG)
+        self.__pending.append(TRAILER.pack(index_offset, TRAILER_MAGIC))
+        self.flush()
+        self.__file.close()
+
+    def __enter__(self) -> "HistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class HistoryReader():
+    """
+    Reader of the steps saved to a history file. A step is rebuilt by replaying the
+    pivots from the nearest checkpoint before it. The last rebuilt step is kept, so
+    reading the steps in order replays a single pivot per step
+
+    Attributes
+    ----------
+    file_path : str
+        Path of the history file
+    step_names : List[str]
+        Names of the steps in the order they were saved
+    checkpoints : List[int]
+        Positions of the steps saved as checkpoints
+
+    Methods
+    -------
+    read_record(position) -> dict
+        Reads the json record of the step at the position
+    read_step(position) -> StandardProblem
+        Rebuilds the problem of the step at the position
+    get(step_name) -> StandardProblem
+        Rebuilds the problem of the last step saved with the name
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Parameters
+        ----------
+        file_path : str
+            Path of the history file
+        """
+
+        self.file_path = file_path
+        with open(file_path, "rb") as file:
+            if file.read(len(HISTORY_MAGIC)) != HISTORY_MAGIC:
+                raise ValueError(f"{file_path} is not a history file.")
+            index = self.__read_index(file)
+        self.__offsets = [offset for offset, _, _ in index]
+        self.step_names = [name for _, name, _ in index]
+        self.checkpoints = [position for position, (_, _, is_checkpoint) in enumerate(index) if is_checkpoint]
+        # position and problem of the last rebuilt step
+        self.__current = None
+
+    def __read_index(self, file) -> List[Tuple[int, str, bool]]:
+        """
+        Reads the index footer. The steps are scanned if the file has no footer
+        """
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        if size >= len(HISTORY_MAGIC) + TRAILER.size:
+            file.seek(size - TRAILER.size)
+            index_offset, magic = TRAILER.unpack(file.read(TRAILER.size))
+            if magic == TRAILER_MAGIC:
+                file.seek(index_offset)
+                length, _ = FRAME_HEADER.unpack(file.read(FRAME_HEADER.size))
+                return [(offset, name, is_checkpoint) for offset, name, is_checkpoint in json.loads(file.read(length))]
+
+        index = []
+        offset = len(HISTORY_MAGIC)
+        while offset + FRAME_HEADER.size <= size:
+            file.seek(offset)
+            length, flags = FRAME_HEADER.unpack(file.read(FRAME_HEADER.size))
+            if offset + FRAME_HEADER.size + length > size:
+                # step only partly written
+                break
+            if not (flags & INDEX_FLAG):
+                (record_length,) = RECORD_LENGTH.unpack(file.read(RECORD_LENGTH.size))
+                record = json.loads(file.read(record_length))
+                index.append((offset, record["step"], bool(flags & CHECKPOINT_FLAG)))
+            offset += FRAME_HEADER.size + length
+        return index
+
+    def __read_frame(self, file, position: int) -> Tuple[Dict[str, Any], Optional[bytearray]]:
+        """
+        Reads the record of the step at the position and its snapshot if it is a checkpoint
+        """
+        file.seek(self.__offsets[position])
+        length, flags = FRAME_HEADER.unpack(file.read(FRAME_HEADER.size))
+        (record_length,) = RECORD_LENGTH.unpack(file.read(RECORD_LENGTH.size))
+        record = json.loads(file.read(record_length))
+        if not (flags & CHECKPOINT_FLAG):
+            return record, None
+        snapshot = bytearray(length - RECORD_LENGTH.size - record_length)
+        file.readinto(snapshot)
+        if flags & COMPRESSED_FLAG:
+            snapshot = bytearray(zlib.decompress(snapshot))
+        return record, snapshot
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    def read_record(self, position: int) -> Dict[str, Any]:
+        """
+        Reads the json record of the step at the position (negative positions count from the end)
+        """
+        with open(self.file_path, "rb") as file:
+            record, _ = self.__read_frame(file, range(len(self))[position])
+        return record
+
+    def __rebuild(self, position: int) -> StandardProblem:
+        """
+        Rebuilds the step at the position, continuing from the last rebuilt step if
+        no checkpoint is closer
+        """
+        checkpoint = max(checkpoint for checkpoint in self.checkpoints if checkpoint <= position)
+        with open(self.file_path, "rb") as file:
+            if (self.__current is not None) and (checkpoint <= self.__current[0] <= position):
+                current_position, problem = self.__current
+                record, _ = self.__read_frame(file, current_position)
+            else:
+                record, snapshot = self.__read_frame(file, checkpoint)
+                current_position, problem = checkpoint, decode_snapshot(snapshot)
+            for next_position in range(current_position + 1, position + 1):
+                record, _ = self.__read_frame(file, next_position)
+                if record["pivot"] is not None:
+                    problem.pivot(*record["pivot"])
+
+        problem.update_feasible_status(record["feasibility"])
+        problem.update_optimal_status(record["optimal_status"])
+        problem.update_optimal_reachability_status(record["reachability_of_optimal"])
+        problem.set_num_alternates(record["n_alternates"])
+        problem.update_pivot_counts(record["n_iterations"], record["n_degenerate_pivots"])
+        self.__current = (position, problem)
+        return problem
+
+    def read_step(self, position: int) -> StandardProblem:
+        """
+        Rebuilds the problem of the step at the position (negative positions count from the end)
+        """
+        return self.__rebuild(range(len(self))[position]).snapshot()
+
+    def get(self, step_name: str) -> StandardProblem:
+        """
+        Rebuilds the problem of the last step saved with the name
+
+        Exceptions
+        ----------
+        KeyError is thrown if no step was saved with the name
+        """
+        for position in range(len(self.step_names) - 1, -1, -1):
+            if self.step_names[position] == step_name:
+                return self.read_step(position)
+        raise KeyError(step_name)
+
+    def __getitem__(self, position: int) -> StandardProblem:
+        return self.read_step(position)
+
+    def __iter__(self) -> Iterator[StandardProblem]:
+        for position in range(len(self)):
+            yield self.read_step(position)
+
+def read_history(file_path: str) -> HistoryReader:
+    """
+    Open the history file saved while solving a LP problem
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the history file
+
+    Returns
+    -------
+    HistoryReader of the steps in the file
+    """
+    return HistoryReader(file_path)
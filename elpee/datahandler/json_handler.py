@@ -3,13 +3,14 @@
 
 import os
 import shutil
-from typing import Any
+from typing import Any, Dict
 from sympy import Symbol
 import json
 
 from elpee.utils.printer import SimplexPrinter
 from elpee.utils.protocols.st_problem import StandardProblem
-from elpee.utils.utilities import convert_M_to_sympy, convert_sympy_to_text, get_basic_vars_names, get_column_list
+from elpee.utils.settings import Settings, get_settings
+from elpee.utils.utilities import convert_M_to_sympy, get_basic_vars_names, get_column_list, iter_text_rows
 
 M = Symbol('M')
 
@@ -33,6 +34,22 @@ def read_json(json_path: str) -> StandardProblem:
     with open(json_path, 'r') as file:
         config = json.load(file)
 
+    return problem_from_dict(config)
+
+def problem_from_dict(config: Dict[str, Any]) -> StandardProblem:
+    """
+    Create the standardized problem from the configuration saved by `problem_to_dict`
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the LP problem as loaded from a json file
+
+    Returns
+    -------
+    StandardProblem object of the LP problem in the configuration
+    """
+
     variable_names = __read_optional_configs(config, "variable_names", None)
 
     # Access the values and create a new StandardProblem
@@ -70,9 +87,10 @@ def __read_optional_configs(config: Any, property: str, default_value: Any):
     return value
 
 
-def write_json(problem:StandardProblem, json_path:str):
+def write_json(problem:StandardProblem, json_path:str, settings: Settings = None):
     """
-    Save the standardized problem configurations to json file 
+    Save the standardized problem configurations to json file. The rows of the
+    simplex matrix are converted and written to the file one at a time
 
     Parameters
     ----------
@@ -80,10 +98,42 @@ def write_json(problem:StandardProblem, json_path:str):
         Standardized LP problem to be saved into json file
     json_path : string
         File path of json file to be written 
+    settings : Settings (default : None)
+        Settings giving the decimals of the saved expressions. Uses the current settings if None
+    """
+
+    settings = settings if settings is not None else get_settings()
+    decimals = settings.get_decimals()
+
+    # Save data to json file
+    with open(json_path, 'w') as file:
+        file.write("{\n")
+        for key, value in problem_metadata(problem).items():
+            file.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+        file.write('  "matrix": [')
+        separator = "\n    "
+        for row in iter_text_rows(problem, decimals):
+            file.write(separator)
+            file.write(json.dumps(row))
+            separator = ",\n    "
+        file.write("\n  ]\n}\n")
+
+def problem_metadata(problem: StandardProblem) -> Dict[str, Any]:
+    """
+    Obtain the configuration of the standardized problem saved to json and yaml
+    files other than the simplex matrix
+
+    Parameters
+    ----------
+    problem : StandardProblem
+        Standardized LP problem to be saved
+
+    Returns
+    -------
+    Dictionary of json serializable values
     """
 
-    data = {
-        "matrix": convert_sympy_to_text(problem.matrix),
+    return {
         "basic_vars": problem.basic_vars,
         "basic_vars_names": get_basic_vars_names(problem),
         "matrix_columns": get_column_list(problem),
@@ -97,11 +147,29 @@ def write_json(problem:StandardProblem, json_path:str):
         "n_alternates": problem.num_alternates
     }
 
-    # Save data to json file
-    with open(json_path, 'w') as file:
-        json.dump(data, file, indent=2)
+def problem_to_dict(problem: StandardProblem, settings: Settings = None) -> Dict[str, Any]:
+    """
+    Obtain the configuration of the standardized problem saved to json files
+
+    Parameters
+    ----------
+    problem : StandardProblem
+        Standardized LP problem to be saved
+    settings : Settings (default : None)
+        Settings giving the decimals of the saved expressions. Uses the current settings if None
+
+    Returns
+    -------
+    Dictionary of json serializable values read back with `problem_from_dict`
+    """
+
+    settings = settings if settings is not None else get_settings()
+    return {
+        "matrix": list(iter_text_rows(problem, settings.get_decimals())),
+        **problem_metadata(problem)
+    }
 
-def print_lp_problem_from_json(json_path:str, show_interpreter: bool=True) -> None:
+def print_lp_problem_from_json(json_path:str, show_interpreter: bool=True, settings: Settings = None) -> None:
     """
     A function to print the StandardProblem from the json to command terminal
 
@@ -111,9 +179,11 @@ def print_lp_problem_from_json(json_path:str, show_interpreter: bool=True) -> No
         File path to the json file containing LP problem to be read   
     show_interpreter : bool (default = True)
         Provides interpretation of values in simplex table when True
+    settings : Settings (default : None)
+        Settings giving the decimals and cell width. Uses the current settings if None
     """
 
     problem = read_json(json_path)
 
-    printer = SimplexPrinter(show_interpret=show_interpreter)
+    printer = SimplexPrinter(show_interpret=show_interpreter, settings=settings)
     printer.print_simplex_table_cli(problem)
\ No newline at end of file
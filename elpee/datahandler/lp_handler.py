@@ -0,0 +1,342 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import warnings
+from typing import Dict, Iterator, List, Tuple
+
+from elpee.utils.expression_parser import format_expression, format_number
+from elpee.utils.protocols.lp_problem import LinearProblem
+
+SECTIONS = {
+    'maximize': 'max', 'maximum': 'max', 'max': 'max',
+    'minimize': 'min', 'minimum': 'min', 'min': 'min',
+    'subject to': 'st', 'such that': 'st', 'st': 'st', 's.t.': 'st', 'st.': 'st',
+    'bounds': 'bounds', 'bound': 'bounds',
+    'generals': 'integers', 'general': 'integers', 'gen': 'integers',
+    'integers': 'integers', 'integer': 'integers',
+    'binaries': 'binaries', 'binary': 'binaries', 'bin': 'binaries',
+    'end': 'end',
+}
+SECTION_PATTERN = re.compile(r'\s*(subject\s+to|such\s+that|s\.t\.|st\.?|[a-z]+)(?=\s|$)', re.IGNORECASE)
+
+# tokens of the CPLEX LP format as an operator, a sign, a number or a name
+# (followed by ':' for the name of an objective or a constraint)
+TOKEN_PATTERN = re.compile(r"""\s*(?:
+    (<=|=<|>=|=>|=|<|>)
+    |([+-])
+    |(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)
+    |([a-zA-Z_!"\#$%&()/,;?@`'{}|~][^\s:+\-*^<>=\[\]]*)\s*(:)?
+    |(\S))""", re.VERBOSE)
+OPERATORS = {'<=': '<=', '=<': '<=', '<': '<=', '>=': '>=', '=>': '>=', '>': '>=', '=': '='}
+INFINITY = ('inf', 'infinity')
+# largest number of terms written in a line
+TERMS_PER_LINE = 8
+
+def __tokenize(line: str, line_no: int) -> Iterator[Tuple[str, object]]:
+    """
+    Splits a line of the LP file into (kind, value) tokens of the kinds
+    'op', 'sign', 'num', 'name' and 'label'
+    """
+    for operator, sign, number, name, colon, other in TOKEN_PATTERN.findall(line):
+        if operator:
+            yield 'op', OPERATORS[operator]
+        elif sign:
+            yield 'sign', -1.0 if sign == '-' else 1.0
+        elif number:
+            yield 'num', float(number)
+        elif name:
+            yield ('label' if colon else 'name'), name
+        else:
+            raise ValueError(f"Unexpected character '{other}' at line {line_no} of the LP file")
+
+class _Statement():
+    """
+    Objective or constraint of the LP file being read over one or more lines
+    """
+
+    def __init__(self):
+        self.label = None
+        self.coefficients = {}
+        self.constant = 0.0
+        self.operators = []
+        self.bounds = []        # numbers before the first and after the last operator
+        self.sign = 1.0
+        self.number = None
+        self.is_complete = False
+
+    def add(self, kind: str, value, line_no: int) -> None:
+        """
+        Adds the next token to the statement. Marks the constraint complete once
+        the right-hand side value following the operator is read
+        """
+        if kind == 'num':
+            if self.number is not None:
+                raise ValueError(f"Missing operator between numbers at line {line_no} of the LP file")
+            self.number = self.sign * value
+            self.sign = 1.0
+            if self.operators and self.coefficients:
+                self.bounds.append(self.number)
+                self.number = None
+                self.is_complete = True
+        elif kind == 'name':
+            coefficient = self.sign * (1.0 if self.number is None else self.number)
+            self.coefficients[value] = self.coefficients.get(value, 0.0) + coefficient
+            self.sign, self.number = 1.0, None
+        elif kind == 'sign':
+            self.__end_constant()
+            self.sign *= value
+        elif kind == 'op':
+            if (self.number is not None) and not self.coefficients:
+                # number on the left of a ranged constraint
+                self.bounds.append(self.number)
+                self.number = None
+            self.__end_constant()
+            self.operators.append(value)
+        elif self.coefficients or self.operators or (self.number is not None):
+            raise ValueError(f"Unexpected name {value}: at line {line_no} of the LP file")
+        else:
+            self.label = value
+
+    def end(self) -> None:
+        """
+        Ends the statement at the end of its section
+        """
+        self.__end_constant()
+
+    def __end_constant(self) -> None:
+        """
+        Adds the pending number without a variable as a constant term
+        """
+        if self.number is not None:
+            self.constant += self.number
+            self.number = None
+
+def __read_values(line: str, line_no: int) -> List[Tuple[str, object]]:
+    """
+    Reads the tokens of a bound into names, operators and signed numbers
+    (including infinite bounds)
+    """
+    values = []
+    sign = 1.0
+    for kind, value in __tokenize(line, line_no):
+        if kind == 'sign':
+            sign *= value
+            continue
+        if (kind == 'name') and (value.lower() in INFINITY):
+            kind, value = 'num', float('inf')
+        if kind == 'num':
+            value = sign * value
+        sign = 1.0
+        values.append((kind, value))
+    return values
+
+def __read_bound(line: str, line_no: int, bounds: Dict[str, List[float]]) -> None:
+    """
+    Updates the [lower, upper] bounds of the variable of a bound line
+    """
+    words = line.split()
+    if (len(words) == 2) and (words[1].lower() == 'free'):
+        bounds.setdefault(words[0], [0.0, None])[0] = float('-inf')
+        return
+
+    values = __read_values(line, line_no)
+    kinds = [kind for kind, _ in values]
+    if kinds == ['num', 'op', 'name', 'op', 'num']:
+        (_, lower), (_, operator), (_, variable), _, (_, upper) = values
+        if operator == '>=':
+            lower, upper = upper, lower
+        bounds.setdefault(variable, [0.0, None])[:] = [lower, upper]
+        return
+
+    if kinds == ['name', 'op', 'num']:
+        (_, variable), (_, operator), (_, value) = values
+    elif kinds == ['num', 'op', 'name']:
+        (_, value), (_, operator), (_, variable) = values
+        # reversed to have the variable on the left
+        operator = {'<=': '>=', '>=': '<=', '=': '='}[operator]
+    else:
+        raise ValueError(f"Invalid bound at line {line_no} of the LP file")
+
+    bound = bounds.setdefault(variable, [0.0, None])
+    if operator == '>=':
+        bound[0] = value
+    elif operator == '<=':
+        bound[1] = value
+    else:
+        bound[0] = bound[1] = value
+
+def __add_constraint(problem: LinearProblem, statement: _Statement, line_no: int) -> None:
+    """
+    Adds the constraint read from the LP file. Ranged constraints are added as a
+    pair of >= and <= constraints
+    """
+    if (len(statement.operators) == 1) and (len(statement.bounds) == 1):
+        problem.add_constraint_coefficients(statement.coefficients, statement.operators[0],
+                                            statement.bounds[0] - statement.constant)
+    elif (len(statement.operators) == 2) and (len(statement.bounds) == 2):
+        lower, upper = statement.bounds
+        if statement.operators[0] == '>=':
+            lower, upper = upper, lower
+        problem.add_constraint_coefficients(statement.coefficients, '>=', lower - statement.constant)
+        problem.add_constraint_coefficients(statement.coefficients, '<=', upper - statement.constant)
+    else:
+        raise ValueError(f"Invalid constraint {statement.label or ''} ending at line {line_no} of the LP file")
+
+def __add_objective(problem: LinearProblem, statement: _Statement) -> None:
+    """
+    Adds the objective function read from the LP file
+    """
+    statement.end()
+    if statement.operators:
+        raise ValueError("Objective Function cannot have equality or inequality operators")
+    if statement.constant != 0:
+        # warned at the caller of read_lp
+        warnings.warn(f"Constant {format_number(statement.constant)} of the objective function is ignored",
+                      stacklevel=4)
+    problem.add_objective_coefficients(statement.coefficients)
+
+def __end_section(problem: LinearProblem, section: str, statement: _Statement, line_no: int) -> None:
+    """
+    Adds the last objective or constraint of a section of the LP file
+    """
+    if section in ('max', 'min'):
+        __add_objective(problem, statement)
+    elif (section == 'st') and statement.is_complete:
+        __add_constraint(problem, statement, line_no)
+    elif (section == 'st') and (statement.coefficients or statement.operators or statement.label):
+        raise ValueError(f"Incomplete constraint before line {line_no} of the LP file")
+
+def read_lp(lp_path: str) -> LinearProblem:
+    """
+    Read the LP problem from a file in the CPLEX LP format. The file is read
+    line by line, so only the coefficients of the problem are held in memory.
+
+    Bounds of the variables are added as constraints since the variables of a
+    LinearProblem are nonnegative. General and binary sections are ignored and
+    the problem is read as its linear relaxation (binaries bounded by 1).
+
+    Parameters
+    ----------
+    lp_path : str
+        File path to the LP file containing LP problem to be read
+
+    Returns
+    -------
+    LinearProblem object of the LP problem in the LP file
+
+    Exceptions
+    ----------
+    ValueError is thrown when the file is not a valid LP file or uses free or
+    negative variables
+
+    Warnings
+    --------
+    UserWarning is issued when integer variables or a constant of the objective
+    function are ignored
+    """
+
+    problem = None
+    section = None
+    statement = _Statement()
+    bounds = {}
+    has_integers = False
+    line_no = 0
+
+    with open(lp_path, 'r') as file:
+        for line_no, line in enumerate(file, start=1):
+            comment = line.find('\\')
+            if comment != -1:
+                line = line[:comment]
+            if not line.strip():
+                continue
+
+            match = SECTION_PATTERN.match(line)
+            keyword = ' '.join(match.group(1).lower().split()) if match else None
+            if keyword in SECTIONS:
+                __end_section(problem, section, statement, line_no)
+                section = SECTIONS[keyword]
+                statement = _Statement()
+                if section in ('max', 'min'):
+                    problem = LinearProblem(is_maximization=(section == 'max'))
+                elif section == 'end':
+                    break
+                elif problem is None:
+                    raise ValueError("The LP file must start with the objective function")
+                line = line[match.end():]
+                if not line.strip():
+                    continue
+
+            if section is None:
+                raise ValueError(f"Line {line_no} of the LP file is outside of a section")
+            elif section == 'bounds':
+                __read_bound(line, line_no, bounds)
+            elif section in ('integers', 'binaries'):
+                has_integers = True
+                if section == 'binaries':
+                    for variable in line.split():
+                        bounds.setdefault(variable, [0.0, None])[1] = 1.0
+            elif section == 'st':
+                for kind, value in __tokenize(line, line_no):
+                    if statement.is_complete:
+                        __add_constraint(problem, statement, line_no)
+                        statement = _Statement()
+                    statement.add(kind, value, line_no)
+            else:
+                for kind, value in __tokenize(line, line_no):
+                    statement.add(kind, value, line_no)
+        else:
+            __end_section(problem, section, statement, line_no)
+
+    if problem is None:
+        raise ValueError("The LP file must start with the objective function")
+    if has_integers:
+        warnings.warn("Integer variables of the LP file are read as continuous variables", stacklevel=2)
+    for variable, (lower, upper) in bounds.items():
+        problem.add_variable_bounds(variable, lower, upper)
+    return problem
+
+def __write_expression(coefficients: Dict[str, float]) -> str:
+    """
+    Formats the coefficients of a linear expression over lines of at most
+    `TERMS_PER_LINE` terms
+    """
+    if len(coefficients) <= TERMS_PER_LINE:
+        return format_expression(coefficients)
+
+    items = list(coefficients.items())
+    lines = []
+    for i in range(0, len(items), TERMS_PER_LINE):
+        expression = format_expression(dict(items[i:i+TERMS_PER_LINE]))
+        if (i > 0) and (expression[0] != '-'):
+            expression = '+ ' + expression
+        lines.append(expression)
+    return '\n   '.join(lines)
+
+def write_lp(problem: LinearProblem, lp_path: str) -> None:
+    """
+    Save the LP problem into a file in the CPLEX LP format. The objective is
+    named `obj` and the constraints `R1, R2, ...` in their order in the LP problem.
+
+    Parameters
+    ----------
+    problem : LinearProblem
+        LP problem to be saved into the LP file
+    lp_path : str
+        File path of the LP file to be written
+    """
+
+    with open(lp_path, 'w') as file:
+        file.write("\\ LP problem written by elpee\n")
+        file.write("Maximize\n" if problem.is_max else "Minimize\n")
+        file.write(f" obj: {__write_expression(problem.standard_objective)}\n")
+
+        file.write("Subject To\n")
+        for i, constraint in enumerate(problem.standard_constraints, start=1):
+            (operator, coefficient_dict), = constraint.items()
+            coefficients = {var: coeff for var, coeff in coefficient_dict.items() if var != 'sol'}
+            if not coefficients:
+                # a constraint needs a variable in the LP format
+                coefficients = {problem.variables[0]: 0.0}
+            file.write(f" R{i}: {__write_expression(coefficients)} {operator} {format_number(coefficient_dict['sol'])}\n")
+        file.write("End\n")
@@ -0,0 +1,254 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import warnings
+from typing import List
+
+from elpee.utils.expression_parser import format_number
+from elpee.utils.protocols.lp_problem import LinearProblem
+
+ROW_OPERATORS = {'L': '<=', 'G': '>=', 'E': '='}
+OPERATOR_ROWS = {'<=': 'L', '>=': 'G', '=': 'E'}
+# bound types given without a value
+NO_VALUE_BOUNDS = ('FR', 'MI', 'PL', 'BV')
+
+def __read_fixed_fields(line: str, section: str) -> List[str]:
+    """
+    Splits a data line of a fixed MPS file into its fields. Fields are located
+    by their columns, so names may contain spaces and the name of the RHS,
+    RANGES and BOUNDS vectors may be blank
+    """
+    fields = [line[1:3].strip(), line[4:12].strip(), line[14:22].strip(),
+              line[24:36].strip(), line[39:47].strip(), line[49:61].strip()]
+    if section == 'ROWS':
+        return fields[:2]
+    if section == 'BOUNDS':
+        return fields[:3] + fields[3:4] if fields[3] else fields[:3]
+    return fields[1:4] + fields[4:6] if fields[4] else fields[1:4]
+
+def __read_free_fields(line: str, section: str) -> List[str]:
+    """
+    Splits a data line of a free MPS file into its fields. The name of the RHS,
+    RANGES and BOUNDS vectors is optional and given as blank when missing
+    """
+    fields = line.split()
+    if (section in ('RHS', 'RANGES')) and (len(fields) % 2 == 0):
+        fields.insert(0, '')
+    elif (section == 'BOUNDS') and (len(fields) == (2 if fields[0].upper() in NO_VALUE_BOUNDS else 3)):
+        fields.insert(1, '')
+    return fields
+
+def read_mps(mps_path: str, fixed: bool = False) -> LinearProblem:
+    """
+    Read the LP problem from a free or fixed MPS file. The file is read line by
+    line, so only the coefficients of the problem are held in memory.
+
+    Bounds of the variables are added as constraints since the variables of a
+    LinearProblem are nonnegative. Integrality markers are ignored and the
+    problem is read as its linear relaxation.
+
+    Parameters
+    ----------
+    mps_path : str
+        File path to the MPS file containing LP problem to be read
+    fixed : bool (default : False)
+        Read the fields of the data lines by their columns in the fixed MPS
+        format. Required only if names in the file contain spaces
+
+    Returns
+    -------
+    LinearProblem object of the LP problem in the MPS file
+
+    Exceptions
+    ----------
+    ValueError is thrown when the file is not a valid MPS file or uses free or
+    negative variables
+
+    Warnings
+    --------
+    UserWarning is issued when integer variables or a constant of the objective
+    function are ignored
+    """
+
+    read_fields = __read_fixed_fields if fixed else __read_free_fields
+
+    is_max = False
+    objective_row = None
+    row_types = {}          # row name -> 'L', 'G' or 'E' in the order of the file
+    rows = {}               # row name -> coefficients of the row
+    objective = {}
+    rhs = {}
+    ranges = {}
+    bounds = {}             # variable -> [lower, upper]
+    has_integers = False
+    objective_constant = 0.0
+
+    section = None
+    with open(mps_path, 'r') as file:
+        for line_no, line in enumerate(file, start=1):
+            if (not line.strip()) or (line[0] == '*'):
+                continue
+
+            if not line[0].isspace():
+                # section header
+                header = line.split()
+                section = header[0].upper()
+                if (section == 'OBJSENSE') and (len(header) > 1):
+                    is_max = header[1].upper() in ('MAX', 'MAXIMIZE')
+                elif section == 'ENDATA':
+                    break
+                elif section not in ('NAME', 'OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS'):
+                    raise ValueError(f"Unknown MPS section {section} at line {line_no}")
+                continue
+
+            if section == 'OBJSENSE':
+                is_max = line.strip().upper() in ('MAX', 'MAXIMIZE')
+                continue
+
+            fields = read_fields(line, section)
+            try:
+                if section == 'COLUMNS':
+                    if fields[1] == "'MARKER'":
+                        has_integers = True
+                        continue
+                    variable = fields[0]
+                    for i in range(1, len(fields), 2):
+                        row, value = fields[i], float(fields[i+1])
+                        if row == objective_row:
+                            objective[variable] = value
+                        elif row in rows:
+                            rows[row][variable] = value
+                        elif row not in row_types:
+                            raise ValueError(f"Unknown row {row} at line {line_no} of the MPS file")
+
+                elif section == 'RHS':
+                    for i in range(1, len(fields), 2):
+                        row, value = fields[i], float(fields[i+1])
+                        if row == objective_row:
+                            objective_constant = -value
+                        else:
+                            rhs[row] = value
+
+                elif section == 'RANGES':
+                    for i in range(1, len(fields), 2):
+                        ranges[fields[i]] = float(fields[i+1])
+
+                elif section == 'BOUNDS':
+                    bound_type, variable = fields[0].upper(), fields[2]
+                    bound = bounds.setdefault(variable, [0.0, None])
+                    if bound_type in ('UP', 'UI'):
+                        value = float(fields[3])
+                        if (value < 0) and (bound[0] == 0):
+                            # a negative upper bound makes the variable free below in the MPS format
+                            bound[0] = float('-inf')
+                        bound[1] = value
+                    elif bound_type in ('LO', 'LI'):
+                        bound[0] = float(fields[3])
+                    elif bound_type == 'FX':
+                        bound[0] = bound[1] = float(fields[3])
+                    elif bound_type in ('FR', 'MI'):
+                        bound[0] = float('-inf')
+                    elif bound_type == 'BV':
+                        has_integers = True
+                        bound[0], bound[1] = 0.0, 1.0
+                    elif bound_type != 'PL':
+                        raise ValueError(f"Unsupported bound type {bound_type} at line {line_no} of the MPS file")
+                    if bound_type in ('UI', 'LI'):
+                        has_integers = True
+
+                elif section == 'ROWS':
+                    row_type, row = fields[0].upper(), fields[1]
+                    if row_type == 'N':
+                        # the first free row is the objective, the others are dropped
+                        if objective_row is None:
+                            objective_row = row
+                    elif row_type in ROW_OPERATORS:
+                        row_types[row] = row_type
+                        rows[row] = {}
+                    else:
+                        raise ValueError(f"Unknown row type {row_type} at line {line_no} of the MPS file")
+                    row_types.setdefault(row, 'N')
+
+                else:
+                    raise ValueError(f"Data line outside of a section at line {line_no} of the MPS file")
+            except IndexError:
+                raise ValueError(f"Missing fields at line {line_no} of the MPS file") from None
+
+    if has_integers:
+        warnings.warn("Integer variables of the MPS file are read as continuous variables", stacklevel=2)
+    if objective_constant != 0:
+        warnings.warn(f"Constant {format_number(objective_constant)} of the objective function is ignored",
+                      stacklevel=2)
+
+    problem = LinearProblem(is_maximization=is_max)
+    problem.add_objective_coefficients(objective)
+    for row, coefficients in rows.items():
+        operator = ROW_OPERATORS[row_types[row]]
+        value = rhs.get(row, 0.0)
+        if row not in ranges:
+            problem.add_constraint_coefficients(coefficients, operator, value)
+            continue
+
+        # a ranged row is given as a pair of >= and <= constraints
+        range_value = ranges[row]
+        if operator == '<=':
+            lower, upper = value - abs(range_value), value
+        elif operator == '>=':
+            lower, upper = value, value + abs(range_value)
+        else:
+            lower, upper = min(value, value + range_value), max(value, value + range_value)
+        problem.add_constraint_coefficients(coefficients, '>=', lower)
+        problem.add_constraint_coefficients(coefficients, '<=', upper)
+
+    for variable, (lower, upper) in bounds.items():
+        problem.add_variable_bounds(variable, lower, upper)
+    return problem
+
+def write_mps(problem: LinearProblem, mps_path: str, name: str = "ELPEE") -> None:
+    """
+    Save the LP problem into a free MPS file. The objective row is named `OBJ`
+    and the constraints `R1, R2, ...` in their order in the LP problem. Data
+    lines are aligned to the columns of the fixed MPS format.
+
+    Parameters
+    ----------
+    problem : LinearProblem
+        LP problem to be saved into the MPS file
+    mps_path : str
+        File path of the MPS file to be written
+    name : str (default : "ELPEE")
+        Name of the problem given in the NAME section
+    """
+
+    constraints = problem.standard_constraints
+    row_names = [f"R{i}" for i in range(1, len(constraints) + 1)]
+
+    # column wise entries of the constraint rows
+    columns = {var: [] for var in problem.variables}
+    for row, constraint in zip(row_names, constraints):
+        for var, coeff in next(iter(constraint.values())).items():
+            if var != 'sol':
+                columns[var].append((row, coeff))
+
+    with open(mps_path, 'w') as file:
+        file.write(f"NAME          {name}\n")
+        if problem.is_max:
+            file.write("OBJSENSE\n    MAX\n")
+
+        file.write("ROWS\n N  OBJ\n")
+        file.writelines(f" {OPERATOR_ROWS[next(iter(constraint))]}  {row}\n"
+                        for row, constraint in zip(row_names, constraints))
+
+        file.write("COLUMNS\n")
+        objective = problem.standard_objective
+        for var, entries in columns.items():
+            if (var in objective) or (not entries):
+                entries.insert(0, ('OBJ', objective.get(var, 0.0)))
+            file.writelines(f"    {var:<8}  {row:<8}  {format_number(coeff):>12}\n" for row, coeff in entries)
+
+        file.write("RHS\n")
+        for row, constraint in zip(row_names, constraints):
+            value = next(iter(constraint.values()))['sol']
+            if value != 0:
+                file.write(f"    RHS       {row:<8}  {format_number(value):>12}\n")
+        file.write("ENDATA\n")
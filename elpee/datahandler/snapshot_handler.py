@@ -0,0 +1,191 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import struct
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from elpee.utils.protocols.sparse_tableau import SparseTableau
+from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.protocols.tableau import DenseTableau
+
+# A snapshot file starts with the magic bytes and the length of the json header holding
+# the metadata of the problem. The header is padded so the raw float64 tableau that
+# follows is aligned, followed by the coefficients of M of the objective row if the
+# problem uses big M values. Both planes are little endian and C ordered
+SNAPSHOT_MAGIC = b"ELPSNP1\n"
+HEADER_LENGTH = struct.Struct("<Q")
+SNAPSHOT_DTYPE = np.dtype("<f8")
+ALIGNMENT = 64
+
+SNAPSHOT_MODES = ["r", "c", "load"]
+
+def get_dense_tableau(problem: StandardProblem) -> DenseTableau:
+    """
+    Obtains the dense tableau of the problem. The tableau of a problem using a
+    dense tableau is returned without copying
+    """
+    if isinstance(problem.tableau, DenseTableau):
+        return problem.tableau
+    if isinstance(problem.tableau, SparseTableau):
+        return problem.tableau.to_dense()
+    return DenseTableau(problem.matrix)
+
+def __create_header(problem: StandardProblem, tableau: DenseTableau) -> Dict[str, Any]:
+    """
+    Creates the metadata header of the problem
+    """
+    return {
+        "shape": list(tableau.array.shape),
+        "has_m_row": tableau.m_row is not None,
+        "basic_vars": [int(var) for var in problem.basic_vars],
+        "n_decision_vars": problem.n_decision_vars,
+        "n_artificials": problem.n_artificials,
+        "is_max": problem.is_max,
+        "variable_names": problem.var_name_list,
+        "feasibility": problem.is_feasible,
+        "optimal_status": problem.is_optimal,
+        "reachability_of_optimal": problem.is_optimal_reachable,
+        "n_alternates": problem.num_alternates,
+        "n_iterations": problem.n_iterations,
+        "n_degenerate_pivots": problem.n_degenerate_pivots
+    }
+
+def encode_snapshot(problem: StandardProblem) -> List[bytes]:
+    """
+    Encodes the standardized problem as the chunks of a binary snapshot
+
+    Exceptions
+    ----------
+    ValueError is thrown if the simplex matrix holds sympy expressions outside the objective row
+    """
+
+    tableau = get_dense_tableau(problem)
+    header = json.dumps(__create_header(problem, tableau), separators=(",", ":")).encode("utf-8")
+    data_offset = len(SNAPSHOT_MAGIC) + HEADER_LENGTH.size + len(header)
+    header += b" " * (-data_offset % ALIGNMENT)
+
+    chunks = [SNAPSHOT_MAGIC, HEADER_LENGTH.pack(len(header)), header,
+              np.ascontiguousarray(tableau.array, dtype=SNAPSHOT_DTYPE).tobytes()]
+    if tableau.m_row is not None:
+        chunks.append(np.ascontiguousarray(tableau.m_row, dtype=SNAPSHOT_DTYPE).tobytes())
+    return chunks
+
+def write_snapshot(problem: StandardProblem, file_path: str) -> None:
+    """
+    Save the standardized problem as a binary snapshot file
+
+    Parameters
+    ----------
+    problem : StandardProblem
+        Standardized LP problem to be saved. Big M values are only supported in the objective row
+    file_path : str
+        Path of the snapshot file. An existing file is replaced
+
+    Exceptions
+    ----------
+    ValueError is thrown if the simplex matrix holds sympy expressions outside the objective row
+    """
+
+    chunks = encode_snapshot(problem)
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file_path, "wb") as file:
+        file.writelines(chunks)
+
+def __read_header(read: Callable[[int, int], bytes], name: str) -> Tuple[Dict[str, Any], int]:
+    """
+    Reads the metadata header at the start of a snapshot and the offset of the tableau.
+    `read(offset, size)` reads the bytes of the snapshot at the offset
+    """
+    if read(0, len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+        raise ValueError(f"{name} is not a snapshot file.")
+    header_offset = len(SNAPSHOT_MAGIC) + HEADER_LENGTH.size
+    (header_length,) = HEADER_LENGTH.unpack(read(len(SNAPSHOT_MAGIC), HEADER_LENGTH.size))
+    header = json.loads(read(header_offset, header_length))
+    return header, header_offset + header_length
+
+def __create_problem(header: Dict[str, Any], data: np.ndarray, name: str) -> StandardProblem:
+    """
+    Creates the problem of the snapshot on the float64 values following the header
+    without copying them
+    """
+    shape = tuple(header["shape"])
+    size = shape[0] * shape[1]
+    expected_size = size + (shape[1] if header["has_m_row"] else 0)
+    if data.size != expected_size:
+        raise ValueError(f"{name} is a truncated snapshot file.")
+    array = data[:size].reshape(shape)
+    m_row = data[size:] if header["has_m_row"] else None
+
+    st_problem = StandardProblem(
+        matrix=DenseTableau.from_arrays(array, m_row),
+        basic_vars=header["basic_vars"],
+        n_decision_vars=header["n_decision_vars"],
+        n_artificials=header["n_artificials"],
+        is_max=header["is_max"],
+        var_name_list=header["variable_names"]
+    )
+    st_problem.update_feasible_status(header["feasibility"])
+    st_problem.update_optimal_status(header["optimal_status"])
+    st_problem.update_optimal_reachability_status(header["reachability_of_optimal"])
+    st_problem.set_num_alternates(header["n_alternates"])
+    st_problem.update_pivot_counts(header["n_iterations"], header["n_degenerate_pivots"])
+
+    return st_problem
+
+def decode_snapshot(buffer) -> StandardProblem:
+    """
+    Creates the standardized problem of a snapshot held in a buffer (such as a
+    `bytearray` or a `mmap.mmap`) without copying the tableau. The tableau is
+    writable only if the buffer is writable
+    """
+    view = memoryview(buffer)
+    header, data_offset = __read_header(lambda offset, size: bytes(view[offset:offset + size]), "buffer")
+    view.release()
+    data = np.frombuffer(buffer, dtype=SNAPSHOT_DTYPE, offset=data_offset)
+    return __create_problem(header, data, "buffer")
+
+def read_snapshot(file_path: str, mode: str = "r") -> StandardProblem:
+    """
+    Read the standardized problem from a binary snapshot file. The tableau is
+    memory-mapped from the file instead of being read, so large tableaus open
+    without reading the values until they are used
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the snapshot file
+    mode : str (default : "r") (Options : ["r","c","load"])
+        "r"    : Map the tableau read-only. The pages of the file are shared with other
+                 processes mapping the same snapshot. Pivoting the problem raises a
+                 ValueError, use `problem.copy()` to obtain a problem that can be solved
+        "c"    : Map the tableau copy-on-write. Changes are kept in memory and not
+                 written to the file
+        "load" : Read the tableau into memory
+
+    Returns
+    -------
+    StandardProblem object of the LP problem in the snapshot with a dense tableau
+    """
+
+    if mode not in SNAPSHOT_MODES:
+        raise ValueError(f"{mode} is an invalid argument for mode parameter.")
+
+    with open(file_path, "rb") as file:
+        def read(offset: int, size: int) -> bytes:
+            file.seek(offset)
+            return file.read(size)
+
+        header, data_offset = __read_header(read, file_path)
+        if mode == "load":
+            file.seek(data_offset)
+            data = np.fromfile(file, dtype=SNAPSHOT_DTYPE)
+    if mode != "load":
+        data = np.memmap(file_path, dtype=SNAPSHOT_DTYPE, mode=mode, offset=data_offset)
+
+    return __create_problem(header, data, file_path)
@@ -0,0 +1,305 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, Dict, Iterator, List, Tuple
+
+from elpee.datahandler.json_handler import problem_from_dict, problem_to_dict
+from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.settings import Settings
+
+# A trajectory file starts with the magic bytes followed by a frame for each record.
+# Each frame is the length and flags of its payload followed by the payload (a json
+# record, zlib compressed if flagged). A closed file ends with an index frame listing
+# the offsets and names of the records, followed by the trailer giving the offset of
+# the index frame. Files without the trailer (not closed) are read by scanning the frames.
+# A step saved again under the name of the last record (such as the final step saved
+# with its optimal status) replaces the last record
+TRAJECTORY_MAGIC = b"ELPTRJ1\n"
+TRAILER_MAGIC = b"ELPTRIDX"
+FRAME_HEADER = struct.Struct("<IB")
+TRAILER = struct.Struct("<Q8s")
+
+COMPRESSED_FLAG = 1
+INDEX_FLAG = 2
+
+class TrajectoryWriter():
+    """
+    Writer appending the steps of a solve to a single trajectory file. Records are
+    buffered and written in batches, optionally compressed with zlib. A record with
+    the name of the last record replaces it
+
+    Attributes
+    ----------
+    file_path : str
+        Path of the trajectory file
+    compress : bool
+        Whether the records are compressed with zlib
+    n_records : int
+        Number of records appended
+
+    Methods
+    -------
+    append(problem, step_name)
+        Appends the record of a step
+    flush()
+        Writes the buffered records to the file
+    close()
+        Writes the remaining records and the index footer
+    """
+
+    def __init__(self, file_path: str, compress: bool = False, flush_every: int = 16, settings: Settings = None):
+        """
+        Parameters
+        ----------
+        file_path : str
+            Path of the trajectory file. An existing file is replaced
+        compress : bool (default : False)
+            Compress the records with zlib
+        flush_every : int (default : 16)
+            Number of records buffered before they are written to the file
+        settings : Settings (default : None)
+            Settings giving the decimals of the saved expressions. Uses the current settings if None
+        """
+
+        if flush_every < 1:
+            raise ValueError(f"{flush_every} is an invalid argument for flush_every parameter.")
+
+        self.file_path = file_path
+        self.compress = compress
+        self.flush_every = flush_every
+        self.settings = settings
+        self.n_records = 0
+        self.__index = []
+        self.__pending = []
+        self.__offset = len(TRAJECTORY_MAGIC)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__file = open(file_path, "wb")
+        self.__file.write(TRAJECTORY_MAGIC)
+
+    def __write_frame(self, payload: bytes, flags: int) -> int:
+        """
+        Buffers a frame of the payload and returns its offset in the file
+        """
+        offset = self.__offset
+        self.__pending.append(FRAME_HEADER.pack(len(payload), flags))
+        self.__pending.append(payload)
+        self.__offset += FRAME_HEADER.size + len(payload)
+        return offset
+
+    def __rewind(self, offset: int) -> None:
+        """
+        Removes the frames from the offset to the end of the file. Frames still
+        buffered are dropped from the buffer, written frames are truncated
+        """
+        buffered_offset = self.__offset - sum(len(chunk) for chunk in self.__pending)
+        if offset >= buffered_offset:
+            size = self.__offset
+            while size > offset:
+                size -= len(self.__pending.pop())
+        else:
+            # the buffer is empty as the frames after the offset were written
+            self.__file.flush()
+            self.__file.seek(offset)
+            self.__file.truncate()
+        self.__offset = offset
+
+    def append_record(self, record: Dict[str, Any]) -> None:
+        """
+        Appends a json serializable record. The `step` of the record is used as its
+        name. A record with the name of the last record replaces it
+        """
+        step_name = record.get("step")
+        if self.__index and (step_name is not None) and (self.__index[-1][1] == step_name):
+            self.__rewind(self.__index.pop()[0])
+            self.n_records -= 1
+
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload)
+            flags |= COMPRESSED_FLAG
+        offset = self.__write_frame(payload, flags)
+        self.__index.append([offset, step_name])
+        self.n_records += 1
+        if len(self.__pending) >= 2 * self.flush_every:
+            self.flush()
+
+    def append(self, problem: StandardProblem, step_name: str) -> None:
+        """
+        Appends the record of a step of the solve
+
+        Parameters
+        ----------
+        problem : StandardProblem
+            Standardized LP problem after the step
+        step_name : str
+            Name of the step (such as "sol_step_1")
+        """
+        record = problem_to_dict(problem, self.settings)
+        record["step"] = step_name
+        self.append_record(record)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to the file
+        """
+        if self.__pending:
+            self.__file.write(b"".join(self.__pending))
+            self.__pending = []
+        self.__file.flush()
+
+    def close(self) -> None:
+        """
+        Writes the remaining records followed by the index footer and closes the file
+        """
+        if self.__file.closed:
+            return
+        index_offset = self.__write_frame(json.dumps(self.__index).encode("utf-8"), INDEX_FLAG)
+        self.__pending.append(TRAILER.pack(index_offset, TRAILER_MAGIC))
+        self.flush()
+        self.__file.close()
+
+    def __enter__(self) -> "TrajectoryWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class TrajectoryReader():
+    """
+    Reader of the steps saved to a trajectory file. Steps are read on demand using
+    the index footer, or by scanning the records of a file that was not closed
+
+    Attributes
+    ----------
+    file_path : str
+        Path of the trajectory file
+    step_names : List[str]
+        Names of the steps in the order they were saved
+
+    Methods
+    -------
+    read_record(position) -> dict
+        Reads the record of the step at the position
+    read_step(position) -> StandardProblem
+        Reads the problem of the step at the position
+    get(step_name) -> StandardProblem
+        Reads the problem of the last step saved with the name
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Parameters
+        ----------
+        file_path : str
+            Path of the trajectory file
+        """
+
+        self.file_path = file_path
+        with open(file_path, "rb") as file:
+            if file.read(len(TRAJECTORY_MAGIC)) != TRAJECTORY_MAGIC:
+                raise ValueError(f"{file_path} is not a trajectory file.")
+            index = self.__read_index(file)
+        self.__offsets = [offset for offset, _ in index]
+        self.step_names = [name for _, name in index]
+
+    def __read_index(self, file) -> List[Tuple[int, str]]:
+        """
+        Reads the index footer. The records are scanned if the file has no footer
+        """
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        if size >= len(TRAJECTORY_MAGIC) + TRAILER.size:
+            file.seek(size - TRAILER.size)
+            index_offset, magic = TRAILER.unpack(file.read(TRAILER.size))
+            if magic == TRAILER_MAGIC:
+                payload, _ = self.__read_frame(file, index_offset)
+                return [(offset, name) for offset, name in json.loads(payload)]
+
+        index = []
+        offset = len(TRAJECTORY_MAGIC)
+        while offset + FRAME_HEADER.size <= size:
+            file.seek(offset)
+            length, flags = FRAME_HEADER.unpack(file.read(FRAME_HEADER.size))
+            if offset + FRAME_HEADER.size + length > size:
+                # record only partly written
+                break
+            if not (flags & INDEX_FLAG):
+                index.append((offset, self.__decode(file.read(length), flags).get("step")))
+            offset += FRAME_HEADER.size + length
+        return index
+
+    def __read_frame(self, file, offset: int) -> Tuple[bytes, int]:
+        """
+        Reads the payload and flags of the frame at the offset
+        """
+        file.seek(offset)
+        length, flags = FRAME_HEADER.unpack(file.read(FRAME_HEADER.size))
+        return file.read(length), flags
+
+    def __decode(self, payload: bytes, flags: int) -> Dict[str, Any]:
+        """
+        Decodes the payload of a record
+        """
+        if flags & COMPRESSED_FLAG:
+            payload = zlib.decompress(payload)
+        return json.loads(payload)
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    def read_record(self, position: int) -> Dict[str, Any]:
+        """
+        Reads the record of the step at the position (negative positions count from the end)
+        """
+        with open(self.file_path, "rb") as file:
+            payload, flags = self.__read_frame(file, self.__offsets[position])
+        return self.__decode(payload, flags)
+
+    def read_step(self, position: int) -> StandardProblem:
+        """
+        Reads the problem of the step at the position (negative positions count from the end)
+        """
+        return problem_from_dict(self.read_record(position))
+
+    def get(self, step_name: str) -> StandardProblem:
+        """
+        Reads the problem of the last step saved with the name
+
+        Exceptions
+        ----------
+        KeyError is thrown if no step was saved with the name
+        """
+        for position in range(len(self.step_names) - 1, -1, -1):
+            if self.step_names[position] == step_name:
+                return self.read_step(position)
+        raise KeyError(step_name)
+
+    def __getitem__(self, position: int) -> StandardProblem:
+        return self.read_step(position)
+
+    def __iter__(self) -> Iterator[StandardProblem]:
+        for position in range(len(self)):
+            yield self.read_step(position)
+
+def read_trajectory(file_path: str) -> TrajectoryReader:
+    """
+    Open the trajectory file saved while solving a LP problem
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the trajectory file
+
+    Returns
+    -------
+    TrajectoryReader of the steps in the file
+    """
+    return TrajectoryReader(file_path)
@@ -1,17 +1,27 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import os
+import re
 import shutil
 from typing import Any
 from sympy import Symbol
 import yaml
 
+from elpee.datahandler.json_handler import problem_metadata
 from elpee.utils.printer import SimplexPrinter
 from elpee.utils.protocols.st_problem import StandardProblem
-from elpee.utils.utilities import convert_M_to_sympy, convert_sympy_to_text, get_basic_vars_names, get_column_list
+from elpee.utils.settings import Settings, get_settings
+from elpee.utils.utilities import convert_M_to_sympy, iter_text_rows
 
 M = Symbol('M')
+
+# libyaml based C emitter if PyYAML was built with libyaml
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# float reprs not read as yaml 1.1 floats: exponents without a dot, inf and nan
+YAML_FLOAT_FIXES = re.compile(r"(?<![\w.])(-?\d+)(e[+-]\d+)|(-?)\b(inf|nan)\b")
         
 # TODO part of the refactor of handlers
 
@@ -70,9 +80,46 @@ def __read_optional_configs(config: Any, property: str, default_value: Any):
     return value
 
 
-def write_yaml(problem:StandardProblem, yaml_path:str):
+def __fix_yaml_float(match) -> str:
+    """
+    Replaces a float repr matched by `YAML_FLOAT_FIXES` with the yaml 1.1 float
+    """
+    if match.group(4) is None:
+        return f"{match.group(1)}.0{match.group(2)}"
+    if match.group(4) == "nan":
+        return ".nan"
+    return f"{match.group(3)}.inf"
+
+def __format_yaml_row(row) -> str:
+    """
+    Formats a converted simplex matrix row as a yaml flow sequence. Rows of floats
+    are formatted with a single join of the float reprs
+    """
+    try:
+        text = ", ".join(map(float.__repr__, row))
+    except TypeError:
+        return ", ".join(map(__format_yaml_elem, row))
+    if ("e" in text) or ("n" in text):
+        text = YAML_FLOAT_FIXES.sub(__fix_yaml_float, text)
+    return text
+
+def __format_yaml_elem(elem) -> str:
+    """
+    Formats an element of a converted simplex matrix row as a yaml flow scalar
+    """
+    if isinstance(elem, str):
+        # json strings are valid double quoted yaml scalars
+        return json.dumps(elem)
+    if isinstance(elem, float):
+        return YAML_FLOAT_FIXES.sub(__fix_yaml_float, float.__repr__(elem))
+    return str(int(elem))
+
+def write_yaml(problem:StandardProblem, yaml_path:str, settings: Settings = None):
     """
-    Save the standardized problem configurations to yaml file 
+    Save the standardized problem configurations to yaml file. The configurations
+    other than the simplex matrix are written with the libyaml emitter if available,
+    followed by the rows of the simplex matrix converted and written one at a time
+    as flow sequences
 
     Parameters
     ----------
@@ -80,28 +127,21 @@ def write_yaml(problem:StandardProblem, yaml_path:str):
         Standardized LP problem to be saved into yaml file
     yaml_path : string
         File path of yaml file to be written 
+    settings : Settings (default : None)
+        Settings giving the decimals of the saved expressions. Uses the current settings if None
     """
 
-    data = {
-        "matrix": convert_sympy_to_text(problem.matrix),
-        "basic_vars": problem.basic_vars,
-        "basic_vars_names": get_basic_vars_names(problem),
-        "matrix_columns": get_column_list(problem),
-        "n_decision_vars": problem.n_decision_vars,
-        "n_artificials": problem.n_artificials,
-        "is_max": problem.is_max,
-        "variable_names": problem.var_name_list,
-        "feasibility": problem.is_feasible,
-        "optimal_status": problem.is_optimal,
-        "reachability_of_optimal": problem.is_optimal_reachable,
-        "n_alternates": problem.num_alternates
-    }
+    settings = settings if settings is not None else get_settings()
+    decimals = settings.get_decimals()
 
     # Save data to YAML file
     with open(yaml_path, 'w') as file:
-        yaml.dump(data, file)
+        yaml.dump(problem_metadata(problem), file, Dumper=YAML_DUMPER, sort_keys=False)
+        file.write("matrix:\n")
+        for row in iter_text_rows(problem, decimals):
+            file.write(f"- [{__format_yaml_row(row)}]\n")
 
-def print_lp_problem_from_yaml(yaml_path:str, show_interpreter: bool=True) -> None:
+def print_lp_problem_from_yaml(yaml_path:str, show_interpreter: bool=True, settings: Settings = None) -> None:
     """
     A function to print the StandardProblem from the yaml to command terminal
 
@@ -111,9 +151,11 @@ def print_lp_problem_from_yaml(yaml_path:str, show_interpreter: bool=True) -> No
         File path to the yaml file containing LP problem to be read   
     show_interpreter : bool (default = True)
         Provides interpretation of values in simplex table when True
+    settings : Settings (default : None)
+        Settings giving the decimals and cell width. Uses the current settings if None
     """
 
     problem = read_yaml(yaml_path)
 
-    printer = SimplexPrinter(show_interpret=show_interpreter)
+    printer = SimplexPrinter(show_interpret=show_interpreter, settings=settings)
     printer.print_simplex_table_cli(problem)
\ No newline at end of file
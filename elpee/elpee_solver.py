@@ -1,14 +1,65 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Literal, Union
+import asyncio
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Generator, Iterable, Iterator, List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
 
 from elpee.algorithms.all_stack_starter import AllStackStarter
-from elpee.datahandler.data_handler import save_file
+from elpee.algorithms.batch_simplex import BatchSimplexSolver
+from elpee.algorithms.pricing import PricingRule
+from elpee.algorithms.revised_simplex import RevisedSimplexSolver
+from elpee.utils.async_steps import AsyncSolveSteps
+from elpee.utils.events import EventsOption, get_event_sink
+from elpee.utils.solve_session import SolveSession
+from elpee.utils.protocols.handler import DataHandler
 from elpee.utils.protocols.lp_problem import LinearProblem
+from elpee.utils.protocols.solve_step import SolveStep, run_steps
 from elpee.utils.protocols.st_problem import StandardProblem
 from elpee.utils.printer import SimplexPrinter
+from elpee.utils.settings import Settings, get_settings
 
+# options of ElpeeSolver.solve controlling the output, which are not used by the batch solver
+OUTPUT_OPTIONS = ('show_steps', 'show_interpret', 'file_format', 'freq', 'file_path', 'compress', 'background_save')
+
+class BatchResult(NamedTuple):
+    """
+    Result of a problem solved by `ElpeeSolver.solve_many`. `solution` is None and
+    `error` holds the exception raised if the problem could not be solved
+    """
+    index: int
+    solution: Optional[StandardProblem]
+    error: Optional[BaseException]
+
+def __picklable_error(error: BaseException) -> BaseException:
+    """
+    Returns the error raised in a worker process, replaced by a RuntimeError of
+    its description when it cannot be sent back to the main process
+    """
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+def _solve_chunk(chunk: List[Tuple[int, Union[StandardProblem, LinearProblem]]], options: dict) -> List[BatchResult]:
+    """
+    Solves a chunk of the problems of a batch in a worker process. Nothing is
+    displayed and the events are ignored unless an `events` sink is given.
+    Errors are returned with the problem instead of being raised
+    """
+    results = []
+    for index, lp_problem in chunk:
+        try:
+            solution = ElpeeSolver.solve(lp_problem, show_steps=False, show_interpret=False, **options)
+            results.append(BatchResult(index, solution, None))
+        except Exception as error:
+            results.append(BatchResult(index, None, __picklable_error(error)))
+    return results
 
 class ElpeeSolver():
     """
@@ -18,6 +69,16 @@ class ElpeeSolver():
     -------
     solve() -> elpee.StandardProblem
         Solves the given LP problem under defined configurations
+    solve_many() -> Iterator[BatchResult]
+        Solves a batch of LP problems in a pool of processes
+    solve_batch() -> List[elpee.StandardProblem]
+        Solves a batch of same shape LP problems in lockstep
+    solve_async() -> elpee.StandardProblem
+        Solves the given LP problem without blocking the event loop
+    iter_steps_async() -> AsyncSolveSteps
+        Asynchronous iterator over the steps solving the given LP problem
+    iter_steps() -> SolveSession
+        Session solving the given LP problem one step at a time
     """
 
     @classmethod
@@ -27,8 +88,20 @@ class ElpeeSolver():
         single_iter : bool = False, 
         show_steps : bool =True, 
         show_interpret : bool =True,
-        file_format: Literal['json', 'yaml', None] = None,
-        freq: Literal['all','final', None] = None) -> StandardProblem:
+        file_format: Literal['json', 'yaml', 'trajectory', 'history', None] = None,
+        freq: Literal['all','final', None] = None,
+        backend: Literal['list', 'dense', 'sparse', 'revised'] = 'list',
+        pricing: Union[Literal['dantzig', 'partial', 'multiple', 'devex', 'steepest-edge', 'bland'], PricingRule] = 'dantzig',
+        max_iterations: int = None,
+        anti_cycling: Literal['bland', 'lexicographic', None] = 'bland',
+        perturbation: float = 0.0,
+        seed: int = None,
+        warm_start: Union[List[str], StandardProblem, None] = None,
+        events: EventsOption = None,
+        settings: Settings = None,
+        file_path: str = None,
+        compress: bool = False,
+        background_save: bool = False) -> StandardProblem:
         """
         Apply the Linear Programming solution methods to solve a given problem.
 
@@ -42,8 +115,14 @@ class ElpeeSolver():
             Display all iterations occurring in the simplex matrix
         show_interpret : bool (default : True)
             Display the interpretation of the solution at each iteration
-        file_format : `str` (default : `None`) (Options : ["yaml","json",`None`]) 
-            Save the steps on solution in `json` or `yaml` file formats if provided
+        file_format : `str` (default : `None`) (Options : ["yaml","json","trajectory","history",`None`]) 
+            Save the steps on solution if provided. Expected options are
+            "json" | "yaml" : Save each step as a file in the `solution` folder
+            "trajectory"    : Append the steps to a single trajectory file read with 
+                              `elpee.datahandler.trajectory_handler.read_trajectory`
+            "history"       : Save the pivots of the steps with periodic checkpoints to 
+                              a single history file read with 
+                              `elpee.datahandler.history_handler.read_history`
         freq : str (default : None) (Options : ["all","final",`None`]) 
             Save the steps in the solved LP problem. The freuency is 
             overidden to None if the file_format is `None`. The frequency 
@@ -52,6 +131,67 @@ class ElpeeSolver():
             "all"   : For saving all steps
             "final" : For saving final result only
             None    : No saving
+        backend : str (default : "list") (Options : ["list","dense","sparse","revised"])
+            Storage used for the simplex matrix while solving. Expected options are
+            "list"    : Python list of lists simplex matrix
+            "dense"   : numpy array backed tableau with vectorized row operations
+            "sparse"  : sparse tableau storing only nonzero entries. Pivots only 
+                        update the nonzero entries of the affected rows
+            "revised" : Revised simplex method on a factorized basis. Only the final 
+                        simplex matrix is displayed and saved
+        pricing : str | `elpee.algorithms.pricing.PricingRule` (default : "dantzig") 
+            (Options : ["dantzig","partial","multiple","devex","steepest-edge","bland"])
+            Pricing rule used to select the entering variable. Expected options are
+            "dantzig"       : Largest improving coefficient of the objective row
+            "partial"       : Largest improving coefficient within blocks of columns
+            "multiple"      : Partial pricing retaining the best columns of a block 
+                              for the following iterations
+            "devex"         : Largest reduced cost relative to Devex reference weights
+            "steepest-edge" : Largest reduced cost relative to the exact norm of the edge
+            "bland"         : Improving column with the smallest index
+            Not used by the "revised" backend
+        max_iterations : int (default : None)
+            Limit on the number of pivots. Defaults to 50 times the size of the 
+            simplex table. The solve stops as not reaching the optimal solution 
+            once the limit is reached
+        anti_cycling : str (default : "bland") (Options : ["bland","lexicographic",None])
+            Rule switched to when a basis is repeated (the method is cycling 
+            through degenerate pivots). Expected options are
+            "bland"         : Bland's rule for both the entering and leaving variables
+            "lexicographic" : Lexicographic tie breaking of the ratio test
+            None            : Stop optimizing when cycling is detected
+            Not used by the "revised" backend
+        perturbation : float (default : 0.0)
+            Relative bound of a random perturbation of the solution values used 
+            to avoid degenerate pivots. Removed before the solution is returned. 
+            Not used if 0 or by the "revised" backend
+        seed : int (default : None)
+            Seed of the random perturbation
+        warm_start : `List[str]` | `elpee.StandardProblem` (default : None)
+            Basis to start solving from, given as the names of the basic variables 
+            (from `StandardProblem.export_basis()`) or a previously solved problem. 
+            The simplex matrix is pivoted onto the basis and solving continues with 
+            primal simplex steps if the basis is feasible, else with dual simplex steps
+        events : `elpee.utils.events.EventSink` | `logging.Logger` | Callable (default : None)
+            Sink receiving the messages of the solve (such as the entering and leaving 
+            variables or the status of the solution). A `logging.Logger` is written to 
+            with a `LoggingSink` and a function is called with each `SolverEvent`. If 
+            None, the messages are printed when show_steps or show_interpret is set 
+            and nothing is formatted or printed otherwise
+        settings : `elpee.utils.settings.Settings` (default : None)
+            Settings of the solve (decimals, cell width, tolerances and output policy). 
+            Uses the settings of the current context (set with `use_settings`) if None. 
+            The events sink of the settings is used if events is None
+        file_path : str (default : None)
+            Path of the trajectory or history file. Defaults to "solution.elpt" for 
+            trajectory files and "solution.elph" for history files
+        compress : bool (default : False)
+            Compress the records of the trajectory file or the checkpoints of the 
+            history file with zlib
+        background_save : bool (default : False)
+            Save the steps in a background thread while the solve continues. Snapshots 
+            of the steps are queued (the solve waits once 8 steps are queued) and an 
+            error of saving a step is raised once the solve ends
 
         Return
         ------
@@ -60,25 +200,338 @@ class ElpeeSolver():
         if the problem cannot be optimized. 
         """
 
+        settings = settings if settings is not None else get_settings()
+        return run_steps(self.__iter_solve(lp_problem, single_iter, show_steps, show_interpret, file_format, freq, backend,
+                                           pricing, max_iterations, anti_cycling, perturbation, seed, warm_start, events,
+                                           settings, file_path, compress, background_save))
+
+    @classmethod
+    def __iter_solve(self, lp_problem, single_iter, show_steps, show_interpret, file_format, freq, backend,
+                     pricing, max_iterations, anti_cycling, perturbation, seed, warm_start, events=None,
+                     settings=None, file_path=None, compress=False, background_save=False,
+                     include_tableau=False) -> Generator[SolveStep, None, StandardProblem]:
+        """
+        Generator applying the steps of `solve` with the same parameters. Yields a 
+        `SolveStep` record after each step of the all stack starting method and 
+        returns the solved problem. The "revised" backend is solved in a single step
+        """
+
         if file_format == None:  # if file format not given
             freq = None             # do not save solutions
         elif freq == None:       # else if file format was given but freq given as None 
             freq = "all"            # update freq to be all
         
+        if backend not in ["list", "dense", "sparse", "revised"]:
+            raise ValueError(f"{backend} is an invalid argument for backend parameter.")
+        settings = settings if settings is not None else get_settings()
+        if settings.silent:
+            show_steps, show_interpret = False, False
+        events = get_event_sink(events if events is not None else settings.events, verbose=(show_steps or show_interpret))
+
         # convert the LinearProblem object to StandardProblem
         if isinstance(lp_problem, LinearProblem):
-            lp_problem = lp_problem.standardize_problem()
+            lp_problem = lp_problem.standardize_problem(sparse=(backend == "sparse"))
+
+        if backend == "dense":
+            lp_problem.use_dense_tableau()
+        elif backend == "sparse":
+            lp_problem.use_sparse_tableau()
+
+        if warm_start is not None:
+            lp_problem.apply_basis(warm_start, pivot_tolerance=settings.pivot_tolerance, events=events)
+
+        if (backend == "revised") and (freq == "all"):
+            # only the final simplex matrix of the revised simplex method is saved
+            freq = "final"
+        data_handler = DataHandler(file_format=file_format, freq=freq, file_path=file_path, compress=compress,
+                                   settings=settings, background=background_save)
+        try:
+            if backend == "revised":
+                lp_solution = RevisedSimplexSolver(lp_problem, tolerance=settings.primal_tolerance, max_iterations=max_iterations,
+                                                   settings=settings).solver(show_steps=show_steps, show_interpret=show_interpret, events=events)
+            else:
+                # configure all stack starter method to solve problem
+                solver_app = AllStackStarter(lp_problem, pricing=pricing, primal_tolerance=settings.primal_tolerance,
+                                             pivot_tolerance=settings.pivot_tolerance, max_iterations=max_iterations,
+                                             anti_cycling=anti_cycling, perturbation=perturbation, seed=seed,
+                                             dual_tolerance=settings.dual_tolerance, settings=settings)
+
+                lp_solution = yield from solver_app.iter_solver(do_step=single_iter, show_steps=show_steps, 
+                                                                show_interpret=show_interpret, include_tableau=include_tableau,
+                                                                events=events, data_handler=data_handler)
+
+            if show_steps and not show_interpret:
+                # interpret the final solution once when the steps were displayed without interpretation
+                SimplexPrinter(settings=settings).interpret_problem(lp_solution)
+
+            if freq == "final":
+                data_handler.save_step(lp_solution, "final_sol")
+        finally:
+            # complete the saved steps even if the solve is stopped early
+            data_handler.close()
+
+        return lp_solution
+
+    @classmethod
+    def __get_step_parameters(self, options: dict) -> dict:
+        """
+        Completes the options of `solve` given to the step by step solvers with the
+        defaults of `solve`, without displaying the steps unless requested
+        """
+
+        parameters = dict(single_iter=False, show_steps=False, show_interpret=False, file_format=None, freq=None,
+                          backend='list', pricing='dantzig', max_iterations=None, anti_cycling='bland',
+                          perturbation=0.0, seed=None, warm_start=None, events=None, settings=None,
+                          file_path=None, compress=False, background_save=False)
+        for option in options:
+            if (option not in parameters) or (option == 'single_iter'):
+                raise TypeError(f"{option} is an invalid option for solving step by step")
+        parameters.update(options)
+        # the steps may be applied in another context, such as an executor thread
+        if parameters['settings'] is None:
+            parameters['settings'] = get_settings()
+        return parameters
+
+    @classmethod
+    def iter_steps(
+        self,
+        lp_problem: Union[StandardProblem, LinearProblem],
+        include_tableau: bool = False,
+        **options) -> SolveSession:
+        """
+        Start a session solving a given problem one step at a time. The solver, 
+        printer and saving set up are kept alive between the steps, which are 
+        applied only when requested from the session (`for step in session`, 
+        `session.step()` or `session.run()`).
+
+        Parameters
+        ---------
+        lp_problem : `elpee.LinearProblem` | `elpee.StandardProblem`
+            LP problem to be solved 
+        include_tableau : bool (default : False)
+            Include the simplex matrix after each step in the `SolveStep` records. 
+            The matrix being solved is given (not a copy), so it changes with the 
+            following steps
+        **options
+            Options of `ElpeeSolver.solve` other than single_iter. show_steps and 
+            show_interpret default to False
 
-        # configure all stack starter method to solve problem
-        solver_app = AllStackStarter(lp_problem)
+        Return
+        ------
+        `elpee.SolveSession` applying the steps on demand
+        """
+
+        parameters = self.__get_step_parameters(options)
+        return SolveSession(self.__iter_solve(lp_problem, include_tableau=include_tableau, **parameters))
+
+    @classmethod
+    def solve_many(
+        self,
+        lp_problems: Iterable[Union[StandardProblem, LinearProblem]],
+        processes: int = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+        **options) -> Iterator[BatchResult]:
+        """
+        Solve a batch of LP problems across a pool of processes. Problems are sent
+        to the workers in chunks, and only a few chunks per worker are pending at a
+        time, so an iterator of problems is consumed as the batch is solved.
 
-        lp_solution = solver_app.solver(do_step=single_iter, show_steps=show_steps, show_interpret=show_interpret, 
-                                        file_format=file_format, freq=freq)
+        Nothing is printed or saved by the workers, and an error raised while
+        solving a problem is returned in its result without stopping the batch.
 
-        if not (show_interpret):
-            SimplexPrinter().interpret_problem(lp_solution)
+        Parameters
+        ---------
+        lp_problems : `Iterable[elpee.LinearProblem | elpee.StandardProblem]`
+            LP problems to be solved
+        processes : int (default : None)
+            Number of worker processes. Defaults to the number of CPUs
+        chunksize : int (default : 1)
+            Number of problems sent to a worker at a time. Larger chunks reduce 
+            the overhead of solving many small problems
+        ordered : bool (default : True)
+            Yield the results in the order of the problems. Else yield the results 
+            as the chunks are completed
+        **options
+            Options of `ElpeeSolver.solve` used for every problem (such as backend, 
+            pricing or max_iterations) other than the display and saving options. 
+            The settings of the current context are sent to the workers unless a 
+            settings option is given
 
-        if (freq == "final") & (file_format != None):
-            save_file(lp_solution, file_format=file_format, file_path=f"solution/final_sol.{file_format}")
+        Return
+        ------
+        Iterator of `BatchResult(index, solution, error)` for each problem, where index 
+        is the position of the problem in lp_problems
+
+        Exceptions
+        ----------
+        ValueError is thrown for invalid processes or chunksize values or if display 
+        or saving options are given
+        """
+
+        if (processes is not None) and (processes < 1):
+            raise ValueError(f"{processes} is an invalid argument for processes parameter.")
+        if chunksize < 1:
+            raise ValueError(f"{chunksize} is an invalid argument for chunksize parameter.")
+        for option in OUTPUT_OPTIONS:
+            if option in options:
+                raise ValueError(f"{option} cannot be used when solving a batch of problems.")
+
+        processes = processes or os.cpu_count() or 1
+        # the workers solve with the settings of the current context
+        if options.get('settings') is None:
+            options['settings'] = get_settings()
+        problems = enumerate(lp_problems)
+        chunks = iter(lambda: list(islice(problems, chunksize)), [])
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = deque()
+            def submit(n_chunks: int) -> None:
+                for chunk in islice(chunks, n_chunks):
+                    future = executor.submit(_solve_chunk, chunk, options)
+                    future.indices = [index for index, _ in chunk]
+                    pending.append(future)
+
+            submit(2 * processes)
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+
+                for future in done:
+                    try:
+                        results = future.result()
+                    except Exception as error:
+                        # the worker process failed, so the whole chunk is not solved
+                        results = [BatchResult(index, None, error) for index in future.indices]
+                    yield from results
+                submit(len(done))
+
+    @classmethod
+    def solve_batch(
+        self,
+        lp_problems: Sequence[Union[StandardProblem, LinearProblem]],
+        max_iterations: int = None,
+        anti_cycling: Literal['bland', None] = 'bland',
+        settings: Settings = None) -> List[StandardProblem]:
+        """
+        Solve a batch of LP problems with simplex matrices of the same shape (such
+        as problems differing only in their coefficients) in lockstep. The simplex 
+        matrices are stacked into a 3-D array and each step of the all stack starting 
+        method is applied to all problems at once, using the "dense" backend steps 
+        with the "dantzig" pricing rule. Nothing is printed or saved.
+
+        Parameters
+        ---------
+        lp_problems : `Sequence[elpee.LinearProblem | elpee.StandardProblem]`
+            LP problems to be solved. Problems given as `elpee.StandardProblem` 
+            objects are not changed
+        max_iterations : int (default : None)
+            Limit on the number of pivots of each problem. Defaults to 50 times the 
+            size of the simplex table
+        anti_cycling : str (default : "bland") (Options : ["bland",None])
+            Rule switched to when a basis is repeated. Expected options are
+            "bland" : Bland's rule for both the entering and leaving variables
+            None    : Stop optimizing when cycling is detected
+        settings : `elpee.utils.settings.Settings` (default : None)
+            Settings giving the tolerances and decimals of the solve. Uses the 
+            settings of the current context if None
+
+        Return
+        ------
+        List of `elpee.StandardProblem` objects after optimizing, in the order of 
+        lp_problems. Will contain suboptimal or infeasible `elpee.StandardProblem` 
+        objects for the problems that cannot be optimized.
+
+        Exceptions
+        ----------
+        ValueError is thrown when the simplex matrices do not have the same shape
+        """
+
+        settings = settings if settings is not None else get_settings()
+        return BatchSimplexSolver(lp_problems, primal_tolerance=settings.primal_tolerance,
+                                  pivot_tolerance=settings.pivot_tolerance, max_iterations=max_iterations,
+                                  anti_cycling=anti_cycling, decimals=settings.get_decimals()).solver()
+
+    @classmethod
+    def iter_steps_async(
+        self,
+        lp_problem: Union[StandardProblem, LinearProblem],
+        yield_every: int = 10,
+        offload: bool = False,
+        executor: Executor = None,
+        **options) -> AsyncSolveSteps:
+        """
+        Create an asynchronous iterator over the steps solving a given problem. 
+        Steps are applied in chunks of `yield_every` steps, giving control back to 
+        the event loop between chunks. A `SolveStep` record (phase, iteration, 
+        entering, leaving, objective_value) is produced for each step and the solved 
+        problem is set as the `solution` of the iterator once all steps are applied.
+
+        Parameters
+        ---------
+        lp_problem : `elpee.LinearProblem` | `elpee.StandardProblem`
+            LP problem to be solved 
+        yield_every : int (default : 10)
+            Number of steps applied before giving control back to the event loop
+        offload : bool (default : False)
+            Apply the steps in an executor so the event loop is never blocked
+        executor : `concurrent.futures.Executor` (default : None)
+            Thread based executor used when the steps are offloaded. Uses the 
+            default executor of the event loop if None
+        **options
+            Options of `ElpeeSolver.solve` other than single_iter. show_steps and 
+            show_interpret default to False
+
+        Return
+        ------
+        `elpee.utils.async_steps.AsyncSolveSteps` iterator over the steps
+        """
+
+        return AsyncSolveSteps(self.__iter_solve(lp_problem, **self.__get_step_parameters(options)),
+                               yield_every=yield_every, offload=offload, executor=executor)
+
+    @classmethod
+    async def solve_async(
+        self,
+        lp_problem: Union[StandardProblem, LinearProblem],
+        yield_every: int = 10,
+        offload: bool = False,
+        executor: Executor = None,
+        timeout: float = None,
+        **options) -> StandardProblem:
+        """
+        Solve a given problem without blocking the event loop. Control is given back 
+        to the event loop every `yield_every` steps, or the steps are applied in an 
+        executor when offloaded. Cancelling the awaiting task stops the solve before 
+        its next step.
+
+        Parameters
+        ---------
+        lp_problem : `elpee.LinearProblem` | `elpee.StandardProblem`
+            LP problem to be solved 
+        yield_every : int (default : 10)
+            Number of steps applied before giving control back to the event loop
+        offload : bool (default : False)
+            Apply the steps in an executor so the event loop is never blocked
+        executor : `concurrent.futures.Executor` (default : None)
+            Thread based executor used when the steps are offloaded. Uses the 
+            default executor of the event loop if None
+        timeout : float (default : None)
+            Seconds allowed for the solve. `asyncio.TimeoutError` is raised and 
+            the solve is stopped once exceeded
+        **options
+            Options of `ElpeeSolver.solve` other than single_iter. show_steps and 
+            show_interpret default to False
+
+        Return
+        ------
+        `elpee.StandardProblem` object after optimizing as returned by `ElpeeSolver.solve`
+        """
 
-        return lp_solution
\ No newline at end of file
+        steps = self.iter_steps_async(lp_problem, yield_every=yield_every, offload=offload,
+                                      executor=executor, **options)
+        return await asyncio.wait_for(steps.run(), timeout)
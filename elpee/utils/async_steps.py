@@ -0,0 +1,122 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Executor
+from typing import Generator, List
+
+from elpee.utils.protocols.solve_step import SolveStep
+from elpee.utils.protocols.st_problem import StandardProblem
+
+class AsyncSolveSteps():
+    """
+    Asynchronous iterator over the steps of a solve. The steps are applied in
+    chunks of `yield_every` steps, giving control back to the event loop between
+    chunks, either on the event loop or offloaded to an executor.
+
+    Cancelling the task iterating the steps (such as on a timeout) stops the solve
+    before its next step.
+
+    Attributes
+    ----------
+    solution : elpee.StandardProblem | None
+        Solved problem once all steps are applied
+    done : bool
+        Whether all steps of the solve are applied
+
+    Methods
+    -------
+    run() -> elpee.StandardProblem
+        Applies all remaining steps and returns the solved problem
+    aclose()
+        Stops the solve before its next step
+    """
+
+    def __init__(self, steps: Generator[SolveStep, None, StandardProblem], yield_every: int = 10,
+                 offload: bool = False, executor: Executor = None):
+        """
+        Parameters
+        ----------
+        steps : Generator[SolveStep, None, elpee.StandardProblem]
+            Steps of the solve returning the solved problem
+        yield_every : int (default : 10)
+            Number of steps applied before giving control back to the event loop
+        offload : bool (default : False)
+            Apply the steps in an executor instead of on the event loop
+        executor : concurrent.futures.Executor (default : None)
+            Thread based executor used to apply the steps when offloaded. Uses the
+            default executor of the event loop if None
+        """
+
+        if yield_every < 1:
+            raise ValueError(f"{yield_every} is an invalid argument for yield_every parameter.")
+
+        self.solution = None
+        self.done = False
+        self.__steps = steps
+        self.__yield_every = yield_every
+        self.__offload = offload
+        self.__executor = executor
+        self.__pending = deque()
+        self.__cancelled = threading.Event()
+
+    def __apply_steps(self) -> List[SolveStep]:
+        """
+        Applies the next chunk of steps. Stops the solve if it was cancelled
+        """
+        steps = []
+        for _ in range(self.__yield_every):
+            if self.__cancelled.is_set():
+                self.__steps.close()
+                break
+            try:
+                steps.append(next(self.__steps))
+            except StopIteration as stop:
+                self.solution = stop.value
+                self.done = True
+                break
+        return steps
+
+    def __cancel(self) -> None:
+        """
+        Stops the solve. Offloaded steps stop once the running chunk reaches its next step
+        """
+        self.__cancelled.set()
+        if not self.__offload:
+            self.__steps.close()
+
+    def __aiter__(self) -> "AsyncSolveSteps":
+        return self
+
+    async def __anext__(self) -> SolveStep:
+        while not self.__pending:
+            if self.done or self.__cancelled.is_set():
+                raise StopAsyncIteration
+            try:
+                if self.__offload:
+                    loop = asyncio.get_running_loop()
+                    steps = await loop.run_in_executor(self.__executor, self.__apply_steps)
+                else:
+                    await asyncio.sleep(0)
+                    steps = self.__apply_steps()
+            except asyncio.CancelledError:
+                self.__cancel()
+                raise
+            self.__pending.extend(steps)
+        return self.__pending.popleft()
+
+    async def run(self) -> StandardProblem:
+        """
+        Applies all remaining steps and returns the solved problem
+        """
+        async for _ in self:
+            pass
+        return self.solution
+
+    async def aclose(self) -> None:
+        """
+        Stops the solve before its next step
+        """
+        self.__cancel()
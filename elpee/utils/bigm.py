@@ -0,0 +1,145 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from numbers import Real
+
+# M coefficients smaller than the tolerance are treated as zero
+M_COEFF_TOLERANCE = 1e-9
+
+def make_big_m(constant, m_coeff):
+    """
+    Creates the numeric value `constant + m_coeff*M`
+    Returns a plain number when the M coefficient is zero
+    """
+    if abs(m_coeff) <= M_COEFF_TOLERANCE:
+        return constant
+    return BigMValue(constant, m_coeff)
+
+def split_big_m(value):
+    """
+    Splits the value into the pair (constant, M coefficient)
+    """
+    if isinstance(value, BigMValue):
+        return value.constant, value.m_coeff
+    return value, 0
+
+class BigMValue():
+    """
+    Class to represent a big M value `constant + m_coeff*M` numerically as
+    a pair of numbers. Values are compared lexicographically by the M
+    coefficient first and the constant next, which is exact for any
+    arbitrarily large M.
+
+    Attributes
+    ----------
+    constant : `float`
+        real valued part of the value
+    m_coeff : `float`
+        coefficient of M in the value
+    """
+
+    __slots__ = ('constant', 'm_coeff')
+
+    def __init__(self, constant = 0, m_coeff = 1):
+        self.constant = constant
+        self.m_coeff = m_coeff
+
+    def __key(self, other):
+        """
+        Obtain the lexicographic keys of both values for comparisons
+        """
+        other_constant, other_m_coeff = split_big_m(other)
+        return (self.m_coeff, self.constant), (other_m_coeff, other_constant)
+
+    def __add__(self, other):
+        if not isinstance(other, (BigMValue, Real)):
+            return NotImplemented
+        other_constant, other_m_coeff = split_big_m(other)
+        return make_big_m(self.constant + other_constant, self.m_coeff + other_m_coeff)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return BigMValue(-self.constant, -self.m_coeff)
+
+    def __sub__(self, other):
+        if not isinstance(other, (BigMValue, Real)):
+            return NotImplemented
+        other_constant, other_m_coeff = split_big_m(other)
+        return make_big_m(self.constant - other_constant, self.m_coeff - other_m_coeff)
+
+    def __rsub__(self, other):
+        if not isinstance(other, Real):
+            return NotImplemented
+        return make_big_m(other - self.constant, -self.m_coeff)
+
+    def __mul__(self, other):
+        if not isinstance(other, Real):
+            # product of two big M values would contain M^2 terms
+            return NotImplemented
+        return make_big_m(self.constant * other, self.m_coeff * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Real):
+            return NotImplemented
+        return make_big_m(self.constant / other, self.m_coeff / other)
+
+    def __abs__(self):
+        return -self if self < 0 else self
+
+    def __round__(self, ndigits = None):
+        return make_big_m(round(self.constant, ndigits), round(self.m_coeff, ndigits))
+
+    def __eq__(self, other):
+        if not isinstance(other, (BigMValue, Real)):
+            return NotImplemented
+        own_key, other_key = self.__key(other)
+        return own_key == other_key
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        if not isinstance(other, (BigMValue, Real)):
+            return NotImplemented
+        own_key, other_key = self.__key(other)
+        return own_key < other_key
+
+    def __le__(self, other):
+        if not isinstance(other, (BigMValue, Real)):
+            return NotImplemented
+        own_key, other_key = self.__key(other)
+        return own_key <= other_key
+
+    def __gt__(self, other):
+        if not isinstance(other, (BigMValue, Real)):
+            return NotImplemented
+        own_key, other_key = self.__key(other)
+        return own_key > other_key
+
+    def __ge__(self, other):
+        if not isinstance(other, (BigMValue, Real)):
+            return NotImplemented
+        own_key, other_key = self.__key(other)
+        return own_key >= other_key
+
+    def __hash__(self):
+        if self.m_coeff == 0:
+            return hash(self.constant)
+        return hash((self.constant, self.m_coeff))
+
+    def __str__(self):
+        m_term = f"{self.m_coeff}*M"
+        if self.constant == 0:
+            return m_term
+        if (self.m_coeff < 0) & (self.constant > 0):
+            return f"{self.constant} - {-self.m_coeff}*M"
+        if self.constant < 0:
+            return f"{m_term} - {-self.constant}"
+        return f"{m_term} + {self.constant}"
+
+    def __repr__(self):
+        return f"BigMValue({self.constant!r}, {self.m_coeff!r})"
@@ -0,0 +1,60 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Tuple
+
+import numpy as np
+
+# coefficient matrix in the coordinate format as (rows, cols, values, number of rows)
+CooArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, int]
+
+def as_vector(values, name: str, size: int = None) -> np.ndarray:
+    """
+    Converts an array like (including objects exposing the buffer protocol)
+    into a 1 dimensional float64 array of the expected size
+    """
+    vector = np.asarray(values, dtype=np.float64).ravel()
+    if (size is not None) and (vector.size != size):
+        raise ValueError(f"{name} must have {size} values. Received {vector.size} values.")
+    return vector
+
+def as_coo_arrays(matrix, n_cols: int, name: str) -> CooArrays:
+    """
+    Converts a dense array like (including objects exposing the buffer protocol)
+    or a sparse matrix providing `tocoo()` (such as the scipy sparse matrices)
+    into the nonzero entries in the coordinate format. Repeated entries of a
+    sparse matrix are kept and summed when the matrix is used
+    """
+    if hasattr(matrix, 'tocoo'):
+        coo = matrix.tocoo()
+        n_rows, n_matrix_cols = coo.shape
+        rows = np.asarray(coo.row, dtype=np.int64)
+        cols = np.asarray(coo.col, dtype=np.int64)
+        values = np.asarray(coo.data, dtype=np.float64)
+    else:
+        dense = np.asarray(matrix, dtype=np.float64)
+        if dense.ndim == 1:
+            dense = dense.reshape(1, -1)
+        if dense.ndim != 2:
+            raise ValueError(f"{name} must be 2 dimensional. Received {dense.ndim} dimensions.")
+        n_rows, n_matrix_cols = dense.shape
+        rows, cols = np.nonzero(dense)
+        values = dense[rows, cols]
+
+    if n_matrix_cols != n_cols:
+        raise ValueError(f"{name} must have {n_cols} columns (one per variable). Received {n_matrix_cols} columns.")
+    nonzero = values != 0
+    return rows[nonzero], cols[nonzero], values[nonzero], n_rows
+
+def sum_duplicates(rows: np.ndarray, cols: np.ndarray, values: np.ndarray,
+                   n_cols: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sums the repeated entries of a coefficient matrix in the coordinate format.
+    Entries are returned sorted by row and then by column, dropping the entries
+    summing to zero
+    """
+    keys, inverse = np.unique(rows * n_cols + cols, return_inverse=True)
+    summed = np.bincount(inverse, weights=values, minlength=keys.size)
+    nonzero = summed != 0
+    keys = keys[nonzero]
+    return keys // n_cols, keys % n_cols, summed[nonzero]
@@ -1,7 +1,7 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Literal
+from typing import Any, Dict, Literal
 import yaml
 from pathlib import Path
 CONFIG_FILE = Path(__file__).parent / "configs.yaml"
@@ -9,18 +9,61 @@ CONFIG_FILE = Path(__file__).parent / "configs.yaml"
 DEFAULT_DECIMAL_SIZE = 2
 DEFAULT_CELL_WIDTH = 13
 
+# configuration settings parsed from CONFIG_FILE with the modification time of the file
+__cached_config = (None, None)
+
+def __get_cached_config() -> Dict[str, Any]:
+    """
+    Obtains the cached configuration settings. The file is parsed again only
+    when its modification time changed since it was cached
+    """
+    global __cached_config
+
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found at {CONFIG_FILE}")
+
+    cached_mtime, config = __cached_config
+    if (config is None) or (cached_mtime != mtime):
+        with open(CONFIG_FILE, "r") as file:
+            config = yaml.safe_load(file)
+        __cached_config = (mtime, config)
+    return config
+
+def clear_config_cache():
+    """
+    Clears the cached configuration settings, so the configuration file is
+    parsed again on the next use
+    """
+    global __cached_config
+    __cached_config = (None, None)
+
 def load_config():
     """
-    Load configuration settings
+    Load configuration settings. The settings are cached for the process and
+    reloaded only when the configuration file is modified
 
     Return
     ------
     A dictionary with configuration settings
     """
-    if not CONFIG_FILE.exists():
-        raise FileNotFoundError(f"Configuration file not found at {CONFIG_FILE}")
-    with open(CONFIG_FILE, "r") as file:
-        return yaml.safe_load(file)
+    return dict(__get_cached_config())
+
+def get_config_value(setting_name: Literal["DECIMALS", "WIDTH"]):
+    """
+    Obtain a configuration setting from the cached configuration settings
+
+    Parameters
+    ----------
+    setting_name : `str`
+        Name of the configuration setting
+
+    Return
+    ------
+    Value of the configuration setting. None if the setting is not configured
+    """
+    return __get_cached_config().get(setting_name)
 
 def set_config_values(setting_name: Literal["DECIMALS", "WIDTH"], new_value : int):
     """
@@ -37,6 +80,8 @@ def set_config_values(setting_name: Literal["DECIMALS", "WIDTH"], new_value : in
     config[setting_name] = new_value
     with open(CONFIG_FILE, "w") as file:
         yaml.safe_dump(config, file)
+    # the modification time may not change for writes close together
+    clear_config_cache()
 
 def set_decimal_size(num_decimals: int = DEFAULT_DECIMAL_SIZE):
     """
@@ -0,0 +1,153 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, NamedTuple, Union
+
+class SolverEvent(NamedTuple):
+    """
+    Event reported while solving a LP problem. The message is formatted from the
+    template and its arguments only when requested
+
+    Attributes
+    ----------
+    name : str
+        Name of the event (such as "pivot", "optimal" or "unbounded")
+    template : str
+        printf style template of the message
+    args : tuple
+        Arguments of the template
+    """
+    name: str
+    template: str
+    args: tuple
+
+    @property
+    def message(self) -> str:
+        """
+        Message of the event formatted from the template
+        """
+        return (self.template % self.args) if self.args else self.template
+
+class EventSink(ABC):
+    """
+    An abstract class for the sinks receiving the events of the solvers. Subclasses
+    handle the events by implementing `handle`
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the events are handled. Solvers skip preparing the arguments
+        of the events when False
+
+    Methods
+    -------
+    emit(name, template, *args)
+        Reports an event to the sink
+    handle(event)
+        Handles a reported event
+    """
+
+    enabled = True
+
+    def emit(self, name: str, template: str, *args) -> None:
+        """
+        Reports an event with a printf style template formatted with `args` when needed
+        """
+        self.handle(SolverEvent(name, template, args))
+
+    @abstractmethod
+    def handle(self, event: SolverEvent) -> None:
+        """
+        Handles a reported event
+        """
+
+class NullSink(EventSink):
+    """
+    Sink ignoring all events, so nothing is formatted or written
+    """
+
+    enabled = False
+
+    def emit(self, name: str, template: str, *args) -> None:
+        pass
+
+    def handle(self, event: SolverEvent) -> None:
+        pass
+
+class ConsoleSink(EventSink):
+    """
+    Sink printing the message of each event
+    """
+
+    def handle(self, event: SolverEvent) -> None:
+        print(f"\n{event.message}")
+
+class LoggingSink(EventSink):
+    """
+    Sink writing the events to a `logging.Logger`. Messages are formatted by the
+    logging handlers, only for the events of an enabled level. The name of the
+    event is given as the `event` attribute of the log records
+    """
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.INFO):
+        """
+        Parameters
+        ----------
+        logger : logging.Logger (default : None)
+            Logger the events are written to. Uses the "elpee" logger if None
+        level : int (default : logging.INFO)
+            Level of the log records
+        """
+        self.logger = logger if logger is not None else logging.getLogger('elpee')
+        self.level = level
+
+    @property
+    def enabled(self) -> bool:
+        return self.logger.isEnabledFor(self.level)
+
+    def emit(self, name: str, template: str, *args) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, template, *args, extra={'event': name})
+
+    def handle(self, event: SolverEvent) -> None:
+        self.emit(event.name, event.template, *event.args)
+
+class CallbackSink(EventSink):
+    """
+    Sink calling a function with each `SolverEvent`
+    """
+
+    def __init__(self, callback: Callable[[SolverEvent], None]):
+        """
+        Parameters
+        ----------
+        callback : Callable[[SolverEvent], None]
+            Function called with each event
+        """
+        self.callback = callback
+
+    def handle(self, event: SolverEvent) -> None:
+        self.callback(event)
+
+NULL_SINK = NullSink()
+CONSOLE_SINK = ConsoleSink()
+
+EventsOption = Union[EventSink, logging.Logger, Callable[[SolverEvent], None], None]
+
+def get_event_sink(events: EventsOption = None, verbose: bool = True) -> EventSink:
+    """
+    Obtains the sink for the `events` option of the solvers. A logger is wrapped
+    in a `LoggingSink` and a function in a `CallbackSink`. If None, events are
+    printed when `verbose` and ignored otherwise
+    """
+    if events is None:
+        return CONSOLE_SINK if verbose else NULL_SINK
+    if isinstance(events, EventSink):
+        return events
+    if isinstance(events, logging.Logger):
+        return LoggingSink(events)
+    if callable(events):
+        return CallbackSink(events)
+    raise ValueError(f"{events} is an invalid argument for events parameter.")
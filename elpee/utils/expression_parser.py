@@ -0,0 +1,202 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+from typing import Dict, List, Tuple
+
+# a term as an optional sign, an optional coefficient, an optional '*' and an optional variable.
+# Each match of the term pattern consumes one term so the expression is scanned in a single pass
+TERM_PATTERN = re.compile(r'\s*([+-]?)\s*(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)?\s*(\*?)\s*([a-zA-Z]\w*)?')
+OPERATOR_PATTERN = re.compile(r'<=|>=|=|<|>')
+
+class ExpressionError(ValueError):
+    """
+    Error raised for an objective or constraint expression that cannot be parsed.
+    The message points to the position of the error in the expression
+
+    Attributes
+    ----------
+    message : `str`
+        description of the error
+    expression : `str`
+        expression that cannot be parsed
+    position : `int`
+        0-based position of the error in the expression
+    line : `int` | `None`
+        1-based line of the expression when parsed from a text block
+    """
+
+    def __init__(self, message: str, expression: str, position: int, line: int = None):
+        self.message = message
+        self.expression = expression
+        self.position = position
+        self.line = line
+        location = f"line {line}, position {position}" if line is not None else f"position {position}"
+        super().__init__(f"{message} at {location}\n    {expression}\n    {' ' * position}^")
+
+def expected_error(message: str, expression: str, pos: int) -> ExpressionError:
+    """
+    Creates the error for a missing element at `pos`. Characters that cannot
+    start any element are reported as unexpected
+    """
+    if (pos < len(expression)) and not OPERATOR_PATTERN.match(expression, pos):
+        return ExpressionError(f"Unexpected character '{expression[pos]}'", expression, pos)
+    return ExpressionError(message, expression, pos)
+
+def parse_expression(expression: str, pos: int, coefficients: Dict[str, float],
+                     factor: float = 1.0) -> Tuple[int, float]:
+    """
+    Parses the linear expression starting at `pos` until a character that cannot
+    continue the expression. The coefficients of the variables are multiplied by
+    `factor` and added into `coefficients`
+
+    Return
+    ------
+    Tuple of the position after the expression and the sum of its constant terms
+    """
+    constant = 0.0
+    first = True
+    while True:
+        match = TERM_PATTERN.match(expression, pos)
+        sign, number, star, variable = match.groups()
+        if not (sign or number or star or variable):
+            if first:
+                raise expected_error("Expected a term", expression, match.end())
+            return match.end(), constant
+
+        if star and not number:
+            raise ExpressionError("Expected a coefficient before '*'", expression, match.start(3))
+        if star and not variable:
+            raise expected_error("Expected a variable after '*'", expression, match.end())
+        if not (number or variable):
+            raise expected_error("Expected a coefficient or a variable", expression, match.end())
+        if not (first or sign):
+            raise ExpressionError("Expected '+' or '-' between terms", expression,
+                                  match.start(2) if number else match.start(4))
+
+        value = float(number) if number else 1.0
+        if sign == '-':
+            value = -value
+        if variable:
+            coefficients[variable] = coefficients.get(variable, 0.0) + factor * value
+        else:
+            constant += value
+        first = False
+        pos = match.end()
+
+def parse_objective(expression: str) -> Dict[str, float]:
+    """
+    Parses an objective function expression into the coefficients of its variables
+
+    Exceptions
+    ----------
+    `ExpressionError` (a `ValueError`) is thrown when the expression is not valid
+    """
+    coefficients = {}
+    pos, constant = parse_expression(expression, 0, coefficients)
+    if pos != len(expression):
+        if OPERATOR_PATTERN.match(expression, pos):
+            raise ExpressionError("Objective Function cannot have equality or inequality operators", expression, pos)
+        raise ExpressionError(f"Unexpected character '{expression[pos]}'", expression, pos)
+    if constant != 0:
+        raise ExpressionError("Objective Function cannot have constant terms", expression, 0)
+    return coefficients
+
+def parse_constraint(expression: str) -> Dict[str, Dict[str, float]]:
+    """
+    Parses a constraint expression into the standardized constraint of the form
+    `{operator: {variable: coefficient, ..., 'sol': rhs}}`. Variables are moved to
+    the left-hand side and constants to the right-hand side. Strict inequalities
+    are negated into `>=` (for `<`) and `<=` (for `>`)
+
+    Exceptions
+    ----------
+    `ExpressionError` (a `ValueError`) is thrown when the expression is not valid
+    """
+    coefficients = {}
+    pos, lhs_constant = parse_expression(expression, 0, coefficients)
+
+    operator = OPERATOR_PATTERN.match(expression, pos)
+    if operator is None:
+        if pos == len(expression):
+            raise ExpressionError("The constraint must contain exactly one equality or inequality operator", expression, pos)
+        raise ExpressionError(f"Unexpected character '{expression[pos]}'", expression, pos)
+    inequality = operator.group()
+
+    pos, rhs_constant = parse_expression(expression, operator.end(), coefficients, -1.0)
+    if pos != len(expression):
+        if OPERATOR_PATTERN.match(expression, pos):
+            raise ExpressionError("The constraint must contain exactly one equality or inequality operator", expression, pos)
+        raise ExpressionError(f"Unexpected character '{expression[pos]}'", expression, pos)
+    coefficients['sol'] = rhs_constant - lhs_constant
+
+    if inequality == '<':
+        return {'>=': {key: -value for key, value in coefficients.items()}}
+    elif inequality == '>':
+        return {'<=': {key: -value for key, value in coefficients.items()}}
+    return {inequality: coefficients}
+
+def parse_constraints(text: str) -> Tuple[List[str], List[Dict[str, Dict[str, float]]]]:
+    """
+    Parses a text block of constraints given one per line (or separated by ';').
+    Blank lines and comments starting with '#' are skipped
+
+    Return
+    ------
+    Tuple of the constraint expressions and their standardized constraints
+
+    Exceptions
+    ----------
+    `ExpressionError` (a `ValueError`) is thrown for the first expression that is
+    not valid with the line and the position of the error in the line
+    """
+    expressions = []
+    constraints = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if '#' in line:
+            line = line[:line.index('#')]
+        offset = 0
+        for expression in (line.split(';') if ';' in line else (line,)):
+            stripped = expression.strip()
+            if stripped:
+                try:
+                    constraints.append(parse_constraint(expression))
+                except ExpressionError as error:
+                    raise ExpressionError(error.message, line, offset + error.position, line_no) from None
+                expressions.append(stripped)
+            offset += len(expression) + 1
+    return expressions, constraints
+
+def format_number(value: float) -> str:
+    """
+    Formats a number with the shortest text that reads back to the same value
+    """
+    if float(value).is_integer() and (abs(value) < 1e15):
+        return str(int(value))
+    return repr(float(value))
+
+def format_expression(coefficients: Dict[str, float]) -> str:
+    """
+    Formats the coefficients of the variables into a linear expression such
+    as `3 x - y + 0.5 z`. The expression is readable by `parse_expression` and
+    as a CPLEX LP expression
+    """
+    terms = []
+    for variable, coefficient in coefficients.items():
+        sign = '-' if coefficient < 0 else '+'
+        magnitude = abs(coefficient)
+        term = variable if magnitude == 1 else f"{format_number(magnitude)} {variable}"
+        if terms:
+            terms.append(f"{sign} {term}")
+        else:
+            terms.append(f"- {term}" if sign == '-' else term)
+    return ' '.join(terms) if terms else '0'
+
+def format_constraint(constraint: Dict[str, Dict[str, float]]) -> str:
+    """
+    Formats a standardized constraint `{operator: {variable: coefficient, ..., 'sol': rhs}}`
+    into a constraint expression
+    """
+    (operator, coefficient_dict), = constraint.items()
+    coefficients = {var: coeff for var, coeff in coefficient_dict.items() if var != 'sol'}
+    return f"{format_expression(coefficients)} {operator} {format_number(coefficient_dict['sol'])}"
@@ -2,26 +2,38 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from elpee.algorithms.dual_simplex import DualSimplexSolver
+from elpee.utils.events import EventSink, get_event_sink
 from elpee.utils.protocols.st_problem import StandardProblem
+from elpee.utils.ratio_test import DUAL_TOLERANCE, PIVOT_TOLERANCE, PRIMAL_TOLERANCE
+from elpee.utils.utilities import fix_feasible_0_1_pattern
 
 class FeasibleHandler():
     """
     Class description for performing updates to Linear Programming Problem to have 
     feasible solutions by verifying and performing feasibility fixes if not feasible
     """
-    def __init__(self):
+    def __init__(self, events: EventSink = None, primal_tolerance: float = PRIMAL_TOLERANCE,
+                 dual_tolerance: float = DUAL_TOLERANCE, pivot_tolerance: float = PIVOT_TOLERANCE):
         self.problem = None
+        self.events = get_event_sink(events)
+        self.primal_tolerance = primal_tolerance
+        self.dual_tolerance = dual_tolerance
+        self.pivot_tolerance = pivot_tolerance
 
     def __check_feasible_positive_sol(self):
         """
         Criteria 1 for feasibility
         Checks feasibility of matrix by checking the if the solution is positive for the constraint rows (not the objective row)
+        Solution values within the primal tolerance of zero are treated as positive
         If returns false --> matrix requires dual simplex handling 
         """
+        if self.problem.tableau is not None:
+            return not self.problem.tableau.has_negative_rhs(self.primal_tolerance)
+
         n_rows = len(self.problem.matrix)
 
         for i in range(1, n_rows):
-            if self.problem.matrix[i][-1] < 0:
+            if self.problem.matrix[i][-1] < -self.primal_tolerance:
                 return False
 
         return True
@@ -35,6 +47,9 @@ class FeasibleHandler():
             else for each row, matrix[row][basic_var] = 0
         If returns false --> requires to fix the pattern using linear algebraic row operations
         """
+        if self.problem.tableau is not None:
+            return self.problem.tableau.is_canonical(self.problem.basic_vars)
+
         for i, var in enumerate(self.problem.basic_vars[1:]):
             column = [row[var-1] for row in self.problem.matrix]
 
@@ -42,13 +57,14 @@ class FeasibleHandler():
                 return False
         return True
     
-    def is_feasible(self, problem:StandardProblem):
+    def is_feasible(self, problem:StandardProblem, canonical:bool = False):
         """
         Checks overall feasibility of the matrix based on the 2 criteria
+        The check for the 0-1 pattern is skipped if the matrix is known to be `canonical`
         """
         self.problem = problem
         if self.__check_feasible_positive_sol():
-            if self.__check_0_1_pattern():
+            if canonical or self.__check_0_1_pattern():
                 return True
         return False   
 
@@ -58,31 +74,24 @@ class FeasibleHandler():
         Does scaled multiplication to the row of the basic variable if matrix[basic_var][basic_var] != 1
         Does scaled addition of the basic variable row onto rows where matrix[row][basic_var] != 0
         """
-        n_rows = self.problem.n_constraints + 1
-        for row_i ,basic_var in enumerate(self.problem.basic_vars):
-            # no need to check 0-1 pattern for objective variable
-            if basic_var == 0:
-                continue
+        if self.problem.tableau is not None:
+            self.problem.tableau.canonicalize(self.problem.basic_vars)
+            return
 
-            # checking and fixing basic variables coefficient into 1
-            if self.problem.matrix[row_i][basic_var-1] != 1:
-                self.problem.matrix[row_i] = [element / self.problem.matrix[row_i][basic_var-1] for element in self.problem.matrix[row_i]]
-
-            # checking if zeros are maintained for 0-1 pattern
-            for i in range(n_rows):
-                # except for row with the basic variable
-                if i != row_i:  
-                    if self.problem.matrix[i][basic_var-1] != 0:
-                        scaled_piv_row = [element * self.problem.matrix[i][basic_var-1] for element in self.problem.matrix[row_i]]
-                        self.problem.matrix[i] = [a-b for a,b in zip(self.problem.matrix[i], scaled_piv_row)]
+        fix_feasible_0_1_pattern(self.problem.basic_vars, self.problem.matrix)
 
     def get_feasible(self, problem:StandardProblem):
         """
         Applies the functionalities for correcting the matrix table to obtain feasibility
         If no feasible solution exists --> return None
+
+        The solvers retain the 0-1 pattern by pivoting on each change of a basic variable.
+        The full fix of the 0-1 pattern is only applied when the matrix does not have the
+        pattern, such as a loaded problem or a problem with big M values to be eliminated
         """
         self.problem = problem
-        ds_solver = DualSimplexSolver(problem)
+        ds_solver = DualSimplexSolver(problem, primal_tolerance=self.primal_tolerance, dual_tolerance=self.dual_tolerance,
+                                      pivot_tolerance=self.pivot_tolerance, events=self.events)
         if not(self.__check_feasible_positive_sol()):
             self.problem = ds_solver.solver()
  
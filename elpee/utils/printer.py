@@ -2,16 +2,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from elpee.utils.protocols.st_problem import StandardProblem
-from elpee.utils.utilities import convert_num_to_padded_text, extract_elem_from_simplex_matrix
-from elpee.utils.configs import load_config
+from elpee.utils.utilities import convert_num_to_padded_text, round_off_elem
+from elpee.utils.settings import Settings, get_settings
 
 class SimplexPrinter():
     """
     Class Description for all functions for printing the contents of the LP Problem sent
+    The decimals and cell width are taken from the `settings` (the current settings if None)
     """
-    def __init__(self, show_steps : bool = True, show_interpret : bool = True):
+    def __init__(self, show_steps : bool = True, show_interpret : bool = True, settings: Settings = None):
         self.show_steps = show_steps
         self.show_interpret = show_interpret
+        self.settings = settings if settings is not None else get_settings()
 
     def __print_slack_var_name(self, var_num:int, problem:StandardProblem):
         """
@@ -52,12 +54,11 @@ class SimplexPrinter():
                 print(f"\nTaking {leaving_var} = 0; Entering {entering_var} as a new basic variable;")
                 return  
 
-    def __get_var_list(self, problem : StandardProblem):
+    def __get_var_list(self, problem : StandardProblem, WIDTH: int):
         """
         Creates names of variables used in the problem
         Creates the list of variables including objective, decision, slack and artificial variables
         """
-        WIDTH = load_config().get('WIDTH')
 
         var_names = ['P'.center(WIDTH)]
         for i in range(problem.n_decision_vars):
@@ -73,11 +74,10 @@ class SimplexPrinter():
         """
         Creates a list of text strings to display contents of the simplex table
         """
-        config = load_config()
-        DECIMALS = config.get('DECIMALS')
-        WIDTH = config.get('WIDTH')
+        DECIMALS = self.settings.get_decimals()
+        WIDTH = self.settings.get_width()
 
-        var_names = self.__get_var_list(problem)
+        var_names = self.__get_var_list(problem, WIDTH)
 
         rows_list = []
 
@@ -90,10 +90,11 @@ class SimplexPrinter():
         rows_list.append(head_simplex_row)
 
         # for other rows representing constraint rows
+        matrix = problem.matrix
         for i in range(problem.n_constraints+1):
             simplex_row = var_names[problem.basic_vars[i]].ljust(WIDTH)
             # convert each number/element in row into padded text for printing
-            matrix_row_str = convert_num_to_padded_text(problem.matrix[i], WIDTH, DECIMALS)
+            matrix_row_str = convert_num_to_padded_text(matrix[i], WIDTH, DECIMALS)
             simplex_row += "".join(map(str, matrix_row_str))
             rows_list.append(simplex_row)
 
@@ -105,21 +106,23 @@ class SimplexPrinter():
         Prints the Intepretation of the variables given by the partially/ fully solved
         LP standard problem
         """
-        config = load_config()
-        DECIMALS = config.get('DECIMALS')
-        WIDTH = config.get('WIDTH')
+        DECIMALS = self.settings.get_decimals()
+        WIDTH = self.settings.get_width()
 
         decision_variables = problem.var_name_list
         basic_vars_idx = problem.basic_vars
-        matrix = problem.matrix
+        if problem.tableau is not None:
+            sol_col = problem.tableau.sol_col
+        else:
+            sol_col = [row[-1] for row in problem.matrix]
 
-        objective_value = convert_num_to_padded_text([problem.matrix[0][-1]], 1, DECIMALS)
+        objective_value = convert_num_to_padded_text([sol_col[0]], 1, DECIMALS)
         print(f"\n{'Maximum' if problem.is_max else 'Minimum'} Value for Objective Function = {objective_value[0]}")
 
         print("\nValues for Decision Variables : ")
         for i, var in enumerate(decision_variables):
             if (i+1) in basic_vars_idx:
-                sol_val = convert_num_to_padded_text([matrix[basic_vars_idx.index(i+1)][-1]], 1, DECIMALS)
+                sol_val = convert_num_to_padded_text([sol_col[basic_vars_idx.index(i+1)]], 1, DECIMALS)
                 print(f"{str(var).center(WIDTH)} = {sol_val[0]}")
             else:
                 print(f"{str(var).center(WIDTH)} = 0")
@@ -130,7 +133,7 @@ class SimplexPrinter():
         num_artificials_in_basic_vars = sum(item > end_slack_var_idx for item in basic_vars_idx)
         for other_var in range(start_slack_var_idx, end_slack_var_idx+1):
             if other_var in basic_vars_idx:
-                print(f"{str(self.__print_slack_var_name(other_var, problem)).center(WIDTH*2)} = {extract_elem_from_simplex_matrix(matrix, basic_vars_idx.index(other_var), -1)} units")
+                print(f"{str(self.__print_slack_var_name(other_var, problem)).center(WIDTH*2)} = {round_off_elem(sol_col[basic_vars_idx.index(other_var)], DECIMALS)} units")
             else:
                 if num_artificials_in_basic_vars > 0:
                     pass
@@ -145,8 +148,6 @@ class SimplexPrinter():
         """
         Prints the simplex table onto the command line interface
         """
-        WIDTH = load_config().get('WIDTH')
-
         if self.show_steps:
             rows_list = self.__get_simplex_table_text(problem)
             for row in rows_list:
@@ -156,4 +157,4 @@ class SimplexPrinter():
             self.interpret_problem(problem=problem)   
 
         if (self.show_interpret | self.show_steps):
-            print("="*(len(problem.matrix[0])+1)*WIDTH)
\ No newline at end of file
+            print("="*(len(problem.obj_row)+2)*self.settings.get_width())
\ No newline at end of file
@@ -2,6 +2,15 @@ from abc import ABC
 import os
 import shutil
 
+from elpee.datahandler.background_writer import BackgroundWriter
+from elpee.datahandler.data_handler import save_file
+from elpee.datahandler.history_handler import HistoryWriter
+from elpee.datahandler.trajectory_handler import TrajectoryWriter
+
+# paths of the trajectory and history files if not given
+DEFAULT_TRAJECTORY_PATH = "solution.elpt"
+DEFAULT_HISTORY_PATH = "solution.elph"
+
 
 class DataHandler(ABC):
     """
@@ -18,19 +27,54 @@ class DataHandler(ABC):
     ---------
     file_format : string (default : None) 
         Specifies the file format used for saving the solutions. 
-        Options allowed are [`"json"`, `"yaml"`, `None`]
+        Options allowed are [`"json"`, `"yaml"`, `"trajectory"`, `"history"`, `None`]. 
+        The `"json"` and `"yaml"` formats save each step as a file in the 
+        `solution` folder. The `"trajectory"` format appends the steps to a 
+        single trajectory file. The `"history"` format saves the pivots of the 
+        steps with periodic checkpoints to a single history file
 
     freq : string (default : None)
         Configures the frequency of saving the iterations of the LP solution generation. 
         Options allowed are [`"all"`, `"final"`, `None`]. 
         The freuency is overidden to None if the file_format is `None`. 
+
+    file_path : string (default : None)
+        Path of the trajectory or history file. Defaults to `"solution.elpt"` 
+        for trajectory files and `"solution.elph"` for history files
+
+    compress : bool (default : False)
+        Compress the records of the trajectory file or the checkpoints of the 
+        history file with zlib
+
+    settings : elpee.utils.settings.Settings (default : None)
+        Settings giving the decimals of the saved expressions
+
+    background : bool (default : False)
+        Save the steps in a background thread. Snapshots of the steps are queued 
+        and saved while the solve continues. Errors of saving a step are raised 
+        by `close`
+
+    max_pending : int (default : 8)
+        Largest number of steps queued to be saved in the background. Saving a 
+        step waits while the queue is full
     """
 
-    def __init__(self, file_format : str = None, freq : str = None) -> None:
-        if file_format not in ["json", "yaml", None]:
-            raise ValueError(f"{freq} is an invalid argument for file_format parameter.") 
+    def __init__(self, file_format : str = None, freq : str = None, file_path : str = None,
+                 compress : bool = False, settings = None, background : bool = False,
+                 max_pending : int = 8) -> None:
+        if file_format not in ["json", "yaml", "trajectory", "history", None]:
+            raise ValueError(f"{file_format} is an invalid argument for file_format parameter.") 
         
         self.file_format = file_format
+        if file_path is None:
+            file_path = DEFAULT_HISTORY_PATH if file_format == "history" else DEFAULT_TRAJECTORY_PATH
+        self.file_path = file_path
+        self.compress = compress
+        self.settings = settings
+        # writer of the trajectory or history file
+        self.writer = None
+        # thread saving the steps in the background
+        self.background_writer = None
 
         if file_format == None:
             freq = None
@@ -40,9 +84,67 @@ class DataHandler(ABC):
 
         self.freq = freq
 
-        # create the folder to store json file solutions
-        if (freq == "all") | (freq == "final"):
+        if freq is None:
+            return
+        if file_format == "trajectory":
+            self.writer = TrajectoryWriter(self.file_path, compress=compress, settings=settings)
+        elif file_format == "history":
+            self.writer = HistoryWriter(self.file_path, compress=compress)
+        else:
+            # create the folder to store json file solutions
             self.__create_solution_folder()
+        if background:
+            self.background_writer = BackgroundWriter(self.__save, max_pending=max_pending)
+
+    def save_step(self, problem, step_name : str) -> None:
+        """
+        Saves a step of the solution as the `step_name` file in the solution
+        folder, or appends the step to the trajectory or history file
+
+        Parameters
+        ----------
+        problem : elpee.StandardProblem
+            LP problem after the step
+        step_name : string
+            Name of the step (such as "sol_step_1")
+        """
+        if self.freq is None:
+            return
+        if self.background_writer is not None:
+            self.background_writer.submit(problem, step_name)
+        else:
+            self.__save(problem, step_name)
+
+    def __save(self, problem, step_name : str) -> None:
+        """
+        Writes a step to the solution folder or the trajectory or history file
+        """
+        if self.writer is not None:
+            self.writer.append(problem, step_name)
+        else:
+            save_file(problem, file_format=self.file_format, file_path=f"solution/{step_name}.{self.file_format}",
+                      settings=self.settings)
+
+    def flush(self) -> None:
+        """
+        Waits until the steps queued in the background are saved. Raises the error
+        of saving a step if any
+        """
+        if self.background_writer is not None:
+            self.background_writer.flush()
+
+    def close(self) -> None:
+        """
+        Completes the saved steps. Saves the steps queued in the background and writes
+        the index footer of the trajectory or history file. Raises the error of saving
+        a step in the background if any
+        """
+        try:
+            if self.background_writer is not None:
+                self.background_writer.close()
+        finally:
+            if self.writer is not None:
+                self.writer.close()
 
     def __create_solution_folder(self):
         """
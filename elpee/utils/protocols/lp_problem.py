@@ -1,14 +1,17 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
-import re
-from typing import Dict, List
+from typing import Dict, Iterable, List, Literal, Tuple
 
+import numpy as np
 from sympy import Symbol
+from elpee.utils.bigm import BigMValue
+from elpee.utils.coefficient_arrays import as_coo_arrays, as_vector, sum_duplicates
+from elpee.utils.expression_parser import format_constraint, format_expression, parse_constraint, parse_constraints, parse_objective
+from elpee.utils.protocols.sparse_tableau import SparseTableau
 from elpee.utils.protocols.st_problem import StandardProblem
 from elpee.utils.utilities import convert_gte_to_lte, obtain_coefficient_from_dict, transform_to_positive_constraints
 
-
 class LinearProblem():
     """
     Class to represent the linear programming optimization problem
@@ -20,11 +23,25 @@ class LinearProblem():
         Defines the new objective function expression for the LP problem
     add_constraint(constraint_expr:str)
         Defines a new constraint to be added to the LP problem
+    add_constraints(constraint_exprs:Iterable[str])
+        Defines a batch of new constraints to be added to the LP problem
+    add_constraints_from_text(text:str)
+        Defines the constraints given one per line in a text block
+    add_constraints_from_file(file_path:str)
+        Defines the constraints given one per line in a text file
+    add_objective_coefficients(coefficients:Dict[str, float])
+        Defines the objective function from the coefficients of its variables
+    add_constraint_coefficients(coefficients:Dict[str, float], operator:str, rhs:float)
+        Defines a new constraint from the coefficients of its variables
+    add_variable_bounds(variable:str, lower:float, upper:float)
+        Defines the bounds of a variable as constraints
+    from_arrays(c, A_ub, b_ub, A_eq, b_eq, var_names, is_maximization) -> LinearProblem
+        Creates the LP problem from coefficient arrays
     use_dual_simplex()
         Configures the problem to be solved using Dual Simplex method
-    use_bigM()
+    use_bigM(numeric:bool)
         Configures the problem to be solved using big M method
-    standardize_problem() -> StandardProblem
+    standardize_problem(sparse:bool) -> StandardProblem
         Converts the LinearProblem into standardized form for computation 
     """
     
@@ -33,12 +50,15 @@ class LinearProblem():
         self._standard_objective = {}
         self._constraints = []
         self._standard_constraints = []
-        self._variables = []
+        self._variable_index = {} # variables in the order of insertion
+        self._sorted_variables = None # ordered variables, generated when required
         self._use_dual_simplex = False
+        self._use_numeric_big_m = False
         self.is_max = is_maximization
         self._n_slack_vars = 0
         self._n_artificials = 0
         self._basic_vars = []
+        self._array_constraints = None # constraints given as coefficient arrays by from_arrays
 
     def add_objective(self, objective_expr: str) -> None:
         """
@@ -52,14 +72,14 @@ class LinearProblem():
 
         Exceptions
         ----------
-        ValueError is thrown when objective function expression is not
-        valid
+        ValueError (`elpee.utils.expression_parser.ExpressionError`) is thrown
+        with the position of the error when objective function expression is
+        not valid
         """
         
-        self.__check_objective(objective_expr)
+        self._standard_objective = parse_objective(objective_expr)
         self._objective = objective_expr
-        self.__standardize_objective()
-        self.__update_variable_list_with_objective()
+        self.__add_variables(self._standard_objective)
 
     
     def add_constraint(self, constraint_expr: str) -> None:
@@ -74,149 +94,316 @@ class LinearProblem():
         
         Exceptions
         ----------
-        ValueError is thrown when constraint expression is not valid
+        ValueError (`elpee.utils.expression_parser.ExpressionError`) is thrown
+        with the position of the error when constraint expression is not valid
         """
 
-        self.__check_constraint(constraint_expr)
-        self._constraints.append(constraint_expr)
-        self.__generate_standard_constraint_list()
-        self.__update_variable_list_with_constraint()
+        self.add_constraints([constraint_expr])
 
-    def use_dual_simplex(self):
-        """
-        Configures the LP problem to be solved using Dual Simplex method
+    def add_constraints(self, constraint_exprs: Iterable[str]) -> None:
         """
+        Add a batch of new constraints to existing LP Problem. Each constraint
+        is parsed once when added. No constraint of the batch is added if any
+        constraint is not valid.
+
+        Parameters
+        ----------
+        constraint_exprs : Iterable[str]
+            String expressions of mathematical inequalities or equalities 
+            to represent as new constraints
         
-        self._use_dual_simplex = True
-    
-    def use_bigM(self):
+        Exceptions
+        ----------
+        ValueError (`elpee.utils.expression_parser.ExpressionError`) is thrown
+        with the position of the error when a constraint expression is not valid
         """
-        Configures the LP problem to be solved using big M method
+
+        constraint_exprs = list(constraint_exprs)
+        self.__extend_constraints(constraint_exprs, [parse_constraint(expr) for expr in constraint_exprs])
+
+    def add_constraints_from_text(self, text: str) -> None:
         """
+        Add the constraints of a text block to existing LP Problem. Constraints
+        are given one per line or separated by ';'. Blank lines and comments
+        starting with '#' are skipped. No constraint is added if any constraint
+        is not valid.
 
-        self._use_dual_simplex = False
+        Parameters
+        ----------
+        text : str
+            Text block of constraint expressions
+
+        Exceptions
+        ----------
+        ValueError (`elpee.utils.expression_parser.ExpressionError`) is thrown
+        with the line and the position of the error when a constraint expression
+        is not valid
+        """
 
-    def __standardize_objective(self) -> None:
+        self.__extend_constraints(*parse_constraints(text))
+
+    def add_constraints_from_file(self, file_path: str) -> None:
         """
-        Standardizes the objective function for computation
+        Add the constraints of a text file to existing LP Problem. The file
+        follows the format of `add_constraints_from_text`
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the text file of constraint expressions
         """
 
-        self._standard_objective = {}
-        obj_expr = self._objective.strip()
-        matches = re.finditer(r'([+-]?\s*\d*\.?\d*)\s*\*?\s*([a-zA-Z]\w*)', obj_expr)
-        for match in matches:
-            coefficient = match.group(1).replace(' ', '')
-            variable = match.group(2)
-            
-            # Convert coefficient to float
-            coefficient = float(coefficient) if coefficient not in ('', '+', '-') else 1.0 * (-1 if coefficient == '-' else 1)
-            self._standard_objective[variable] = coefficient
+        with open(file_path, "r") as file:
+            self.add_constraints_from_text(file.read())
 
-    def __check_objective(self, obj_expr:str) -> None:
+    @classmethod
+    def from_arrays(cls, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, var_names: List[str] = None,
+                    is_maximization: bool = True) -> "LinearProblem":
         """
-        Verifies the objective function expression. Throws a ValueError 
-        if the objective function is not valid.
+        Creates the LP problem of optimizing `c @ x` subject to `A_ub @ x <= b_ub`
+        and `A_eq @ x = b_eq` from coefficient arrays, without rendering and
+        parsing expressions. The constraints are kept as arrays and laid out
+        directly into the simplex matrix by `standardize_problem`.
+
+        Parameters
+        ----------
+        c : array like
+            Coefficients of the variables in the objective function
+        A_ub, A_eq : array like or sparse matrix (default : None)
+            Coefficients of the <= and = constraints as dense arrays (including
+            objects exposing the buffer protocol) or sparse matrices providing
+            `tocoo()` such as the scipy sparse matrices
+        b_ub, b_eq : array like (default : None)
+            Right-hand side values of the <= and = constraints
+        var_names : List[str] (default : None)
+            Names of the variables. Named as x1, x2, ... (zero padded to keep the
+            order of the columns) if not given
+        is_maximization : bool (default : True)
+            Sets a maximization LP problem when True
+
+        Return
+        ------
+        LinearProblem object of the given arrays
+
+        Exceptions
+        ----------
+        ValueError is thrown when the shapes of the arrays do not match
         """
 
-        symbols = ['<=', '>=','=','>','<']
-        occurrences = {symbol: obj_expr.count(symbol) for symbol in symbols}
-        total_occurrences = sum(occurrences.values())
-        if total_occurrences > 0:
-            raise ValueError("Objective Function cannot have equality or inequality operators") 
+        c = as_vector(c, "c")
+        n_vars = c.size
+        if var_names is None:
+            width = len(str(n_vars))
+            var_names = [f"x{i:0{width}d}" for i in range(1, n_vars + 1)]
+        else:
+            var_names = [str(name) for name in var_names]
+            if len(var_names) != n_vars:
+                raise ValueError(f"Number of variable names provided {len(var_names)} and " +
+                                 f"number of coefficients of the objective function {n_vars} do not match.")
+            if len(set(var_names)) != n_vars:
+                raise ValueError("Variable names must be unique.")
+            if 'sol' in var_names:
+                raise ValueError("'sol' is reserved for the right-hand side value and cannot be a variable name")
+
+        blocks = []
+        for operator, A, b, name in (('<=', A_ub, b_ub, "A_ub"), ('=', A_eq, b_eq, "A_eq")):
+            if (A is None) != (b is None):
+                raise ValueError(f"{name} and its right-hand side values must be given together.")
+            if A is not None:
+                coo = as_coo_arrays(A, n_vars, name)
+                blocks.append((operator, coo, as_vector(b, f"b{name[1:]}", coo[3])))
+
+        problem = cls(is_maximization=is_maximization)
+        problem._standard_objective = {var: coeff for var, coeff in zip(var_names, c.tolist()) if coeff != 0}
+        problem._variable_index = {var: i for i, var in enumerate(var_names)}
+        problem._array_constraints = (var_names, blocks)
+        return problem
+
+    def add_objective_coefficients(self, coefficients: Dict[str, float]) -> None:
+        """
+        Define the objective function from the coefficients of its variables.
+        Replaces previous objective function.
 
-    def __check_constraint(self, constraint_expr: str) -> None:
+        Parameters
+        ----------
+        coefficients : Dict[str, float]
+            Coefficients of the variables of the objective function
+        """
+
+        self._standard_objective = dict(coefficients)
+        self._objective = format_expression(self._standard_objective)
+        self.__add_variables(self._standard_objective)
+
+    def add_constraint_coefficients(self, coefficients: Dict[str, float], operator: Literal['<=', '>=', '='],
+                                    rhs: float) -> None:
+        """
+        Add a new constraint from the coefficients of its variables without
+        parsing an expression. Used to build problems read from model files.
+
+        Parameters
+        ----------
+        coefficients : Dict[str, float]
+            Coefficients of the variables of the constraint
+        operator : str (Options : ["<=", ">=", "="])
+            Operator of the constraint
+        rhs : float
+            Right-hand side value of the constraint
+
+        Exceptions
+        ----------
+        ValueError is thrown for an invalid operator or a variable named 'sol'
         """
-        Verifies the constraint expression. Throws a ValueError 
-        if the constraint is not valid.
+
+        if operator not in ('<=', '>=', '='):
+            raise ValueError(f"{operator} is an invalid argument for operator parameter.")
+        if 'sol' in coefficients:
+            raise ValueError("'sol' is reserved for the right-hand side value and cannot be a variable name")
+
+        coefficient_dict = dict(coefficients)
+        coefficient_dict['sol'] = float(rhs)
+        # expression is formatted only when required
+        self.__extend_constraints([None], [{operator: coefficient_dict}])
+
+    def add_variable_bounds(self, variable: str, lower: float = 0.0, upper: float = None) -> None:
         """
+        Add the bounds of a variable as constraints. Variables are nonnegative
+        in the LP problem, so only a positive lower bound adds a constraint.
+
+        Parameters
+        ----------
+        variable : str
+            Name of the variable
+        lower : float (default : 0.0)
+            Lower bound of the variable
+        upper : float (default : None)
+            Upper bound of the variable. The variable is not bounded above if `None`
 
-        symbols = ['<=', '>=','=','>','<']
-        occurrences = {symbol: constraint_expr.count(symbol) for symbol in symbols}
-        total_occurrences = sum(occurrences.values())
-        if total_occurrences > 1:
-            total_occurrences = occurrences['<=']*occurrences['=']*occurrences['<'] + occurrences['>=']*occurrences['=']*occurrences['>']
-        if total_occurrences != 1:
-            raise ValueError("The constraint must contain exactly one equality or inequality operator")
+        Exceptions
+        ----------
+        ValueError is thrown for a negative lower bound (free or negative
+        variables are not supported)
+        """
+
+        if lower < 0:
+            raise ValueError(f"Lower bound {lower} of variable {variable} is negative. Variables of the LP problem must be nonnegative")
+
+        if (upper is not None) and (upper == lower):
+            self.add_constraint_coefficients({variable: 1.0}, '=', lower)
+            return
+        if lower > 0:
+            self.add_constraint_coefficients({variable: 1.0}, '>=', lower)
+        if (upper is not None) and (upper != float('inf')):
+            self.add_constraint_coefficients({variable: 1.0}, '<=', upper)
+
+    @property
+    def constraints(self) -> List[str]:
+        """
+        Expressions of the constraints of the LP problem. Expressions of the
+        constraints added from coefficients are formatted when required
+        """
+
+        self.__convert_array_constraints()
+
+        for i, constraint_expr in enumerate(self._constraints):
+            if constraint_expr is None:
+                self._constraints[i] = format_constraint(self._standard_constraints[i])
+        return self._constraints
+
+    @property
+    def standard_objective(self) -> Dict[str, float]:
+        """
+        Coefficients of the variables of the objective function
+        """
+
+        return self._standard_objective
+
+    @property
+    def standard_constraints(self) -> List[Dict[str, Dict[str, float]]]:
+        """
+        Constraints in the standardized form `{operator: {variable: coefficient, ..., 'sol': rhs}}`
+        """
+
+        self.__convert_array_constraints()
+
+        return self._standard_constraints
+
+    def __extend_constraints(self, constraint_exprs: List[str], standard_constraints: List[Dict]) -> None:
+        """
+        Adds the parsed constraints and their variables to the LP Problem
+        """
+
+        self.__convert_array_constraints()
+
+        self._constraints.extend(constraint_exprs)
+        self._standard_constraints.extend(standard_constraints)
+        for constraint in standard_constraints:
+            for coefficient_dict in constraint.values():
+                self.__add_variables(coefficient_dict)
+
+    def __convert_array_constraints(self) -> None:
+        """
+        Converts the constraints given as coefficient arrays into standardized
+        constraints, so that they can be extended or read as dictionaries
+        """
+
+        if self._array_constraints is None:
+            return
+        var_names, blocks = self._array_constraints
+        self._array_constraints = None
+
+        for operator, (rows, cols, values, n_rows), rhs in blocks:
+            rows, cols, values = sum_duplicates(rows, cols, values, len(var_names))
+            bounds = np.searchsorted(rows, np.arange(n_rows + 1))
+            cols, values = cols.tolist(), values.tolist()
+            for i, value in enumerate(rhs.tolist()):
+                start, end = bounds[i], bounds[i+1]
+                coefficient_dict = {var_names[col]: coeff for col, coeff in zip(cols[start:end], values[start:end])}
+                coefficient_dict['sol'] = value
+                self._standard_constraints.append({operator: coefficient_dict})
+                self._constraints.append(None)
+
+    @property
+    def variables(self) -> List[str]:
+        """
+        Sorted list of the variables used in the LP problem. Variables are 
+        kept in the order of insertion and sorted only when required
+        """
+
+        if self._sorted_variables is None:
+            self._sorted_variables = sorted(self._variable_index)
+        return self._sorted_variables
+
+    def use_dual_simplex(self):
+        """
+        Configures the LP problem to be solved using Dual Simplex method
+        """
         
-    def __generate_standard_constraint_list(self):
+        self._use_dual_simplex = True
+    
+    def use_bigM(self, numeric: bool = False):
         """
-        Generates the standardized constraint list for computation
+        Configures the LP problem to be solved using big M method
+
+        Parameters
+        ----------
+        numeric : bool (default : False)
+            Represent big M values numerically as (constant, M coefficient) 
+            pairs compared lexicographically instead of sympy expressions
         """
 
-        self._standard_constraints = []
-        for constraint in self._constraints:
-            # Determine the type of inequality or equation
-            if '<=' in constraint:
-                inequality = '<='
-            elif '>=' in constraint:
-                inequality = '>='
-            elif '=' in constraint:
-                inequality = '='
-            elif '<' in constraint:
-                inequality = '<'
-            elif '>' in constraint:
-                inequality = '>'
-            
-            # Split the expression into the left-hand side and the right-hand side
-            lhs, rhs = re.split(f'{inequality}', constraint)
-            lhs = lhs.strip()
-            rhs = float(rhs.strip())
-
-            # Initialize the result dictionary
-            result = {inequality: {}}
-            
-            # Find all the coefficients and variables
-            matches = re.finditer(r'([+-]?\s*\d*\.?\d*)\s*\*?\s*([a-zA-Z]\w*)', lhs)
-
-            for match in matches:
-                coefficient = match.group(1).replace(' ', '')
-                variable = match.group(2)
-                
-                # Convert coefficient to float
-                coefficient = float(coefficient) if coefficient not in ('', '+', '-') else 1.0 * (-1 if coefficient == '-' else 1)
-                
-                # Add the variable and its coefficient to the dictionary
-                result[inequality][variable] = coefficient
-            
-            # Add the right-hand side value
-            result[inequality]['sol'] = rhs
-
-            if inequality == '<':
-                coefficient_dict = result[inequality]
-                for key, value in coefficient_dict.items():
-                    coefficient_dict[key] = -value
-                result = {'>=':coefficient_dict}
-            elif inequality == '>':
-                coefficient_dict = result[inequality]
-                for key, value in coefficient_dict.items():
-                    coefficient_dict[key] = -value
-                result = {'<=':coefficient_dict}
-
-            self._standard_constraints.append(result)
-
-    def __update_variable_list_with_constraint(self):
-        """
-        Updates the list of variables used in the Linear Programming Problem
-        after new constraint is added
-        """
-
-        unique_vars = set(self._variables)
-        for _, variables in self._standard_constraints[-1].items():
-            for var in variables:
-                if var != 'sol':
-                    unique_vars.add(var)
-        self._variables = sorted(list(unique_vars))
-
-    def __update_variable_list_with_objective(self):
-        """
-        Updates the list of variables used in the Linear Programming Problem
-        after objective is added
-        """
-
-        unique_vars = set(self._variables)
-        for var in self._standard_objective:
-            unique_vars.add(var)
-        self._variables = sorted(list(unique_vars))
+        self._use_dual_simplex = False
+        self._use_numeric_big_m = numeric
+
+    def __add_variables(self, coefficient_dict: Dict) -> None:
+        """
+        Adds the variables of an objective or constraint to the variables used
+        in the Linear Programming Problem. Ordering is deferred until required
+        """
+
+        for var in coefficient_dict:
+            if (var != 'sol') and (var not in self._variable_index):
+                self._variable_index[var] = len(self._variable_index)
+                self._sorted_variables = None
 
     def __create_objective_row_from_lp(self) -> List:
         """
@@ -225,7 +412,7 @@ class LinearProblem():
         
         obj_row = []
         # adding the coefficients of the variables in the objective function
-        for var in self._variables:
+        for var in self.variables:
             obj_coefficient = -obtain_coefficient_from_dict(self._standard_objective, var)
             obj_row.append(obj_coefficient)
 
@@ -243,7 +430,10 @@ class LinearProblem():
             else:
                 # if minimization problem, set value as (-1*M)
                 sign = -1
-            obj_row.append(sign*M)
+            if self._use_numeric_big_m:
+                obj_row.append(BigMValue(0, sign))
+            else:
+                obj_row.append(sign*M)
         
         # add initial solution value of 0
         obj_row.append(0)
@@ -254,97 +444,185 @@ class LinearProblem():
         # return objective row
         return obj_row
     
-    def __create_constraint_row_from_lp(self, constraint : Dict, constraint_id : int) -> List:
+    def __create_constraint_entries_from_lp(self, constraint : Dict, constraint_id : int) -> Tuple[Dict[int, float], float]:
         """
-        Generates the contents of the given constraint row to be added to simplex matrix
+        Generates the entries of the given constraint row to be added to simplex matrix
+        as a dictionary of column index and coefficient for the participating variables
+        along with the RHS value
         """
 
-        row_list = []
         operator = next(iter(constraint)) # operator of type >=, <= or =
         coefficient_dict = constraint[operator] # dictionary of decision variables and coefficients
 
-        # counter for adding the basic var id
-        var_count = 1
+        n_variables = len(self.variables)
+        var_index = self._column_index
 
-        # adding the coefficients of each decision variable
-        for var in self._variables:
-            coeff_var = obtain_coefficient_from_dict(coefficient_dict, var)
-            row_list.append(coeff_var)
-            var_count += 1
+        # adding the coefficients of each decision variable in the constraint
+        entries = {}
+        for var, coeff_var in coefficient_dict.items():
+            if var != 'sol':
+                entries[var_index[var]] = coeff_var
 
         # marking the relevant slack variable for each constraint based on constraint id
-        for i in range(self._n_slack_vars):
-            if i == constraint_id:
-                if operator == '<=':
-                    row_list.append(1)
-
-                    # add basic variable id for slack variable
-                    self._basic_vars.append(var_count)
-                elif operator == '>=':
-                    row_list.append(-1)
-                elif operator == '=':
-                    row_list.append(0)
-            else:
-                row_list.append(0)
-            var_count += 1
-        
+        if constraint_id < self._n_slack_vars:
+            slack_col = n_variables + constraint_id
+            if operator == '<=':
+                entries[slack_col] = 1
+
+                # add basic variable id for slack variable
+                self._basic_vars.append(slack_col + 1)
+            elif operator == '>=':
+                entries[slack_col] = -1
+
         # marking the relevant artificial variable for constraints with >= or =
-        for j in range(self._n_artificials):
-            if operator in ['>=', '=']:
-                if j == self._artificial_count:
-                    row_list.append(1)
-
-                    # add basic variable id for artificial variable
-                    self._basic_vars.append(var_count)
-                    
-                    self._artificial_count += 1
-                    for _ in range(self._n_artificials - self._artificial_count):
-                        row_list.append(0)
-                    
-                    break
-                else:
-                    row_list.append(0)
+        if (operator in ['>=', '=']) & (self._artificial_count < self._n_artificials):
+            artificial_col = n_variables + self._n_slack_vars + self._artificial_count
+            entries[artificial_col] = 1
 
-            else:
-                row_list.append(0)
-            var_count += 1
+            # add basic variable id for artificial variable
+            self._basic_vars.append(artificial_col + 1)
+            self._artificial_count += 1
+
+        # return the constraint entries and the RHS value of the constraint
+        return entries, coefficient_dict['sol']
+
+    def __create_constraint_row_from_lp(self, constraint : Dict, constraint_id : int) -> List:
+        """
+        Generates the contents of the given constraint row to be added to simplex matrix
+        """
+
+        entries, rhs = self.__create_constraint_entries_from_lp(constraint, constraint_id)
+
+        row_list = [0] * (len(self.variables) + self._n_slack_vars + self._n_artificials)
+        for col, coeff in entries.items():
+            row_list[col] = coeff
 
         # add the RHS value of each constraint
-        row_list.append(coefficient_dict['sol'])
+        row_list.append(rhs)
         
         # return the constraint row to add to simplex matrix
         return row_list
 
-    def standardize_problem(self) -> StandardProblem:
+    def __standardize_array_constraints(self, sparse: bool) -> StandardProblem:
+        """
+        Lays out the constraints given as coefficient arrays directly into the
+        simplex matrix with the same slack and artificial variable columns as
+        the standardized constraints
+        """
+
+        var_names, blocks = self._array_constraints
+        n_variables = len(var_names)
+        self._column_index = {var: i for i, var in enumerate(self.variables)}
+        column_order = np.array([self._column_index[var] for var in var_names], dtype=np.int64)
+
+        # stacking the <= rows followed by the = rows
+        rows, cols, values = [np.empty(0, np.int64)], [np.empty(0, np.int64)], [np.empty(0)]
+        rhs, is_equality = [np.empty(0)], [np.empty(0, bool)]
+        n_rows = 0
+        for operator, (block_rows, block_cols, block_values, block_n_rows), block_rhs in blocks:
+            rows.append(block_rows + n_rows)
+            cols.append(column_order[block_cols])
+            values.append(block_values)
+            rhs.append(block_rhs)
+            is_equality.append(np.full(block_n_rows, operator == '='))
+            n_rows += block_n_rows
+        rows, cols, values = np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+        rhs, is_equality = np.concatenate(rhs), np.concatenate(is_equality)
+
+        # if using bigM method, negate the constraints with a negative solution / RHS value
+        # turning the <= constraints into >= constraints
+        if self._use_dual_simplex:
+            is_gte = np.zeros(n_rows, dtype=bool)
+        else:
+            is_negative = rhs < 0
+            rhs = np.where(is_negative, -rhs, rhs)
+            values = np.where(is_negative[rows], -values, values)
+            is_gte = is_negative & ~is_equality
+
+        # slack variable of each <= or >= constraint and artificial variable of each >= or = constraint
+        self._n_slack_vars = int(np.count_nonzero(~is_equality))
+        has_artificial = is_equality | is_gte
+        self._n_artificials = int(np.count_nonzero(has_artificial))
+        slack_rows = np.flatnonzero(~is_equality)
+        artificial_rows = np.flatnonzero(has_artificial)
+        slack_cols = n_variables + slack_rows
+        artificial_cols = n_variables + self._n_slack_vars + np.arange(self._n_artificials)
+
+        self._basic_vars = []
+        obj_row = self.__create_objective_row_from_lp()
+        basic_cols = np.empty(n_rows, dtype=np.int64)
+        basic_cols[slack_rows] = slack_cols
+        basic_cols[artificial_rows] = artificial_cols
+        self._basic_vars.extend((basic_cols + 1).tolist())
+
+        rows = np.concatenate((rows, slack_rows, artificial_rows))
+        cols = np.concatenate((cols, slack_cols, artificial_cols))
+        values = np.concatenate((values, np.where(is_gte[slack_rows], -1.0, 1.0), np.ones(self._n_artificials)))
+        n_cols = n_variables + self._n_slack_vars + self._n_artificials
+        rows, cols, values = sum_duplicates(rows, cols, values, n_cols)
+
+        if sparse:
+            indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=n_rows))))
+            simplex_matrix = SparseTableau.from_csr(obj_row, values, cols, indptr, rhs.tolist())
+        else:
+            constraint_matrix = np.zeros((n_rows, n_cols + 1))
+            constraint_matrix[rows, cols] = values
+            constraint_matrix[:, -1] = rhs
+            simplex_matrix = [obj_row] + constraint_matrix.tolist()
+
+        # create the Standard Problem object
+        return StandardProblem(
+            matrix= simplex_matrix,
+            basic_vars= self._basic_vars,
+            n_decision_vars= n_variables,
+            is_max= self.is_max,
+            n_artificials= self._n_artificials,
+            var_name_list= self.variables.copy()
+        )
+
+    def standardize_problem(self, sparse: bool = False) -> StandardProblem:
         """
         Convert the given Linear Programming problem into a Standardized Linear 
         Programming Problem for computation
 
+        Parameters
+        ----------
+        sparse : bool (default : False)
+            Build the simplex matrix directly as a sparse tableau holding only the 
+            nonzero coefficients of each constraint instead of full dense rows
+
         Return
         ---
         StandardProblem object with LinearProblem converted for computation
         """
+
+        if self._array_constraints is not None:
+            return self.__standardize_array_constraints(sparse)
         
+        # copy of the parsed constraints to be converted for computation
+        standard_constraints = [{operator: coefficient_dict.copy() for operator, coefficient_dict in constraint.items()}
+                                for constraint in self._standard_constraints]
+
         # calculating number of slack variables required
         slack_var_operators = ['>=', '<=']
         self._n_slack_vars = 0 
-        for constraint in self._standard_constraints:
+        for constraint in standard_constraints:
             for operator in constraint:
                 if operator in slack_var_operators:
                     self._n_slack_vars += 1
 
         # if using dual simplex, convert all >= constraints to <=
         if self._use_dual_simplex:
-            self._standard_constraints = convert_gte_to_lte(self._standard_constraints)
+            standard_constraints = convert_gte_to_lte(standard_constraints)
 
         # if using bigM method, convert all constraints to have a positive solution / RHS value
         else:
-            self._standard_constraints = transform_to_positive_constraints(self._standard_constraints)
+            standard_constraints = transform_to_positive_constraints(standard_constraints)
 
         # calculating number of artificial variables required
         artificial_var_operators = ['=','>=']
         self._n_artificials = 0 
-        for constraint in self._standard_constraints:
+        for constraint in standard_constraints:
             for operator in constraint:
                 if operator in artificial_var_operators:
                     self._n_artificials += 1
@@ -352,6 +630,7 @@ class LinearProblem():
         # initialize simplex matrix
         simplex_matrix = []
         self._basic_vars = []
+        self._column_index = {var: i for i, var in enumerate(self.variables)}
 
         # generate objective row and add to simplex matrix
         obj_row = self.__create_objective_row_from_lp()
@@ -361,16 +640,22 @@ class LinearProblem():
                                                 # artificial variables in the simplex matrix
         
         # generate the constraint row to add to simplex matrix 
-        for c_id, constraint in enumerate(self._standard_constraints):
-            row_list = self.__create_constraint_row_from_lp(constraint, c_id)
-            simplex_matrix.append(row_list)
+        if sparse:
+            constraint_entries = [self.__create_constraint_entries_from_lp(constraint, c_id)
+                                  for c_id, constraint in enumerate(standard_constraints)]
+            simplex_matrix = SparseTableau.from_rows(obj_row, [entries for entries, _ in constraint_entries],
+                                                     [rhs for _, rhs in constraint_entries])
+        else:
+            for c_id, constraint in enumerate(standard_constraints):
+                row_list = self.__create_constraint_row_from_lp(constraint, c_id)
+                simplex_matrix.append(row_list)
         
         # create the Standard Problem object
         return StandardProblem(
             matrix= simplex_matrix,
             basic_vars= self._basic_vars,
-            n_decision_vars= len(self._variables),
+            n_decision_vars= len(self.variables),
             is_max= self.is_max,
             n_artificials= self._n_artificials,
-            var_name_list= self._variables
+            var_name_list= self.variables.copy()
         )
\ No newline at end of file
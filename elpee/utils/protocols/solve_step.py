@@ -0,0 +1,44 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Generator, Literal, NamedTuple, Optional, TypeVar
+
+T = TypeVar('T')
+
+class SolveStep(NamedTuple):
+    """
+    Record of a step applied while solving a LP problem
+
+    Attributes
+    ----------
+    phase : str (Options : ["feasibility","optimization"])
+        "feasibility"  : Step generating the initial feasible solution
+        "optimization" : Pivot improving a feasible solution
+    iteration : int
+        Number of pivots applied up to and including the step
+    entering : str | None
+        Name of the variable entering the basis. None if the basis did not change
+    leaving : str | None
+        Name of the variable leaving the basis. None if the basis did not change
+    objective_value : float | elpee.utils.bigm.BigMValue | sympy expression
+        Value of the objective function after the step
+    tableau : elpee.utils.protocols.tableau.Tableau | List[List] | None
+        Simplex matrix after the step if requested. Refers to the matrix being
+        solved (not a copy), so it changes with the following steps
+    """
+    phase: Literal['feasibility', 'optimization']
+    iteration: int
+    entering: Optional[str]
+    leaving: Optional[str]
+    objective_value: object
+    tableau: object = None
+
+def run_steps(steps: Generator[SolveStep, None, T]) -> T:
+    """
+    Runs the steps of a solve to completion and returns the solved problem
+    """
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
@@ -0,0 +1,298 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from elpee.utils.protocols.tableau import DenseTableau, Tableau, split_big_m_row
+
+class SparseTableau(Tableau):
+    """
+    Class to represent the simplex matrix of a `elpee.StandardProblem` with
+    the constraint rows stored as sparse arrays of the nonzero entries only.
+    The objective row and the solution column are kept dense.
+
+    Each constraint row holds a sorted array of column indices and an array
+    of values (the rows of a CSR matrix). A column to rows index (the
+    pattern of the CSC matrix) is maintained alongside so that a pivot only
+    touches the rows with a nonzero in the pivot column.
+
+    Attributes
+    ----------
+    row_indices : `List[numpy.ndarray]`
+        sorted 0-based column indices of the nonzero entries of each constraint row
+    row_values : `List[numpy.ndarray]`
+        values of the nonzero entries of each constraint row
+    col_rows : `List[set]`
+        0-based constraint rows having a nonzero entry for each column
+    m_row : `numpy.ndarray` | `None`
+        coefficients of M in the objective row. `None` if no big M values are used
+    drop_tolerance : `float`
+        entries with an absolute value not larger than the tolerance are
+        removed after a pivot. By default only exact zeros are removed
+
+    Methods
+    -------
+    from_matrix(matrix) -> `SparseTableau`
+        Creates the tableau from a list of lists simplex matrix
+    from_rows(obj_row, rows, rhs) -> `SparseTableau`
+        Creates the tableau from the nonzero entries of each constraint row
+    from_csr(obj_row, data, indices, indptr, rhs) -> `SparseTableau`
+        Creates the tableau from CSR arrays of the constraint rows
+    from_dense(tableau) -> `SparseTableau`
+        Creates the tableau from a `DenseTableau`
+    to_csr() -> `Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]`
+        Converts the constraint rows into CSR arrays (data, indices, indptr)
+    to_dense() -> `DenseTableau`
+        Converts the tableau into a dense tableau
+    to_list() -> `List[List[float]]`
+        Converts the tableau into the list of lists simplex matrix
+    pivot(pivot_row, pivot_col_var)
+        Applies a Gauss-Jordan pivot on the given cell touching only the nonzeros
+    """
+
+    def __init__(self, objective: Iterable[float], row_indices: List[np.ndarray],
+                 row_values: List[np.ndarray], rhs: Iterable[float], m_row: Iterable[float] = None,
+                 drop_tolerance: float = 0.0):
+        self.__objective = np.array(objective, dtype=np.float64)
+        self.__rhs = np.array(rhs, dtype=np.float64)
+        self.row_indices = [np.asarray(idx, dtype=np.int64) for idx in row_indices]
+        self.row_values = [np.asarray(val, dtype=np.float64) for val in row_values]
+        self.drop_tolerance = drop_tolerance
+
+        if len(self.row_indices) != len(self.__rhs):
+            raise ValueError(f"Number of constraint rows {len(self.row_indices)} and " +
+                             f"length of solution column {len(self.__rhs)} do not match.")
+
+        self.col_rows = [set() for _ in range(self.n_cols)]
+        for i, idx in enumerate(self.row_indices):
+            for col in idx.tolist():
+                self.col_rows[col].add(i)
+
+        self.m_row = None
+        if m_row is not None:
+            self.m_row = np.array(m_row, dtype=np.float64)
+            self._clean_m_row()
+
+    @classmethod
+    def from_rows(cls, obj_row: List, rows: Iterable[Dict[int, float]], rhs: Iterable[float]):
+        """
+        Creates the tableau from the nonzero entries of each constraint row
+
+        Parameters
+        ----------
+        obj_row : `List`
+            objective row including the solution value. May contain big M values
+        rows : `Iterable[Dict[int, float]]`
+            dictionaries of 0-based column index and value for each constraint row
+        rhs : `Iterable[float]`
+            solution value of each constraint row
+        """
+        objective, m_coeffs = split_big_m_row(obj_row)
+
+        row_indices = []
+        row_values = []
+        for row in rows:
+            cols = sorted(col for col, value in row.items() if value != 0)
+            row_indices.append(np.array(cols, dtype=np.int64))
+            row_values.append(np.array([row[col] for col in cols], dtype=np.float64))
+
+        return cls(objective, row_indices, row_values, list(rhs),
+                   m_coeffs if any(m_coeffs) else None)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        rows = [{col: value for col, value in enumerate(row[:-1]) if value != 0} for row in matrix[1:]]
+        return cls.from_rows(matrix[0], rows, [row[-1] for row in matrix[1:]])
+
+    @classmethod
+    def from_csr(cls, obj_row: List, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray,
+                 rhs: Iterable[float]):
+        """
+        Creates the tableau from CSR arrays of the constraint rows. Column
+        indices of each row are expected in sorted order
+        """
+        objective, m_coeffs = split_big_m_row(obj_row)
+        row_indices = [indices[indptr[i]:indptr[i+1]] for i in range(len(indptr)-1)]
+        row_values = [data[indptr[i]:indptr[i+1]] for i in range(len(indptr)-1)]
+        return cls(objective, row_indices, row_values, rhs, m_coeffs if any(m_coeffs) else None)
+
+    @classmethod
+    def from_dense(cls, tableau: DenseTableau):
+        """
+        Creates the tableau from a `DenseTableau`
+        """
+        constraints = tableau.array[1:, :-1]
+        row_indices = [np.flatnonzero(row) for row in constraints]
+        row_values = [row[idx] for row, idx in zip(constraints, row_indices)]
+        return cls(tableau.objective, row_indices, row_values, tableau.rhs, tableau.m_row)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.row_indices) + 1
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.__objective) - 1
+
+    @property
+    def nnz(self) -> int:
+        """
+        Number of nonzero entries stored for the constraint rows
+        """
+        return sum(len(idx) for idx in self.row_indices)
+
+    @property
+    def objective(self) -> np.ndarray:
+        return self.__objective
+
+    @property
+    def rhs(self) -> np.ndarray:
+        return self.__rhs
+
+    def __get_value(self, row_i: int, col: int) -> float:
+        """
+        Obtains the value of the 0-based constraint row at the 0-based column
+        """
+        idx = self.row_indices[row_i]
+        pos = idx.searchsorted(col)
+        if (pos < len(idx)) and (idx[pos] == col):
+            return float(self.row_values[row_i][pos])
+        return 0.0
+
+    def column(self, col_var: int) -> np.ndarray:
+        col = col_var - 1
+        values = np.zeros(len(self.row_indices))
+        for row_i in self.col_rows[col]:
+            values[row_i] = self.__get_value(row_i, col)
+        return values
+
+    def row(self, row_i: int) -> np.ndarray:
+        if row_i == 0:
+            return self.__objective[:-1]
+        values = np.zeros(self.n_cols)
+        values[self.row_indices[row_i-1]] = self.row_values[row_i-1]
+        return values
+
+    def col_norms(self, cols: np.ndarray = None) -> np.ndarray:
+        if not self.row_indices:
+            norms = np.zeros(self.n_cols)
+        else:
+            values = np.concatenate(self.row_values)
+            norms = np.bincount(np.concatenate(self.row_indices), weights=values*values,
+                                minlength=self.n_cols)
+        return norms if cols is None else norms[cols]
+
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Converts the constraint rows into CSR arrays (data, indices, indptr).
+        The solution column is not included
+        """
+        indptr = np.zeros(len(self.row_indices)+1, dtype=np.int64)
+        np.cumsum([len(idx) for idx in self.row_indices], out=indptr[1:])
+        if not self.row_indices:
+            return np.zeros(0), np.zeros(0, dtype=np.int64), indptr
+        return np.concatenate(self.row_values), np.concatenate(self.row_indices), indptr
+
+    def to_dense(self) -> DenseTableau:
+        """
+        Converts the tableau into a dense tableau
+        """
+        array = np.zeros((self.n_rows, self.n_cols + 1))
+        array[0] = self.__objective
+        for i, (idx, val) in enumerate(zip(self.row_indices, self.row_values)):
+            array[i+1, idx] = val
+        array[1:, -1] = self.__rhs
+        return DenseTableau(array, self.m_row)
+
+    def to_list(self) -> List[List[float]]:
+        """
+        Converts the tableau into the list of lists simplex matrix
+        """
+        return self.to_dense().to_list()
+
+    def copy(self):
+        """
+        Create a copy of the tableau
+        """
+        return SparseTableau(self.__objective, [idx.copy() for idx in self.row_indices],
+                             [val.copy() for val in self.row_values], self.__rhs, self.m_row,
+                             self.drop_tolerance)
+
+    def __set_row(self, row_i: int, indices: np.ndarray, values: np.ndarray) -> None:
+        """
+        Replaces the entries of a constraint row and updates the column to rows index
+        """
+        keep = np.abs(values) > self.drop_tolerance
+        indices = indices[keep]
+        old_cols = set(self.row_indices[row_i].tolist())
+        new_cols = set(indices.tolist())
+
+        for col in old_cols - new_cols:
+            self.col_rows[col].discard(row_i)
+        for col in new_cols - old_cols:
+            self.col_rows[col].add(row_i)
+
+        self.row_indices[row_i] = indices
+        self.row_values[row_i] = values[keep]
+
+    def round(self, decimals: int) -> None:
+        np.round(self.__objective, decimals, out=self.__objective)
+        np.round(self.__rhs, decimals, out=self.__rhs)
+        if self.m_row is not None:
+            np.round(self.m_row, decimals, out=self.m_row)
+        for row_i in range(len(self.row_indices)):
+            self.__set_row(row_i, self.row_indices[row_i], np.round(self.row_values[row_i], decimals))
+
+    def pivot(self, pivot_row: int, pivot_col_var: int) -> None:
+        """
+        Scales the pivot row to have 1 at the pivot column and eliminates the
+        pivot column from the rows with a nonzero in the pivot column by merging
+        the sparse pivot row into them
+        """
+        col = pivot_col_var - 1
+        piv_i = pivot_row - 1
+
+        pivot_cell = self.__get_value(piv_i, col)
+        if pivot_cell == 0:
+            raise ZeroDivisionError(f"Pivot element at row {pivot_row} column {pivot_col_var} is zero")
+        if pivot_cell != 1:
+            self.row_values[piv_i] = self.row_values[piv_i] / pivot_cell
+            self.__rhs[piv_i] /= pivot_cell
+
+        piv_idx = self.row_indices[piv_i]
+        piv_val = self.row_values[piv_i]
+        piv_rhs = self.__rhs[piv_i]
+
+        for row_i in sorted(self.col_rows[col] - {piv_i}):
+            factor = self.__get_value(row_i, col)
+            idx = self.row_indices[row_i]
+            merged_idx = np.union1d(idx, piv_idx)
+            merged_val = np.zeros(len(merged_idx))
+            merged_val[np.searchsorted(merged_idx, idx)] = self.row_values[row_i]
+            merged_val[np.searchsorted(merged_idx, piv_idx)] -= factor * piv_val
+            self.__set_row(row_i, merged_idx, merged_val)
+            self.__rhs[row_i] -= factor * piv_rhs
+
+        factor = self.__objective[col]
+        if factor != 0:
+            self.__objective[piv_idx] -= factor * piv_val
+            self.__objective[-1] -= factor * piv_rhs
+
+        if (self.m_row is not None) and (self.m_row[col] != 0):
+            factor = self.m_row[col]
+            self.m_row[piv_idx] -= factor * piv_val
+            self.m_row[-1] -= factor * piv_rhs
+            self._clean_m_row()
+
+    def is_canonical(self, basic_vars: List[int]) -> bool:
+        for row_i, var in enumerate(basic_vars[1:]):
+            col = var - 1
+            if self.col_rows[col] != {row_i}:
+                return False
+            if (self.__get_value(row_i, col) != 1) or (self.__objective[col] != 0):
+                return False
+            if (self.m_row is not None) and (self.m_row[col] != 0):
+                return False
+        return True
@@ -1,10 +1,15 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Dict, List
+from typing import Dict, Iterator, List, Union
+import numpy as np
 from sympy import Symbol
 
-from elpee.utils.utilities import extract_elem_from_simplex_matrix
+from elpee.utils.events import EventsOption, get_event_sink
+from elpee.utils.protocols.sparse_tableau import SparseTableau
+from elpee.utils.protocols.tableau import DenseTableau, Tableau
+from elpee.utils.settings import get_settings
+from elpee.utils.utilities import fix_feasible_0_1_pattern, pivot_simplex_matrix, round_off_elem
 
 M = Symbol('M')
 
@@ -30,18 +35,49 @@ class StandardProblem():
     n_constraints : `int`
         number of constraints given to the problem
     var_name_list : `List[str]`
+    tableau : `elpee.utils.protocols.tableau.Tableau` | `None`
+        numpy array backed simplex matrix if the problem uses a dense or sparse 
+        tableau. `matrix` remains readable as a list of lists converted from the tableau
+    n_iterations : `int`
+        number of pivots applied by the solver to reach the solution
+    n_degenerate_pivots : `int`
+        number of pivots on a zero solution value (the solution does not move)
 
     Methods
     -------
     copy() -> `elpee.StandardProblem`
         Creates a copy of the given Standard Problem
+    snapshot() -> `elpee.StandardProblem`
+        Creates an independent copy including the variable names and the status
+    use_dense_tableau()
+        Stores the simplex matrix in a numpy array backed dense tableau
+    use_sparse_tableau()
+        Stores the simplex matrix in a sparse tableau holding only the nonzero entries
+    iter_rows() -> `Iterator[List]`
+        Iterates over the rows of the simplex matrix without converting the whole tableau
+    pivot(pivot_row, pivot_col_var)
+        Applies a single Gauss-Jordan pivot making the pivot column a basic variable
+    get_variable_name(var_idx) -> `str`
+        Obtains the name of the variable of a column
+    get_variable_index(var_name) -> `int`
+        Obtains the column of the variable with the given name
+    export_basis() -> `List[str]`
+        Obtains the names of the basic variables in the order of the constraint rows
+    apply_basis(basis)
+        Pivots the simplex matrix onto the basis given by variable names (warm start)
     interpret() -> `Dict`
         Creates a dictionary of variables and values for the given Standard Problem
     """
     
     def __init__(self, matrix: List[List[int]], basic_vars: List[int], n_decision_vars: int, 
-                 is_max: bool = True, n_artificials: int = 0, var_name_list: List[str] = None):
+                 is_max: bool = True, n_artificials: int = 0, var_name_list: List[str] = None,
+                 dense: bool = False, sparse: bool = False):
+        self.tableau = None
         self.matrix = matrix
+        if dense:
+            self.use_dense_tableau()
+        elif sparse:
+            self.use_sparse_tableau()
         self.basic_vars = basic_vars
         self.n_decision_vars = n_decision_vars
         self.is_max = is_max
@@ -53,6 +89,8 @@ class StandardProblem():
         self.__is_optimal = False # deafult
         self.__reachable_optimal = True # default - does the LP Problem reach an optimal solution
         self.__n_alternates = 0 # default
+        self.__n_iterations = 0 # default - number of pivots applied by the solver
+        self.__n_degenerate_pivots = 0 # default - number of pivots not changing the solution
 
         if self.var_name_list != None:
             # if list of variable names are provided - the number of names provided should match 
@@ -75,8 +113,171 @@ class StandardProblem():
         """
         Class method to calculate the number of constraints used for the problem
         """
+        if self.tableau is not None:
+            return self.tableau.n_rows - 1
         return len(self.matrix) - 1
+
+    def use_dense_tableau(self):
+        """
+        Class method to store the simplex matrix in a numpy array backed dense tableau.
+        Row operations of the solvers are then applied as vectorized array operations
+        """
+        if self.tableau is None:
+            self.tableau = DenseTableau(self.__matrix)
+            self.__matrix = None
+        elif isinstance(self.tableau, SparseTableau):
+            self.tableau = self.tableau.to_dense()
+
+    def use_sparse_tableau(self):
+        """
+        Class method to store the simplex matrix in a sparse tableau. Pivots then 
+        only update the nonzero entries of the rows with a nonzero in the pivot column
+        """
+        if self.tableau is None:
+            self.tableau = SparseTableau.from_matrix(self.__matrix)
+            self.__matrix = None
+        elif isinstance(self.tableau, DenseTableau):
+            self.tableau = SparseTableau.from_dense(self.tableau)
+
+    @property
+    def matrix(self):
+        """
+        The simplex matrix as a list of lists. Converted from the tableau if the 
+        problem uses a dense or sparse tableau
+        """
+        if self.tableau is not None:
+            return self.tableau.to_list()
+        return self.__matrix
+
+    def iter_rows(self) -> Iterator[List]:
+        """
+        Iterates over the rows of the simplex matrix. Rows of a dense or sparse
+        tableau are converted to lists one at a time instead of converting the
+        whole tableau
+        """
+        if self.tableau is not None:
+            return self.tableau.iter_rows()
+        return iter(self.__matrix)
+
+    @matrix.setter
+    def matrix(self, matrix):
+        if isinstance(matrix, Tableau):
+            self.tableau = matrix
+            self.__matrix = None
+        elif (self.tableau is not None) & (matrix is not None):
+            self.tableau = type(self.tableau).from_matrix(matrix)
+        else:
+            self.tableau = None
+            self.__matrix = matrix
     
+    def pivot(self, pivot_row: int, pivot_col_var: int):
+        """
+        Class method to apply a single Gauss-Jordan pivot on the simplex matrix making
+        `pivot_col_var` the basic variable of `pivot_row`. The 0-1 pattern of the other
+        basic variable columns is retained when the matrix already has the pattern
+        """
+        if self.tableau is not None:
+            self.tableau.pivot(pivot_row, pivot_col_var)
+        else:
+            pivot_simplex_matrix(self.__matrix, pivot_row, pivot_col_var)
+        self.basic_vars[pivot_row] = pivot_col_var
+
+    def get_variable_name(self, var_idx: int) -> str:
+        """
+        Class method to obtain the name of the variable of the column `var_idx` (1-based).
+        Slack and artificial variables are named as Slack_i and Artificial_i
+        """
+        if var_idx <= self.n_decision_vars:
+            return self.var_name_list[var_idx-1]
+        var_idx -= self.n_decision_vars
+        if var_idx <= self.n_slack_vars:
+            return f"Slack_{var_idx}"
+        var_idx -= self.n_slack_vars
+        if var_idx <= self.n_artificials:
+            return f"Artificial_{var_idx}"
+        return "Unknown"
+
+    def get_variable_index(self, var_name: str) -> int:
+        """
+        Class method to obtain the column (1-based) of the variable named `var_name`.
+        Returns -1 if the problem has no such variable
+        """
+        if var_name in self.var_name_list:
+            return self.var_name_list.index(var_name) + 1
+        for prefix, offset, n_vars in [("Slack_", self.n_decision_vars, self.n_slack_vars),
+                                       ("Artificial_", self.n_decision_vars + self.n_slack_vars, self.n_artificials)]:
+            if var_name.startswith(prefix) and var_name[len(prefix):].isdigit():
+                var_idx = int(var_name[len(prefix):])
+                if 1 <= var_idx <= n_vars:
+                    return offset + var_idx
+        return -1
+
+    def export_basis(self) -> List[str]:
+        """
+        Class method to obtain the names of the basic variables in the order of the
+        constraint rows. Names are used so that the basis can be applied to a problem
+        with the variables in a different order
+        """
+        return [self.get_variable_name(var) for var in self.basic_vars[1:]]
+
+    def __get_column(self, col_var: int) -> np.ndarray:
+        """
+        Class method to obtain the values of the constraint rows in the column of `col_var`
+        """
+        if self.tableau is not None:
+            return np.asarray(self.tableau.column(col_var), dtype=np.float64)
+        return np.array([row[col_var-1] for row in self.__matrix[1:]], dtype=np.float64)
+
+    def apply_basis(self, basis: Union[List[str], "StandardProblem"], pivot_tolerance: float = 1e-9,
+                    events: EventsOption = None):
+        """
+        Class method to pivot the simplex matrix onto a basis given by variable names
+        (warm start). The 0-1 pattern is fixed for the current basic variables first.
+        Each variable of the basis not yet basic then replaces the basic variable outside
+        the given basis with the largest pivot element in its column. Solution values
+        may turn negative, which the solvers handle with dual simplex steps
+
+        Parameters
+        ----------
+        basis : `List[str]` | `elpee.StandardProblem`
+            names of the basic variables (as given by `export_basis`) or a solved
+            problem to take the basis from. Names not found in the problem are skipped
+        pivot_tolerance : `float`
+            smallest absolute value accepted as a pivot element
+        events : `elpee.utils.events.EventSink` | `logging.Logger` | Callable
+            sink receiving the messages on the skipped variables. Printed if `None`
+        """
+        events = get_event_sink(events)
+        if isinstance(basis, StandardProblem):
+            basis = basis.export_basis()
+
+        target_vars = []
+        for var_name in basis:
+            var_idx = self.get_variable_index(var_name)
+            if var_idx == -1:
+                events.emit("warm_start", "Variable %s of the warm start basis is not in the problem - skipped", var_name)
+            elif var_idx not in target_vars:
+                target_vars.append(var_idx)
+
+        if self.tableau is not None:
+            if not self.tableau.is_canonical(self.basic_vars):
+                self.tableau.canonicalize(self.basic_vars)
+        else:
+            fix_feasible_0_1_pattern(self.basic_vars, self.__matrix)
+
+        for var_idx in target_vars:
+            if var_idx in self.basic_vars:
+                continue
+            column = np.abs(self.__get_column(var_idx))
+            # rows of basic variables outside the given basis can be replaced
+            replaceable = np.array([var not in target_vars for var in self.basic_vars[1:]], dtype=bool)
+            candidates = np.flatnonzero(replaceable & (column > pivot_tolerance))
+            if candidates.size == 0:
+                events.emit("warm_start", "Variable %s of the warm start basis cannot enter the basis - skipped",
+                            self.get_variable_name(var_idx))
+                continue
+            self.pivot(int(candidates[np.argmax(column[candidates])]) + 1, var_idx)
+
     def update_feasible_status(self, feasibility_status):
         """
         Class method to update the feasibility status to True/False depending on the checks
@@ -101,6 +302,14 @@ class StandardProblem():
         """
         self.__n_alternates = n_alternates
 
+    def update_pivot_counts(self, n_iterations, n_degenerate_pivots):
+        """
+        Class method to update the number of pivots applied by the solver and the number of
+        degenerate pivots among them (pivots on a zero solution value which do not move the solution)
+        """
+        self.__n_iterations = n_iterations
+        self.__n_degenerate_pivots = n_degenerate_pivots
+
     @property
     def is_feasible(self):
         return self.__is_feasible
@@ -116,12 +325,22 @@ class StandardProblem():
     @property
     def num_alternates(self):
         return self.__n_alternates
+
+    @property
+    def n_iterations(self):
+        return self.__n_iterations
+
+    @property
+    def n_degenerate_pivots(self):
+        return self.__n_degenerate_pivots
     
     @property
     def obj_row(self):
         """
         Public class function to obtain the objective row in the matrix
         """
+        if self.tableau is not None:
+            return self.tableau.obj_row
         return self.matrix[0][:-1]
     
     def copy(self):
@@ -130,13 +349,40 @@ class StandardProblem():
         """
         
         return StandardProblem(
-            matrix=self.matrix.copy(),
+            matrix=self.tableau.copy() if self.tableau is not None else self.matrix.copy(),
             basic_vars=self.basic_vars.copy(),
             n_decision_vars=self.n_decision_vars,
             is_max=self.is_max,
             n_artificials=self.n_artificials
         )
     
+    def snapshot(self):
+        """
+        Create an independent copy of the StandardProblem including the variable names
+        and the status, such as for saving a step while the solve continues
+        """
+
+        if self.tableau is not None:
+            matrix = self.tableau.copy()
+        else:
+            # elements of the matrix are numbers or sympy expressions which are not changed in place
+            matrix = [list(row) for row in self.__matrix]
+        problem = StandardProblem(
+            matrix=matrix,
+            basic_vars=self.basic_vars.copy(),
+            n_decision_vars=self.n_decision_vars,
+            is_max=self.is_max,
+            n_artificials=self.n_artificials,
+            var_name_list=self.var_name_list.copy()
+        )
+        problem.__is_feasible = self.__is_feasible
+        problem.__is_optimal = self.__is_optimal
+        problem.__reachable_optimal = self.__reachable_optimal
+        problem.__n_alternates = self.__n_alternates
+        problem.__n_iterations = self.__n_iterations
+        problem.__n_degenerate_pivots = self.__n_degenerate_pivots
+        return problem
+    
     def __eq__(self, other: object) -> bool:
         """
         Compares between two objects in StandardProblem class for similarity
@@ -167,27 +413,22 @@ class StandardProblem():
         - All basic variables & Decision variables
         """
 
-        def get_variable_name(self, var_idx):
-            if var_idx <= self.n_decision_vars:
-                return self.var_name_list[var_idx-1]
-            var_idx -= self.n_decision_vars
-            if var_idx <= self.n_slack_vars:
-                return f"Slack_{var_idx}"
-            var_idx -= self.n_slack_vars
-            if var_idx <= self.n_artificials:
-                return f"Artificial_{var_idx}"
-            return "Unknown"
+        if self.tableau is not None:
+            sol_col = self.tableau.sol_col
+        else:
+            sol_col = [row[-1] for row in self.matrix]
 
+        decimals = get_settings().get_decimals()
         interpret_dict = {}
-        interpret_dict['Sol'] = extract_elem_from_simplex_matrix(self.matrix, 0, -1)
+        interpret_dict['Sol'] = round_off_elem(sol_col[0], decimals)
 
         var_id_list = list(set(self.basic_vars).union(set(list(range(1, self.n_decision_vars+1)))))
 
         for var_id in var_id_list[1:]:
-            decision_var_name = get_variable_name(self, var_id)
+            decision_var_name = self.get_variable_name(var_id)
             
             if var_id in self.basic_vars:
-                interpret_dict[decision_var_name] = extract_elem_from_simplex_matrix(self.matrix, self.basic_vars.index(var_id), -1)
+                interpret_dict[decision_var_name] = round_off_elem(sol_col[self.basic_vars.index(var_id)], decimals)
             else: 
                 interpret_dict[decision_var_name] = 0
 
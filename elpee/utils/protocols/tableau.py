@@ -0,0 +1,390 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABC, abstractmethod
+from typing import Iterator, List
+
+import numpy as np
+from sympy import Basic, Symbol, expand
+
+from elpee.utils.bigm import M_COEFF_TOLERANCE, BigMValue, make_big_m
+
+def split_big_m_row(row):
+    """
+    Splits the objective row into the constants and the coefficients of M
+    for numeric and sympy big M values. Round off residues of the sympy
+    coefficients of M are removed
+    """
+    M = Symbol('M')
+
+    constants = []
+    m_coeffs = []
+    for elem in row:
+        if isinstance(elem, BigMValue):
+            constants.append(elem.constant)
+            m_coeffs.append(elem.m_coeff)
+        elif isinstance(elem, Basic):
+            elem = expand(elem)
+            constants.append(float(elem.subs(M, 0)))
+            m_coeff = float(elem.coeff(M))
+            m_coeffs.append(m_coeff if abs(m_coeff) > M_COEFF_TOLERANCE else 0)
+        else:
+            constants.append(elem)
+            m_coeffs.append(0)
+    return constants, m_coeffs
+
+class Tableau(ABC):
+    """
+    An abstract class for numpy array backed simplex matrices of a
+    `elpee.StandardProblem`
+
+    Big M values of the objective row are stored numerically as a pair of
+    planes: the constants of the objective row and the coefficients of M in
+    `m_row`. Objective values are compared lexicographically by the M
+    coefficient first.
+
+    Subclasses
+    ----------
+    DenseTableau
+        Simplex matrix stored in a single contiguous float64 array
+    SparseTableau
+        Simplex matrix with constraint rows stored as sparse index/value arrays
+    """
+
+    m_row = None
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+        Creates the tableau from a list of lists simplex matrix
+        """
+        return cls(matrix)
+
+    @property
+    @abstractmethod
+    def objective(self) -> np.ndarray:
+        """
+        Constants of the objective row including the solution value
+        """
+
+    @property
+    @abstractmethod
+    def rhs(self) -> np.ndarray:
+        """
+        Solution column of the constraint rows
+        """
+
+    @property
+    @abstractmethod
+    def n_rows(self) -> int:
+        """
+        Number of rows including the objective row
+        """
+
+    @property
+    @abstractmethod
+    def n_cols(self) -> int:
+        """
+        Number of variable columns (excluding the solution column)
+        """
+
+    @abstractmethod
+    def column(self, col_var: int) -> np.ndarray:
+        """
+        Values of the constraint rows in the column of variable `col_var`
+        """
+
+    @abstractmethod
+    def row(self, row_i: int) -> np.ndarray:
+        """
+        Constants of the row `row_i` (row 0 is the objective row) without the
+        solution value
+        """
+
+    @abstractmethod
+    def col_norms(self, cols: np.ndarray = None) -> np.ndarray:
+        """
+        Squared euclidean norms of the constraint rows part of the 0-based
+        columns `cols` (all columns if `None`)
+        """
+
+    @abstractmethod
+    def pivot(self, pivot_row: int, pivot_col_var: int) -> None:
+        """
+        Applies a Gauss-Jordan pivot making `pivot_col_var` the basic
+        variable of `pivot_row`
+        """
+
+    @abstractmethod
+    def is_canonical(self, basic_vars: List[int]) -> bool:
+        """
+        Checks if the columns of the basic variables have the 0-1 pattern
+        """
+
+    @abstractmethod
+    def round(self, decimals: int) -> None:
+        """
+        Rounds off all values in the tableau
+        """
+
+    def canonicalize(self, basic_vars: List[int]) -> None:
+        """
+        Fixes the 0-1 pattern for columns of basic variables in the order of
+        the rows they belong to
+        """
+        for row_i, basic_var in enumerate(basic_vars):
+            # no need to check 0-1 pattern for objective variable
+            if basic_var == 0:
+                continue
+            self.pivot(row_i, basic_var)
+
+    def _clean_m_row(self):
+        """
+        Removes round off residues from the coefficients of M
+        """
+        self.m_row[np.abs(self.m_row) <= M_COEFF_TOLERANCE] = 0
+
+    def _obj_row_with_big_m(self) -> List:
+        """
+        Merges the constants and the coefficients of M of the objective row
+        """
+        return [make_big_m(constant, m_coeff)
+                for constant, m_coeff in zip(self.objective.tolist(), self.m_row.tolist())]
+
+    @property
+    def obj_row(self):
+        """
+        View of the objective row without the solution value.
+        Given as a list with numeric big M values if M coefficients are present
+        """
+        if self.m_row is not None:
+            return self._obj_row_with_big_m()[:-1]
+        return self.objective[:-1]
+
+    def iter_rows(self) -> Iterator[List]:
+        """
+        Iterates over the rows of the list of lists simplex matrix, converting a
+        single row at a time
+        """
+        if self.m_row is not None:
+            yield self._obj_row_with_big_m()
+        else:
+            yield self.objective.tolist()
+        rhs = self.rhs
+        for row_i in range(1, self.n_rows):
+            row = self.row(row_i).tolist()
+            row.append(float(rhs[row_i-1]))
+            yield row
+
+    @property
+    def sol_col(self) -> List:
+        """
+        Solution column of all rows including the objective row
+        """
+        if self.m_row is not None:
+            obj_value = make_big_m(float(self.objective[-1]), float(self.m_row[-1]))
+        else:
+            obj_value = float(self.objective[-1])
+        return [obj_value] + self.rhs.tolist()
+
+    def reduced_cost_keys(self, is_max: bool, cols: np.ndarray = None):
+        """
+        Obtains the (M coefficient, constant) keys of the objective row signed
+        such that negative keys indicate improving columns. Keys are compared
+        lexicographically by the M coefficient first. Only the keys of the
+        0-based columns `cols` are obtained if given
+        """
+        sign = 1 if is_max else -1
+        constants = self.objective[:-1]
+        if cols is not None:
+            constants = constants[cols]
+        constants = sign * constants
+        if self.m_row is None:
+            return np.zeros_like(constants), constants
+        m_keys = self.m_row[:-1]
+        if cols is not None:
+            m_keys = m_keys[cols]
+        return sign * m_keys, constants
+
+    def has_negative_rhs(self, tolerance: float = 0.0) -> bool:
+        """
+        Checks if any constraint row has a solution value below `-tolerance`
+        """
+        return bool((self.rhs < -tolerance).any())
+
+    def is_optimal(self, is_max: bool) -> bool:
+        """
+        Checks if the objective row indicates an optimal solution
+        """
+        m_keys, constants = self.reduced_cost_keys(is_max)
+        return bool(((m_keys > 0) | ((m_keys == 0) & (constants >= 0))).all())
+
+    def select_pivot_col(self, is_max: bool, blocked_cols: List[int]) -> int:
+        """
+        Selects the most promising pivot column that is not blocked.
+        Returns -1 if there is no such column.
+        """
+        m_keys, constants = self.reduced_cost_keys(is_max)
+
+        n_negatives = np.count_nonzero((m_keys < 0) | ((m_keys == 0) & (constants < 0)))
+        if n_negatives <= len(blocked_cols):
+            return -1
+
+        # lexsort is stable and sorts by the last key first
+        for n in np.lexsort((constants, m_keys)):
+            pivot_col_var = int(n) + 1
+            if pivot_col_var not in blocked_cols:
+                return pivot_col_var
+        return -1
+
+
+class DenseTableau(Tableau):
+    """
+    Class to represent the simplex matrix of a `elpee.StandardProblem` as a
+    single contiguous float64 array holding the objective row, the constraint
+    rows and the solution column
+
+    Attributes
+    ----------
+    array : `numpy.ndarray`
+        (n_constraints + 1) x (n_cols + 1) array of the simplex matrix
+    m_row : `numpy.ndarray` | `None`
+        coefficients of M in the objective row. `None` if no big M values are used
+
+    Methods
+    -------
+    to_list() -> `List[List[float]]`
+        Converts the tableau into the list of lists simplex matrix
+    iter_rows() -> `Iterator[List]`
+        Iterates over the rows of the list of lists simplex matrix
+    copy() -> `DenseTableau`
+        Creates a copy of the tableau
+    pivot(pivot_row, pivot_col_var)
+        Applies a Gauss-Jordan pivot on the given cell
+    canonicalize(basic_vars)
+        Fixes the 0-1 pattern for the columns of all basic variables
+    """
+
+    def __init__(self, matrix, m_row = None):
+        if isinstance(matrix, np.ndarray):
+            self.array = np.array(matrix, dtype=np.float64, order='C')
+        else:
+            obj_row, m_coeffs = split_big_m_row(matrix[0])
+            if any(m_coeffs):
+                m_row = m_coeffs
+            try:
+                self.array = np.array([obj_row] + list(matrix[1:]), dtype=np.float64, order='C')
+            except TypeError:
+                raise ValueError("Dense tableau can only hold big M values in the objective row.")
+        if self.array.ndim != 2:
+            raise ValueError(f"Simplex matrix must be 2 dimensional. Received {self.array.ndim} dimensions.")
+
+        self.m_row = None
+        if m_row is not None:
+            self.m_row = np.array(m_row, dtype=np.float64)
+            self._clean_m_row()
+
+    @classmethod
+    def from_arrays(cls, array: np.ndarray, m_row: np.ndarray = None):
+        """
+        Creates the tableau on the given float64 arrays without copying them
+        (such as arrays memory-mapped from a snapshot file)
+        """
+        tableau = cls.__new__(cls)
+        tableau.array = array
+        tableau.m_row = m_row
+        return tableau
+
+    @property
+    def n_rows(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def n_cols(self) -> int:
+        return self.array.shape[1] - 1
+
+    @property
+    def objective(self) -> np.ndarray:
+        return self.array[0]
+
+    @property
+    def rhs(self) -> np.ndarray:
+        """
+        View of the solution column of the constraint rows
+        """
+        return self.array[1:, -1]
+
+    def column(self, col_var: int) -> np.ndarray:
+        return self.array[1:, col_var-1]
+
+    def row(self, row_i: int) -> np.ndarray:
+        return self.array[row_i, :-1]
+
+    def col_norms(self, cols: np.ndarray = None) -> np.ndarray:
+        # gathering most of the columns copies more than the norms of the view cost
+        if (cols is not None) and (4 * len(cols) < self.n_cols):
+            constraints = self.array[1:, cols]
+            return np.einsum('ij,ij->j', constraints, constraints)
+        constraints = self.array[1:, :-1]
+        norms = np.einsum('ij,ij->j', constraints, constraints)
+        return norms if cols is None else norms[cols]
+
+    def to_list(self) -> List[List[float]]:
+        """
+        Converts the tableau into the list of lists simplex matrix
+        """
+        matrix = self.array.tolist()
+        if self.m_row is not None:
+            matrix[0] = self._obj_row_with_big_m()
+        return matrix
+
+    def iter_rows(self) -> Iterator[List]:
+        if self.m_row is not None:
+            yield self._obj_row_with_big_m()
+        else:
+            yield self.array[0].tolist()
+        for row_i in range(1, self.n_rows):
+            yield self.array[row_i].tolist()
+
+    def copy(self):
+        """
+        Create a copy of the tableau
+        """
+        return DenseTableau(self.array, self.m_row)
+
+    def round(self, decimals: int) -> None:
+        np.round(self.array, decimals, out=self.array)
+        if self.m_row is not None:
+            np.round(self.m_row, decimals, out=self.m_row)
+
+    def pivot(self, pivot_row: int, pivot_col_var: int) -> None:
+        """
+        Scales the pivot row to have 1 at the pivot column and eliminates the
+        pivot column from all other rows with a single outer product update
+        """
+        arr = self.array
+        col = pivot_col_var - 1
+
+        pivot_cell = arr[pivot_row, col]
+        if pivot_cell == 0:
+            raise ZeroDivisionError(f"Pivot element at row {pivot_row} column {pivot_col_var} is zero")
+        if pivot_cell != 1:
+            arr[pivot_row] /= pivot_cell
+
+        factors = arr[:, col].copy()
+        factors[pivot_row] = 0
+        rows = np.flatnonzero(factors)
+        if rows.size:
+            arr[rows] -= np.outer(factors[rows], arr[pivot_row])
+
+        if (self.m_row is not None) and (self.m_row[col] != 0):
+            self.m_row -= self.m_row[col] * arr[pivot_row]
+            self._clean_m_row()
+
+    def is_canonical(self, basic_vars: List[int]) -> bool:
+        cols = [var-1 for var in basic_vars[1:]]
+        expected = np.zeros((self.n_rows, len(cols)))
+        expected[np.arange(1, len(cols)+1), np.arange(len(cols))] = 1
+        if (self.m_row is not None) and self.m_row[cols].any():
+            return False
+        return bool(np.array_equal(self.array[:, cols], expected))
@@ -0,0 +1,169 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Literal, Tuple
+
+import numpy as np
+
+from elpee.utils.bigm import M_COEFF_TOLERANCE
+from elpee.utils.protocols.tableau import split_big_m_row
+
+# values within the tolerance of the bound are treated as satisfying the bound
+PRIMAL_TOLERANCE = 1e-9
+DUAL_TOLERANCE = 1e-9
+# divisors with an absolute value not larger than the tolerance are not used as pivots
+PIVOT_TOLERANCE = 1e-9
+
+def harris_candidates(divisors: np.ndarray, values: np.ndarray, tolerance: float = PRIMAL_TOLERANCE,
+                      pivot_tolerance: float = PIVOT_TOLERANCE) -> np.ndarray:
+    """
+    First pass of the Harris ratio test. Finds the bound of the step by
+    relaxing each value by the tolerance and returns the 0-based indexes whose
+    ratios are within the bound. Returns an empty array if no index qualifies
+    """
+    divisors = np.asarray(divisors, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+
+    eligible = np.flatnonzero((divisors > pivot_tolerance) & np.isfinite(values))
+    if eligible.size == 0:
+        return eligible
+
+    eligible_divisors = divisors[eligible]
+    eligible_values = values[eligible]
+
+    step_bound = np.min((eligible_values + tolerance) / eligible_divisors)
+    return eligible[(eligible_values / eligible_divisors) <= step_bound]
+
+def harris_ratio_test(divisors: np.ndarray, values: np.ndarray, tolerance: float = PRIMAL_TOLERANCE,
+                      pivot_tolerance: float = PIVOT_TOLERANCE) -> Tuple[int, bool]:
+    """
+    Two pass Harris ratio test for the minimum of `values / divisors` over the
+    positive divisors
+
+    The first pass finds the bound of the step by relaxing each value by the
+    tolerance. The second pass selects the largest divisor among the ratios
+    within the bound, giving a numerically stable pivot. Ties are broken by the
+    lowest index.
+
+    Parameters
+    ----------
+    divisors : `numpy.ndarray`
+        pivot column (or negated pivot row for the dual ratio test)
+    values : `numpy.ndarray`
+        solution column (or absolute reduced costs for the dual ratio test)
+    tolerance : `float`
+        tolerance allowed on the values
+    pivot_tolerance : `float`
+        smallest divisor to be accepted as a pivot
+
+    Return
+    ------
+    Tuple of the selected 0-based index (-1 if no index qualifies) and a flag
+    marking that no index qualifies (the step is unbounded)
+    """
+    candidates = harris_candidates(divisors, values, tolerance, pivot_tolerance)
+    if candidates.size == 0:
+        return -1, True
+    divisors = np.asarray(divisors, dtype=np.float64)
+    return int(candidates[np.argmax(divisors[candidates])]), False
+
+def lexicographic_tie_break(candidates: np.ndarray, divisors: np.ndarray, keys: np.ndarray) -> int:
+    """
+    Selects the candidate with the lexicographically smallest row of
+    `keys / divisors`. The columns of `keys` are compared from the first column
+
+    Parameters
+    ----------
+    candidates : `numpy.ndarray`
+        0-based indexes tied in the ratio test
+    divisors : `numpy.ndarray`
+        pivot column
+    keys : `numpy.ndarray`
+        rows of the reference columns for the candidates (one row per candidate)
+    """
+    divisors = np.asarray(divisors, dtype=np.float64)
+    scaled = np.asarray(keys, dtype=np.float64) / divisors[candidates, None]
+    # lexsort sorts by the last key first
+    return int(candidates[np.lexsort(scaled.T[::-1])[0]])
+
+def select_leaving_row(problem, pivot_col_var: int, primal_tolerance: float = PRIMAL_TOLERANCE,
+                       pivot_tolerance: float = PIVOT_TOLERANCE,
+                       tie_break: Literal['largest-pivot', 'lexicographic', 'bland'] = 'largest-pivot',
+                       reference_vars: List[int] = None) -> Tuple[int, bool]:
+    """
+    Selects the row of the leaving variable for the entering variable `pivot_col_var`
+    of the `elpee.StandardProblem` using the Harris ratio test
+
+    Parameters
+    ----------
+    tie_break : `str` (default : "largest-pivot") (Options : ["largest-pivot","lexicographic","bland"])
+        Rule to select among the rows tied in the ratio test. Expected options are
+        "largest-pivot" : Row with the largest pivot element
+        "lexicographic" : Row with the lexicographically smallest row of the
+                          `reference_vars` columns divided by the pivot element
+        "bland"         : Row of the basic variable with the smallest index
+    reference_vars : `List[int]` (default : `None`)
+        Variables forming the identity columns when the lexicographic rule was
+        started (usually the basic variables at that point)
+
+    Return
+    ------
+    Tuple of the 1-based pivot row (-1 if no row qualifies) and a flag marking
+    that the entering variable is unbounded
+    """
+    if problem.tableau is not None:
+        col = problem.tableau.column(pivot_col_var)
+        rhs = problem.tableau.rhs
+    else:
+        matrix = problem.matrix
+        col = np.array([row[pivot_col_var-1] for row in matrix[1:]], dtype=np.float64)
+        rhs = np.array([row[-1] for row in matrix[1:]], dtype=np.float64)
+
+    candidates = harris_candidates(col, rhs, primal_tolerance, pivot_tolerance)
+    if candidates.size == 0:
+        return -1, True
+
+    if (candidates.size == 1) or (tie_break == 'largest-pivot'):
+        pivot_row_idx = int(candidates[np.argmax(col[candidates])])
+    elif tie_break == 'bland':
+        basic_vars = np.array(problem.basic_vars[1:])
+        pivot_row_idx = int(candidates[np.argmin(basic_vars[candidates])])
+    elif tie_break == 'lexicographic':
+        if problem.tableau is not None:
+            keys = np.column_stack([problem.tableau.column(var)[candidates] for var in reference_vars])
+        else:
+            keys = np.array([[matrix[i+1][var-1] for var in reference_vars] for i in candidates])
+        pivot_row_idx = lexicographic_tie_break(candidates, col, keys)
+    else:
+        raise ValueError(f"{tie_break} is an invalid argument for tie_break parameter.")
+    return pivot_row_idx + 1, False
+
+def select_entering_col_dual(problem, pivot_row: int, dual_tolerance: float = DUAL_TOLERANCE,
+                             pivot_tolerance: float = PIVOT_TOLERANCE) -> Tuple[int, bool]:
+    """
+    Selects the entering variable for the leaving row `pivot_row` of the
+    `elpee.StandardProblem` using the dual Harris ratio test over the negative
+    entries of the row. Columns with big M reduced costs (beyond the round off
+    residues of the coefficients of M) are not selected
+
+    Return
+    ------
+    Tuple of the 1-based pivot column (-1 if no column qualifies) and a flag
+    marking that the row has no negative entries (the problem is infeasible)
+    """
+    if problem.tableau is not None:
+        row = problem.tableau.row(pivot_row)
+        constants = problem.tableau.objective[:-1]
+        m_coeffs = problem.tableau.m_row[:-1] if problem.tableau.m_row is not None else 0
+    else:
+        row = problem.matrix[pivot_row][:-1]
+        constants, m_coeffs = split_big_m_row(problem.obj_row)
+
+    costs = np.abs(np.asarray(constants, dtype=np.float64))
+    costs[np.abs(np.asarray(m_coeffs, dtype=np.float64)) > M_COEFF_TOLERANCE] = np.inf
+
+    pivot_col_idx, unbounded = harris_ratio_test(-np.asarray(row, dtype=np.float64), costs,
+                                                 dual_tolerance, pivot_tolerance)
+    if unbounded:
+        return -1, True
+    return pivot_col_idx + 1, False
@@ -0,0 +1,93 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, NamedTuple, Optional
+
+from elpee.utils.configs import get_config_value
+from elpee.utils.events import EventsOption
+from elpee.utils.ratio_test import DUAL_TOLERANCE, PIVOT_TOLERANCE, PRIMAL_TOLERANCE
+
+class Settings(NamedTuple):
+    """
+    Immutable settings of a solve. Settings are given to a solve directly or
+    set for the current thread or task with `use_settings`, so concurrent solves
+    can use different settings without changing the configuration file
+
+    Attributes
+    ----------
+    decimals : int | None
+        Number of decimal places of the displayed and saved values. Uses the
+        configured number of decimals (`configs.set_decimal_size`) if None
+    width : int | None
+        Width of a cell in the displayed simplex tables. Uses the configured
+        width (`configs.set_cell_width`) if None
+    primal_tolerance : float
+        Tolerance allowed on the solution values in the ratio test
+    dual_tolerance : float
+        Tolerance allowed on the objective row in the dual ratio test
+    pivot_tolerance : float
+        Smallest absolute value of the pivot column accepted as a pivot element
+    silent : bool
+        Solve without displaying the steps or the interpretation, ignoring the
+        show_steps and show_interpret options
+    events : elpee.utils.events.EventSink | logging.Logger | Callable | None
+        Sink receiving the messages of the solves not given an `events` sink
+    """
+    decimals: Optional[int] = None
+    width: Optional[int] = None
+    primal_tolerance: float = PRIMAL_TOLERANCE
+    dual_tolerance: float = DUAL_TOLERANCE
+    pivot_tolerance: float = PIVOT_TOLERANCE
+    silent: bool = False
+    events: EventsOption = None
+
+    def get_decimals(self) -> int:
+        """
+        Number of decimal places used, falling back to the configured number of decimals
+        """
+        return self.decimals if self.decimals is not None else get_config_value('DECIMALS')
+
+    def get_width(self) -> int:
+        """
+        Width of a cell used, falling back to the configured width
+        """
+        return self.width if self.width is not None else get_config_value('WIDTH')
+
+DEFAULT_SETTINGS = Settings()
+
+__current_settings = ContextVar('elpee_settings', default=DEFAULT_SETTINGS)
+
+def get_settings() -> Settings:
+    """
+    Obtain the settings of the current context. Returns `DEFAULT_SETTINGS`
+    outside of `use_settings`
+    """
+    return __current_settings.get()
+
+@contextmanager
+def use_settings(settings: Settings = None, **changes) -> Iterator[Settings]:
+    """
+    Context manager setting the settings used by the solves of the current thread
+    or asyncio task within the context. Settings of other threads and tasks are
+    not changed
+
+    Parameters
+    ----------
+    settings : `Settings` (default : None)
+        Settings to be used. Uses the settings of the current context if None
+    **changes
+        Fields of the settings to be replaced (such as decimals=4)
+
+    Return
+    ------
+    The `Settings` used within the context
+    """
+    settings = settings if settings is not None else get_settings()
+    settings = settings._replace(**changes)
+    token = __current_settings.set(settings)
+    try:
+        yield settings
+    finally:
+        __current_settings.reset(token)
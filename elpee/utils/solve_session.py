@@ -0,0 +1,91 @@
+# Copyright 2024-2025 Navindu De Silva
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Generator, Iterator, Optional
+
+from elpee.utils.protocols.solve_step import SolveStep, run_steps
+from elpee.utils.protocols.st_problem import StandardProblem
+
+class SolveSession():
+    """
+    A session solving a LP problem one step at a time. The state of the solver
+    is kept alive between the steps, so resuming does not set up the solve again
+
+    Attributes
+    ----------
+    solution : elpee.StandardProblem | None
+        Solved problem once all steps are applied
+    done : bool
+        Whether all steps of the solve are applied
+    n_steps : int
+        Number of steps applied in the session
+
+    Methods
+    -------
+    step() -> SolveStep | None
+        Applies the next step of the solve
+    run() -> elpee.StandardProblem
+        Applies all remaining steps and returns the solved problem
+    close()
+        Stops the solve
+    """
+
+    def __init__(self, steps: Generator[SolveStep, None, StandardProblem]):
+        """
+        Parameters
+        ----------
+        steps : Generator[SolveStep, None, elpee.StandardProblem]
+            Steps of the solve returning the solved problem
+        """
+
+        self.solution = None
+        self.done = False
+        self.n_steps = 0
+        self.__steps = steps
+
+    def step(self) -> Optional[SolveStep]:
+        """
+        Applies the next step of the solve
+
+        Return
+        ------
+        `SolveStep` record of the step. None once all steps are applied
+        """
+
+        if self.done:
+            return None
+        try:
+            step = next(self.__steps)
+        except StopIteration as stop:
+            self.solution = stop.value
+            self.done = True
+            return None
+        self.n_steps += 1
+        return step
+
+    def __iter__(self) -> Iterator[SolveStep]:
+        return self
+
+    def __next__(self) -> SolveStep:
+        step = self.step()
+        if step is None:
+            raise StopIteration
+        return step
+
+    def run(self) -> StandardProblem:
+        """
+        Applies all remaining steps and returns the solved problem
+        """
+
+        if not self.done:
+            self.solution = run_steps(self.__steps)
+            self.done = True
+        return self.solution
+
+    def close(self) -> None:
+        """
+        Stops the solve. No further steps are applied
+        """
+
+        self.__steps.close()
+        self.done = True
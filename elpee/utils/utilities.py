@@ -1,10 +1,14 @@
 # Copyright 2024-2025 Navindu De Silva
 # SPDX-License-Identifier: Apache-2.0
 
-import copy, yaml
+import yaml
+from decimal import ROUND_HALF_EVEN, Decimal
 from typing import Dict, List
 from sympy import Symbol, preorder_traversal, Float, sympify, Basic
-from elpee.utils.configs import load_config
+from elpee.utils.bigm import BigMValue, make_big_m
+from elpee.utils.settings import get_settings
+
+M = Symbol('M')
 
 def create_ratio_col(matrix, pivot_col_var):
     """
@@ -59,24 +63,32 @@ def fix_feasible_0_1_pattern(basic_vars, matrix):
     Does scaled multiplication to the row of the basic variable if matrix[basic_var][basic_var] != 1
     Does scaled addition of the basic variable row onto rows where matrix[row][basic_var] != 0
     """
-    n_rows = len(matrix)
     for row_i ,basic_var in enumerate(basic_vars):
         # no need to check 0-1 pattern for objective variable
         if basic_var == 0:
             continue
+        pivot_simplex_matrix(matrix, row_i, basic_var)
 
-        # checking and fixing basic variables coefficient into 1
-        if matrix[row_i][basic_var-1] != 1:
-            matrix[row_i] = [element / matrix[row_i][basic_var-1] for element in matrix[row_i]]
-
-        # checking if zeros are maintained for 0-1 pattern
-        for i in range(n_rows):
-            # except for row with the basic variable
-            if i != row_i:  
-                if matrix[i][basic_var-1] != 0:
-                    scaled_piv_row = [element * matrix[i][basic_var-1] for element in matrix[row_i]]
-                    matrix[i] = [a-b for a,b in zip(matrix[i], scaled_piv_row)]
-        
+    return matrix
+
+def pivot_simplex_matrix(matrix, pivot_row, pivot_col_var):
+    """
+    Applies a single Gauss-Jordan pivot on the simplex matrix
+    Does scaled multiplication to the pivot row if matrix[pivot_row][pivot_col_var] != 1
+    Does scaled addition of the pivot row onto rows where matrix[row][pivot_col_var] != 0
+    """
+    col = pivot_col_var - 1
+
+    # checking and fixing pivot element into 1
+    if matrix[pivot_row][col] != 1:
+        matrix[pivot_row] = [element / matrix[pivot_row][col] for element in matrix[pivot_row]]
+
+    # eliminating the pivot column from all other rows
+    for i in range(len(matrix)):
+        if i != pivot_row:  
+            if matrix[i][col] != 0:
+                scaled_piv_row = [element * matrix[i][col] for element in matrix[pivot_row]]
+                matrix[i] = [a-b for a,b in zip(matrix[i], scaled_piv_row)]
     return matrix
 
 def get_subsets(main_list):
@@ -103,12 +115,16 @@ def convert_num_to_padded_text(row, width, decimals):
     """
     padded_row = []
     for num in row:
+        # numeric big M values are rounded as (constant, M coefficient) pairs
+        if isinstance(num, BigMValue):
+            padded_row.append(str(round(num, decimals)).center(width))
+            continue
         # check if number is from sympy class
         if not (isinstance(num, int)) | (isinstance(num, float)):
             # if from sympy class, identify if have algebraic terms
             if num.free_symbols:
                 # round of the algebraic expression and add padded text to expression
-                rounded_expr = str(round_off_expr_coefficients(num)).center(width)
+                rounded_expr = str(round_off_expr_coefficients(num, decimals)).center(width)
                 padded_row.append(rounded_expr)
                 continue
             else:
@@ -123,34 +139,47 @@ def subsitute_big_M_for_row(row):
     """
     Apply substitution to big M as 1,000,000 for given row
     Returns the row with substituted values
+    Numeric big M values are kept as they are comparable without substitution
     """
     M = Symbol('M')
-    row_copy = row.copy()
+    row_copy = list(row)
     for i in range(len(row_copy)):
         num = row_copy[i]
-        # apply substitution only if number is not an integer or float
-        if not (isinstance(num, int)) | (isinstance(num, float)):
+        # apply substitution only if number is not an integer, float or numeric big M
+        if not (isinstance(num, int)) | (isinstance(num, float)) | (isinstance(num, BigMValue)):
             row_copy[i] = num.subs({M:1000000})
     return row_copy
 
-def round_off_expr_coefficients(expression):
+def __get_decimals(decimals: int = None) -> int:
+    """
+    Obtains the number of decimals of the current settings if `decimals` is None
+    """
+    return decimals if decimals is not None else get_settings().get_decimals()
+
+def round_off_expr_coefficients(expression, decimals: int = None):
     """
     Rounding off the coefficients and numeric numbers in the algebraic expression
+    to `decimals` decimal places (the decimals of the current settings if None)
     Returns the rounded off expression
     """
+    decimals = __get_decimals(decimals)
     rounded_expression = expression
     for a in preorder_traversal(expression):
         if isinstance(a, Float):
-            rounded_expression = rounded_expression.subs(a, round(a, 2))
+            rounded_expression = rounded_expression.subs(a, round(a, decimals))
     return rounded_expression
 
-def round_off_simplex_matrix(matrix):
-    DECIMALS = load_config().get('DECIMALS')
+def round_off_simplex_matrix(matrix, decimals: int = None):
+    """
+    Rounds off the numeric elements of the simplex matrix in place to `decimals`
+    decimal places (the decimals of the current settings if None)
+    """
+    DECIMALS = __get_decimals(decimals)
 
     for i in range(len(matrix)):
         for j in range(len(matrix[i])):
             elem = matrix[i][j]
-            if (isinstance(elem, int)) | (isinstance(elem, float)):
+            if (isinstance(elem, int)) | (isinstance(elem, float)) | (isinstance(elem, BigMValue)):
                 matrix[i][j] = round(elem, DECIMALS)
     return matrix
 
@@ -166,24 +195,75 @@ def convert_M_to_sympy(matrix):
                 matrix[i][j] = sympify(elem)
     return matrix
 
-def convert_sympy_to_text(matrix):
+def __round_half_even(number, decimals: int) -> float:
     """
-    Function to convert the big M expressions in Sympy to text
+    Rounds off the number as the sympy Float it is converted from, rounding the 15
+    significant digits half to even
     """
-    
-    matrix_copy = copy.deepcopy(matrix)
-
-    for i in range(len(matrix_copy)):
-        for j in range(len(matrix_copy[i])):
-            elem = matrix_copy[i][j]
-            # check if number is from sympy class
-            if not (isinstance(elem, int)) | (isinstance(elem, float)):
-                if elem.free_symbols:
-                    # round of the algebraic expression and add padded text to expression
-                    matrix_copy[i][j] = str(round_off_expr_coefficients(elem))
-                else:
-                    matrix_copy[i][j] = float(elem)
-    return matrix_copy
+    digits = Decimal(format(float(number), '.15g'))
+    return float(digits.quantize(Decimal(1).scaleb(-decimals), rounding=ROUND_HALF_EVEN))
+
+def __round_off_expr_to_text(expression, decimals: int):
+    """
+    Rounds off the coefficients of the algebraic expression and converts it to text.
+    Expressions linear in M with float coefficients are rounded off numerically instead
+    of substituting each rounded coefficient into the expression. Expressions with exact
+    (integer or rational) coefficients, coefficients too small or too large to keep all their
+    digits in the float text, or without M once rounded off are converted with
+    `round_off_expr_coefficients`
+    """
+    coefficients = expression.as_coefficients_dict()
+    if (set(coefficients) <= {1, M}) and all(isinstance(coeff, Float) and
+                                              10 ** max(1 - decimals, -4) <= abs(coeff) < 10 ** (13 - decimals)
+                                              for coeff in coefficients.values()):
+        value = make_big_m(__round_half_even(coefficients.get(1, 0), decimals),
+                           __round_half_even(coefficients.get(M, 0), decimals))
+        if isinstance(value, BigMValue):
+            return str(value)
+    return str(round_off_expr_coefficients(expression, decimals))
+
+def convert_row_to_text(row, decimals: int = None) -> List:
+    """
+    Function to convert the big M values and expressions in a row of the simplex matrix
+    to text, rounding off the coefficients of the sympy expressions to `decimals` decimal
+    places (the decimals of the current settings if None). Returns a new row
+    """
+    decimals = __get_decimals(decimals)
+    text_row = []
+    for elem in row:
+        if isinstance(elem, (int, float)):
+            text_row.append(elem)
+        elif isinstance(elem, BigMValue):
+            text_row.append(str(elem))
+        # elements belonging to sympy
+        elif elem.free_symbols:
+            # round of the algebraic expression and add padded text to expression
+            text_row.append(__round_off_expr_to_text(elem, decimals))
+        else:
+            text_row.append(float(elem))
+    return text_row
+
+def iter_text_rows(problem, decimals: int = None):
+    """
+    Iterates over the rows of the simplex matrix of the `elpee.StandardProblem` converted
+    to text as `convert_row_to_text`. Rows of a dense or sparse tableau only hold floats
+    (apart from the big M values of the objective row) and are given without converting
+    """
+    decimals = __get_decimals(decimals)
+    tableau = problem.tableau
+    for row_i, row in enumerate(problem.iter_rows()):
+        if (tableau is None) or ((row_i == 0) and (tableau.m_row is not None)):
+            row = convert_row_to_text(row, decimals)
+        yield row
+
+def convert_sympy_to_text(matrix, decimals: int = None):
+    """
+    Function to convert the big M expressions in Sympy to text, rounding off the
+    coefficients to `decimals` decimal places (the decimals of the current settings if None).
+    The rows are converted into a new matrix without copying the given matrix
+    """
+    decimals = __get_decimals(decimals)
+    return [convert_row_to_text(row, decimals) for row in matrix]
 
 def convert_gte_to_lte(expressions_dict: Dict) -> Dict:
     """
@@ -235,23 +315,30 @@ def obtain_coefficient_from_dict(var_dict : Dict, var_name: str):
     
     return obj_coefficient
 
-def extract_elem_from_simplex_matrix(matrix : List[List], row:int, col:int):
+def extract_elem_from_simplex_matrix(matrix : List[List], row:int, col:int, decimals: int = None):
     """
     Extract and round off elements in the simplex matrix according to data type
     """
-    DECIMALS = load_config().get('DECIMALS')
+    return round_off_elem(matrix[row][col], decimals)
 
-    elem = matrix[row][col]
+def round_off_elem(elem, decimals: int = None):
+    """
+    Round off an element of the simplex matrix according to data type to `decimals`
+    decimal places (the decimals of the current settings if None)
+    """
+    DECIMALS = __get_decimals(decimals)
 
     if (isinstance(elem, int)):
         return elem
     elif (isinstance(elem, float)):
         return round(elem, DECIMALS)
+    elif (isinstance(elem, BigMValue)):
+        return str(round(elem, DECIMALS))
     else:
         # elements belonging to sympy
         if elem.free_symbols:
             # round of the algebraic expression and add padded text to expression
-            return str(round_off_expr_coefficients(elem))
+            return str(round_off_expr_coefficients(elem, DECIMALS))
         else:
             return round(float(elem), DECIMALS)
         
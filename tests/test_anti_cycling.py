@@ -0,0 +1,52 @@
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+
+def create_beale_problem():
+    # Beale's example cycles with the largest coefficient rule
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('10*x - 57*y - 9*z - 24*w')
+    problem.add_constraint('0.5*x - 5.5*y - 2.5*z + 9*w <= 0')
+    problem.add_constraint('0.5*x - 1.5*y - 0.5*z + w <= 0')
+    problem.add_constraint('x <= 1')
+    return problem
+
+@pytest.mark.parametrize("backend", ["list", "dense", "sparse"])
+@pytest.mark.parametrize("anti_cycling", ["bland", "lexicographic"])
+def test_anti_cycling(backend, anti_cycling):
+
+    solution = elpee_solver.solve(create_beale_problem(), show_steps=False, show_interpret=False,
+                                  backend=backend, anti_cycling=anti_cycling)
+
+    assert solution.is_optimal
+    assert solution.interpret() == {'Sol': 1.0, 'w': 0, 'x': 1.0, 'y': 0, 'z': 1.0, 'Slack_1': 2.0}
+    assert solution.n_degenerate_pivots > 0
+    assert solution.n_iterations > solution.n_degenerate_pivots
+
+def test_cycling_detected():
+
+    solution = elpee_solver.solve(create_beale_problem(), show_steps=False, show_interpret=False,
+                                  anti_cycling=None)
+
+    assert not solution.is_optimal
+    assert not solution.is_optimal_reachable
+    assert solution.n_iterations == solution.n_degenerate_pivots == 6
+
+@pytest.mark.parametrize("backend", ["list", "dense"])
+def test_perturbation(backend):
+
+    solution = elpee_solver.solve(create_beale_problem(), show_steps=False, show_interpret=False,
+                                  backend=backend, perturbation=1e-6, seed=0)
+
+    assert solution.is_optimal
+    assert solution.interpret() == {'Sol': 1.0, 'w': 0, 'x': 1.0, 'y': 0, 'z': 1.0, 'Slack_1': 2.0}
+    assert solution.n_degenerate_pivots == 0
+
+def test_max_iterations():
+
+    solution = elpee_solver.solve(create_beale_problem(), show_steps=False, show_interpret=False,
+                                  max_iterations=3)
+
+    assert not solution.is_optimal
+    assert not solution.is_optimal_reachable
+    assert solution.n_iterations == 3
@@ -0,0 +1,102 @@
+import os
+import threading
+
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+from elpee.datahandler.background_writer import BackgroundWriter
+from elpee.datahandler.history_handler import read_history
+from elpee.datahandler.trajectory_handler import read_trajectory
+
+def create_problem():
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('2*a + 3*b')
+    problem.add_constraints(['a + b >= 4', 'a + 3*b >= 6'])
+    return problem
+
+def read_solution_folder():
+    files = {}
+    for file_name in sorted(os.listdir('solution')):
+        with open(os.path.join('solution', file_name)) as file:
+            files[file_name] = file.read()
+    return files
+
+@pytest.mark.parametrize("backend", ['list', 'dense'])
+def test_background_save(tmp_path, monkeypatch, backend):
+
+    monkeypatch.chdir(tmp_path)
+    for file_format in ['json', 'yaml']:
+        elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend=backend,
+                           file_format=file_format)
+        saved_files = read_solution_folder()
+        elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend=backend,
+                           file_format=file_format, background_save=True)
+        assert read_solution_folder() == saved_files
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend=backend,
+                                  file_format='trajectory', background_save=True)
+    trajectory = read_trajectory('solution.elpt')
+    assert trajectory.step_names == ['infeasible_sol_1', 'sol_step_1', 'sol_step_2', 'sol_step_3']
+    assert trajectory[-1].basic_vars == solution.basic_vars
+
+    elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend=backend,
+                       file_format='history', background_save=True)
+    history = read_history('solution.elph')
+    assert [step.basic_vars for step in history] == [step.basic_vars for step in trajectory]
+
+def test_background_snapshot_and_backpressure():
+
+    problem = create_problem().standardize_problem()
+    release = threading.Event()
+    saved = []
+
+    def save(step_problem, step_name):
+        release.wait()
+        saved.append((step_name, step_problem.basic_vars, step_problem.matrix))
+
+    writer = BackgroundWriter(save, max_pending=1)
+    expected = []
+    for i in range(2):
+        expected.append((f'sol_step_{i+1}', problem.basic_vars.copy(), [row.copy() for row in problem.matrix]))
+        writer.submit(problem, f'sol_step_{i+1}')
+        # the queued steps are not changed by the solve
+        problem.pivot(i + 1, i + 1)
+
+    # the queue is full, so saving another step waits for the thread
+    submitter = threading.Thread(target=writer.submit, args=(problem, 'sol_step_3'))
+    submitter.start()
+    submitter.join(0.1)
+    assert submitter.is_alive()
+
+    release.set()
+    submitter.join()
+    writer.close()
+    assert writer.n_saved == 3
+    assert saved[:2] == expected
+    with pytest.raises(ValueError):
+        writer.submit(problem, 'sol_step_4')
+
+def test_background_error(tmp_path, monkeypatch):
+
+    saved = []
+
+    def save(step_problem, step_name):
+        if step_name == 'sol_step_2':
+            raise OSError("disk full")
+        saved.append(step_name)
+
+    problem = create_problem().standardize_problem()
+    writer = BackgroundWriter(save)
+    for i in range(4):
+        writer.submit(problem, f'sol_step_{i+1}')
+    with pytest.raises(OSError):
+        writer.close()
+    # steps queued after the error are not saved
+    assert saved == ['sol_step_1']
+
+    # the error is raised once the solve ends
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr('elpee.utils.protocols.handler.save_file', lambda *args, **kwargs: save(None, 'sol_step_2'))
+    with pytest.raises(OSError):
+        elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, file_format='json',
+                           background_save=True)
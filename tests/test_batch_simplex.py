@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+
+def create_problems(n_problems, is_max=True, use_dual_simplex=False):
+    rng = np.random.default_rng(0)
+    problems = []
+    for _ in range(n_problems):
+        problem = LinearProblem.from_arrays(rng.integers(-3, 6, 4), rng.integers(-2, 6, (6, 4)), rng.integers(1, 20, 6),
+                                            rng.integers(0, 4, (1, 4)), rng.integers(1, 10, 1), is_maximization=is_max)
+        problem.use_dual_simplex() if use_dual_simplex else problem.use_bigM(numeric=True)
+        problems.append(problem)
+    return problems
+
+@pytest.mark.parametrize('is_max, use_dual_simplex', [(True, False), (False, False), (False, True)])
+def test_solve_batch(is_max, use_dual_simplex):
+
+    problems = create_problems(50, is_max, use_dual_simplex)
+    standard_problems = [problem.standardize_problem() for problem in problems]
+    solutions = elpee_solver.solve_batch(standard_problems)
+
+    # same solutions as solving each problem
+    for problem, standard_problem, solution in zip(problems, standard_problems, solutions):
+        assert standard_problem == problem.standardize_problem()
+        expected = elpee_solver.solve(problem, show_steps=False, show_interpret=False, backend='dense')
+        assert solution == expected
+        assert (solution.n_iterations, solution.n_degenerate_pivots) == (expected.n_iterations, expected.n_degenerate_pivots)
+    assert any(solution.is_optimal for solution in solutions)
+    assert not all(solution.is_optimal for solution in solutions)
+
+def test_solve_batch_cycling():
+
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('10*x - 57*y - 9*z - 24*w')
+    problem.add_constraints(['0.5*x - 5.5*y - 2.5*z + 9*w <= 0', '0.5*x - 1.5*y - 0.5*z + w <= 0', 'x <= 1'])
+
+    solution, = elpee_solver.solve_batch([problem])
+    assert solution.is_optimal and (solution.matrix[0][-1] == 1)
+
+    solution, = elpee_solver.solve_batch([problem], anti_cycling=None)
+    assert not solution.is_optimal_reachable
+
+def test_solve_batch_shapes():
+
+    problem = LinearProblem()
+    problem.add_objective('x + y')
+    problem.add_constraint('x + y <= 2')
+    other_problem = LinearProblem()
+    other_problem.add_objective('x + y')
+    other_problem.add_constraints(['x <= 1', 'y <= 1'])
+    with pytest.raises(ValueError):
+        elpee_solver.solve_batch([problem, other_problem])
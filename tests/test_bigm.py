@@ -0,0 +1,73 @@
+import pytest
+
+from elpee import LinearProblem, StandardProblem
+from elpee.algorithms import AllStackStarter
+from elpee.utils.bigm import BigMValue
+
+def test_bigm_value_ordering():
+
+    big_m = BigMValue(0, 1)
+
+    assert big_m > 1e12
+    assert -big_m < -1e12
+    assert BigMValue(5, -1) < BigMValue(-5, 0.5)
+    assert BigMValue(2, 1) > BigMValue(1, 1)
+    assert (big_m - big_m) == 0
+    assert isinstance(big_m - big_m, int)
+    assert abs(BigMValue(3, -2)) == BigMValue(-3, 2)
+    assert str(BigMValue(2.0, -3.0)) == "2.0 - 3.0*M"
+
+def test_bigm_value_solver01():
+
+    matrix = [[-1, -1, 0, 0, 0, BigMValue(0, -1), BigMValue(0, -1),  0],
+              [-1,  1, 1, 0, 0,  0,  0,  2],
+              [ 6,  4, 0,-1, 0,  1,  0, 24],
+              [ 0,  1, 0, 0,-1,  0,  1,  1]]
+    basic_vars = [0, 3, 6, 7]
+
+    list_problem = StandardProblem(
+        matrix=[row.copy() for row in matrix],
+        basic_vars=basic_vars.copy(),
+        n_decision_vars=2,
+        is_max=False,
+        n_artificials=2
+    )
+    dense_problem = StandardProblem(
+        matrix=[row.copy() for row in matrix],
+        basic_vars=basic_vars.copy(),
+        n_decision_vars=2,
+        is_max=False,
+        n_artificials=2,
+        dense=True
+    )
+
+    solution = AllStackStarter(list_problem).solver()
+    dense_solution = AllStackStarter(dense_problem).solver()
+
+    assert solution.is_optimal
+    assert solution.basic_vars == [0, 3, 1, 2]
+    assert solution.interpret() == {'Sol': 4.33, 'X1': 3.33, 'X2': 1, 'Slack_1': 4.33}
+    assert dense_solution.basic_vars == solution.basic_vars
+    assert dense_solution.interpret() == solution.interpret()
+
+def test_bigm_value_linear_problem():
+
+    def create_problem():
+        problem = LinearProblem(is_maximization=True)
+        problem.add_objective('x + y')
+        problem.add_constraint('x + y <= 2')
+        problem.add_constraint('x + y >= 5')
+        return problem
+
+    symbolic_problem = create_problem()
+    numeric_problem = create_problem()
+    numeric_problem.use_bigM(numeric=True)
+
+    numeric_standard_problem = numeric_problem.standardize_problem()
+    assert numeric_standard_problem.obj_row[-1] == BigMValue(0, 1)
+
+    symbolic = AllStackStarter(symbolic_problem.standardize_problem()).solver()
+    numeric = AllStackStarter(numeric_standard_problem).solver()
+
+    assert not numeric.is_feasible
+    assert numeric.interpret() == symbolic.interpret()
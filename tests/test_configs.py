@@ -0,0 +1,58 @@
+import os
+
+import yaml
+
+from elpee import LinearProblem, elpee_solver
+from elpee.utils import configs
+
+def create_config(tmp_path, monkeypatch):
+    config_file = tmp_path / "configs.yaml"
+    config_file.write_text("DECIMALS: 2\nWIDTH: 13\n")
+    monkeypatch.setattr(configs, "CONFIG_FILE", config_file)
+    configs.clear_config_cache()
+    return config_file
+
+def count_parses(monkeypatch):
+    parses = []
+    yaml_safe_load = yaml.safe_load
+    def safe_load(file):
+        parses.append(file)
+        return yaml_safe_load(file)
+    monkeypatch.setattr(configs.yaml, "safe_load", safe_load)
+    return parses
+
+def test_cached_config(tmp_path, monkeypatch):
+
+    create_config(tmp_path, monkeypatch)
+    parses = count_parses(monkeypatch)
+
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('3*a + 2*b + 4*c')
+    problem.add_constraints(['a + b + 2*c <= 4', '2*a + 3*c <= 5', '2*a + b + 3*c <= 7'])
+    solution = elpee_solver.solve(problem, show_steps=True, show_interpret=True)
+    solution.interpret()
+
+    assert len(parses) == 1
+    assert configs.load_config() == {'DECIMALS': 2, 'WIDTH': 13}
+    assert len(parses) == 1
+
+def test_config_reload(tmp_path, monkeypatch):
+
+    config_file = create_config(tmp_path, monkeypatch)
+    assert configs.get_config_value('DECIMALS') == 2
+
+    # the cache is reloaded once the file is modified
+    config_file.write_text("DECIMALS: 4\nWIDTH: 13\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert configs.get_config_value('DECIMALS') == 4
+
+    # the setters update the cache, even without a change in the modification time
+    configs.set_decimal_size(3)
+    assert configs.get_config_value('DECIMALS') == 3
+    configs.set_cell_width(15)
+    assert configs.load_config() == {'DECIMALS': 3, 'WIDTH': 15}
+
+    # changes to the loaded configurations do not change the cache
+    configs.load_config()['WIDTH'] = 20
+    assert configs.get_config_value('WIDTH') == 15
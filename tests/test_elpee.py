@@ -236,11 +236,12 @@ def test_solver16():
     is_max = False
     n_artificials = 0
 
-    output_matrix = [[0, 0, 1, 0, 0, 15],
-                     [0, 1, 1,-2, 0, -5],
-                     [1, 0, 0, 1, 0, 10],
-                     [0, 0,-1, 1, 1,  5]]
-    output_basic_vars = [0, 2, 1, 5]
+    # S2 has a zero reduced cost and is a valid entering variable for the dual simplex
+    output_matrix = [[-2, -1, 0, 0, 0,  0],
+                     [ 1,  0, 0, 1, 0, 10],
+                     [ 2,  1, 1, 0, 0, 15],
+                     [ 1,  1, 0, 0, 1, 10]]
+    output_basic_vars = [0, 4, 3, 5]
 
     problem = StandardProblem(
         matrix=matrix,
@@ -258,8 +259,7 @@ def test_solver16():
         is_max=is_max,
         n_artificials=n_artificials
     )
-    solution.update_optimal_reachability_status(False)
-    solution.update_feasible_status(False)
+    solution.update_optimal_status(True)
 
     assert solution == all_stack_starter.solver()
 
@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+from elpee.utils.events import CallbackSink, ConsoleSink, EventSink, LoggingSink, NullSink, SolverEvent, get_event_sink
+
+def create_problem():
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('2*a + 3*b')
+    problem.add_constraints(['a + b >= 4', 'a + 3*b >= 6'])
+    return problem
+
+def test_silent_solve(capsys):
+
+    for backend in ['list', 'dense', 'sparse', 'revised']:
+        solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False,
+                                      backend=backend, warm_start=['x'])
+        assert solution.is_optimal
+    assert capsys.readouterr().out == ''
+
+def test_callback_events(capsys):
+
+    events = []
+    elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, events=events.append)
+    assert capsys.readouterr().out == ''
+
+    names = [event.name for event in events]
+    assert names[0] == 'initial_feasible'
+    assert names[-1] == 'optimal'
+    assert names.count('pivot') == 2
+    assert events[2].message == 'Taking A2 = 0; Entering b as a new basic variable;'
+
+def test_logging_events(caplog):
+
+    logger = logging.getLogger('elpee.test')
+    with caplog.at_level(logging.INFO, logger='elpee.test'):
+        elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, events=logger)
+    assert caplog.records[-1].getMessage() == 'Optimized Solution Received!'
+    assert caplog.records[-1].event == 'optimal'
+
+def test_lazy_formatting():
+
+    class Unformattable():
+        def __str__(self):
+            raise AssertionError("message formatted")
+
+    NullSink().emit('pivot', 'Taking %s', Unformattable())
+    logger = logging.getLogger('elpee.test.disabled')
+    logger.setLevel(logging.WARNING)
+    sink = LoggingSink(logger)
+    assert not sink.enabled
+    sink.emit('pivot', 'Taking %s', Unformattable())
+
+    events = []
+    CallbackSink(events.append).emit('pivot', 'Taking %s', Unformattable())
+    assert events[0] == SolverEvent('pivot', 'Taking %s', events[0].args)
+
+def test_get_event_sink(capsys):
+
+    assert isinstance(get_event_sink(None, verbose=False), NullSink)
+    assert isinstance(get_event_sink(None), ConsoleSink)
+    assert isinstance(get_event_sink(logging.getLogger('elpee')), LoggingSink)
+    assert isinstance(get_event_sink(print), CallbackSink)
+
+    get_event_sink().emit('optimal', 'Solution after %d iteration(s)', 2)
+    assert capsys.readouterr().out == '\nSolution after 2 iteration(s)\n'
+
+    # sinks must implement handle
+    with pytest.raises(TypeError):
+        EventSink()
@@ -0,0 +1,63 @@
+import pytest
+
+from elpee import LinearProblem
+from elpee.utils.expression_parser import ExpressionError, parse_constraint, parse_constraints, parse_objective
+
+def test_parse_constraint():
+
+    assert parse_constraint('6*x + 4 y >= 24') == {'>=': {'x': 6.0, 'y': 4.0, 'sol': 24.0}}
+    assert parse_constraint('-x+.5*y<=2e1') == {'<=': {'x': -1.0, 'y': 0.5, 'sol': 20.0}}
+    # variables on the right-hand side, constants on the left-hand side and repeated terms
+    assert parse_constraint('2*x + 3 - y = x - 4*y + 10') == {'=': {'x': 1.0, 'y': 3.0, 'sol': 7.0}}
+    # strict inequalities are negated
+    assert parse_constraint('y + b > 1') == {'<=': {'y': -1.0, 'b': -1.0, 'sol': -1.0}}
+    assert parse_objective('5*x1 + 4*x2 - x1') == {'x1': 4.0, 'x2': 4.0}
+
+@pytest.mark.parametrize('expression, message, position', [
+    ('x + 2*y', "exactly one equality or inequality operator", 7),
+    ('x + y <= 2 <= 3', "exactly one equality or inequality operator", 11),
+    ('x + 2 y z <= 4', "Expected '+' or '-' between terms", 8),
+    ('x + 2* <= 4', "Expected a variable after '*'", 7),
+    ('x + *y <= 4', "Expected a coefficient before '*'", 4),
+    ('x + $y <= 4', "Unexpected character '$'", 4),
+    ('x + <= 4', "Expected a coefficient or a variable", 4),
+])
+def test_parse_constraint_error_position(expression, message, position):
+
+    with pytest.raises(ExpressionError) as error:
+        parse_constraint(expression)
+    assert message in error.value.message
+    assert error.value.position == position
+
+def test_parse_objective_invalid():
+
+    with pytest.raises(ValueError, match="cannot have equality or inequality operators"):
+        parse_objective('x + y <= 2')
+    with pytest.raises(ValueError, match="cannot have constant terms"):
+        parse_objective('x + y + 2')
+
+def test_parse_constraints_text(tmp_path):
+
+    text = """
+    # resources
+    6*x + 4*y <= 24
+    x + 2*y <= 6; y <= x + 1   # bounds
+    """
+    expressions, constraints = parse_constraints(text)
+    assert expressions == ['6*x + 4*y <= 24', 'x + 2*y <= 6', 'y <= x + 1']
+    assert constraints == [parse_constraint(expression) for expression in expressions]
+
+    with pytest.raises(ExpressionError) as error:
+        parse_constraints('x <= 1\nx <= 2; x + y << 3')
+    assert (error.value.line, error.value.position) == (2, 15)
+
+    file_path = tmp_path / 'constraints.txt'
+    file_path.write_text(text)
+    problem = LinearProblem()
+    problem.add_objective('x + y')
+    problem.add_constraints_from_file(file_path)
+
+    bulk_problem = LinearProblem()
+    bulk_problem.add_objective('x + y')
+    bulk_problem.add_constraints(expressions)
+    assert problem.standardize_problem() == bulk_problem.standardize_problem()
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+from elpee.algorithms.all_stack_starter import AllStackStarter
+from elpee.datahandler.history_handler import HistoryWriter, read_history
+from elpee.datahandler.snapshot_handler import get_dense_tableau
+from elpee.datahandler.trajectory_handler import read_trajectory
+from elpee.utils.protocols.handler import DataHandler
+from elpee.utils.protocols.solve_step import run_steps
+
+def create_problem():
+    rng = np.random.default_rng(3)
+    problem = LinearProblem.from_arrays(rng.integers(1, 9, 12), rng.integers(0, 9, (10, 12)), rng.integers(10, 40, 10))
+    return problem
+
+class RecordingWriter(HistoryWriter):
+    """
+    History writer keeping a copy of each appended step
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.steps = []
+
+    def append(self, problem, step_name):
+        if self.steps and (self.steps[-1][0] == step_name):
+            # the step replaces the last step
+            self.steps.pop()
+        super().append(problem, step_name)
+        self.steps.append((step_name,) + (get_dense_tableau(problem).copy(), problem.basic_vars.copy(), problem.is_optimal))
+
+@pytest.mark.parametrize("backend", ['list', 'dense', 'sparse'])
+@pytest.mark.parametrize("checkpoint_every, compress", [(1, False), (4, True), (100, False)])
+def test_history_replay(tmp_path, backend, checkpoint_every, compress):
+
+    problem = create_problem().standardize_problem()
+    if backend == 'dense':
+        problem.use_dense_tableau()
+    elif backend == 'sparse':
+        problem.use_sparse_tableau()
+    file_path = str(tmp_path / 'steps.elph')
+    data_handler = DataHandler(file_format='history', freq='all', file_path=file_path)
+    data_handler.writer = writer = RecordingWriter(file_path, checkpoint_every=checkpoint_every, compress=compress)
+    run_steps(AllStackStarter(problem).iter_solver(show_steps=False, show_interpret=False, data_handler=data_handler))
+    data_handler.close()
+
+    history = read_history(file_path)
+    assert len(history) == len(writer.steps) > 5
+    assert len(history.checkpoints) == writer.n_checkpoints
+    if checkpoint_every == 1:
+        assert len(history.checkpoints) == len(history)
+    else:
+        assert len(history.checkpoints) < len(history)
+        assert history.read_record(1)['pivot'] is not None
+
+    # steps are rebuilt in any order
+    for position in [len(history) - 1, 2, 0, 3, 3, 1] + list(range(len(history))):
+        _, tableau, basic_vars, is_optimal = writer.steps[position]
+        step = history[position]
+        assert step.basic_vars == basic_vars
+        assert step.is_optimal == is_optimal
+        assert np.allclose(step.tableau.array, tableau.array, atol=1e-9)
+    assert history.read_record(0)['phase'] == 'optimization'
+
+def test_solve_history(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend='dense',
+                                  file_format='trajectory')
+    elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend='dense',
+                       file_format='history')
+
+    trajectory = read_trajectory('solution.elpt')
+    history = read_history('solution.elph')
+    assert history.step_names == trajectory.step_names
+    assert history[-1].basic_vars == solution.basic_vars
+    assert history[-1].is_optimal
+    assert history.get('sol_step_1').var_name_list == solution.var_name_list
+    assert [step.basic_vars for step in history] == [step.basic_vars for step in trajectory]
+
+@pytest.mark.parametrize("flush_every", [1, 16])
+def test_replace_history_step(tmp_path, flush_every):
+
+    problem = create_problem().standardize_problem()
+    problem.use_dense_tableau()
+    file_path = str(tmp_path / 'steps.elph')
+    with HistoryWriter(file_path, flush_every=flush_every) as writer:
+        writer.append(problem, 'sol_step_1')
+        problem.pivot(1, 1)
+        writer.append(problem, 'sol_step_2')
+        # a step saved again with only its status changed keeps its pivot
+        problem.update_optimal_status(True)
+        writer.append(problem, 'sol_step_2')
+        assert (writer.n_records, writer.n_checkpoints) == (2, 1)
+        problem.pivot(2, 2)
+        writer.append(problem, 'sol_step_3')
+        # a step saved again with a changed tableau is saved as a checkpoint
+        problem.tableau.round(1)
+        writer.append(problem, 'sol_step_3')
+        assert (writer.n_records, writer.n_checkpoints) == (3, 2)
+
+    history = read_history(file_path)
+    assert history.step_names == ['sol_step_1', 'sol_step_2', 'sol_step_3']
+    assert history.checkpoints == [0, 2]
+    assert history[1].is_optimal
+    assert np.allclose(history[2].tableau.array, problem.tableau.array)
+
+def test_unclosed_history(tmp_path):
+
+    problem = create_problem().standardize_problem()
+    problem.use_dense_tableau()
+    file_path = str(tmp_path / 'steps.elph')
+    writer = HistoryWriter(file_path, checkpoint_every=3, flush_every=1)
+    writer.append(problem, 'sol_step_1')
+    for i in range(4):
+        problem.pivot(i + 1, 1 + i)
+        writer.append(problem, f'sol_step_{i+2}')
+    assert writer.n_checkpoints == 2
+
+    # a partly written step is skipped
+    with open(file_path, 'ab') as file:
+        file.write(b'\x40\x00\x00\x00\x00\x10\x00')
+    history = read_history(file_path)
+    assert history.step_names == [f'sol_step_{i+1}' for i in range(5)]
+    assert history.checkpoints == [0, 3]
+    assert np.allclose(history.get('sol_step_5').tableau.array, problem.tableau.array)
+
+    with pytest.raises(KeyError):
+        history.get('sol_step_6')
+    with pytest.raises(ValueError):
+        read_history(__file__)
+    with pytest.raises(ValueError):
+        HistoryWriter(file_path, checkpoint_every=0)
@@ -0,0 +1,97 @@
+import array
+
+import numpy as np
+import pytest
+
+from elpee import LinearProblem
+
+CONSTRAINTS = ['-x + y <= 2', '6*x + 4*y >= 24', 'y + b > 1', 'a - 2*y = 3']
+
+def test_add_constraints():
+
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('x + y')
+    for constraint in CONSTRAINTS:
+        problem.add_constraint(constraint)
+
+    bulk_problem = LinearProblem(is_maximization=False)
+    bulk_problem.add_objective('x + y')
+    bulk_problem.add_constraints(iter(CONSTRAINTS))
+
+    assert bulk_problem.variables == ['a', 'b', 'x', 'y']
+    assert bulk_problem.standardize_problem() == problem.standardize_problem()
+
+def test_add_constraints_invalid():
+
+    problem = LinearProblem()
+    problem.add_objective('x + y')
+    with pytest.raises(ValueError):
+        problem.add_constraints(['x <= 2', 'x + y'])
+
+    # no constraint of the invalid batch is added
+    problem.add_constraint('y <= 3')
+    assert problem.variables == ['x', 'y']
+    assert problem.standardize_problem().n_constraints == 1
+
+def test_standardize_problem_repeated():
+
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('x + y')
+    problem.add_constraints(CONSTRAINTS)
+    problem.use_dual_simplex()
+    dual_problem = problem.standardize_problem()
+
+    problem.use_bigM()
+    assert problem.standardize_problem().n_artificials == 3
+    problem.use_dual_simplex()
+    assert problem.standardize_problem() == dual_problem
+
+class _CooMatrix():
+    """
+    Minimal sparse matrix providing tocoo() with a repeated entry
+    """
+    def __init__(self):
+        self.row, self.col, self.data = np.array([0, 0, 1, 1]), np.array([1, 1, 0, 3]), np.array([1.0, 1.0, -1.0, 1.0])
+        self.shape = (2, 4)
+
+    def tocoo(self):
+        return self
+
+@pytest.mark.parametrize('method', ['bigM', 'dual'])
+@pytest.mark.parametrize('sparse', [False, True])
+def test_from_arrays(method, sparse):
+
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('x + y')
+    problem.add_constraints(['-x + y <= 2', '- 6*x - 4*y <= -24', 'a - 2*y = 3'])
+
+    A_ub = np.array([[-1, 1], [-6, -4]])
+    array_problem = LinearProblem.from_arrays([1, 1, 0], np.hstack((A_ub, np.zeros((2, 1)))), [2, -24],
+                                              [[0, -2, 1]], [3], var_names=['x', 'y', 'a'], is_maximization=False)
+    for lp_problem in (problem, array_problem):
+        lp_problem.use_dual_simplex() if method == 'dual' else lp_problem.use_bigM()
+
+    assert array_problem.variables == problem.variables
+    assert array_problem.standardize_problem(sparse=sparse) == problem.standardize_problem(sparse=sparse)
+    assert array_problem.standard_constraints == problem.standard_constraints
+
+def test_from_arrays_inputs():
+
+    # buffer protocol and sparse inputs with default names
+    buffer = memoryview(array.array('d', [1, 2, 0, 0, 0, 0, 3, 1])).cast('B').cast('d', [2, 4])
+    problem = LinearProblem.from_arrays(array.array('d', [1, 1, 1, 1]), buffer, [4, 6])
+    sparse_problem = LinearProblem.from_arrays(np.ones(4), A_eq=_CooMatrix(), b_eq=[2, 5])
+    assert problem.variables == sparse_problem.variables == ['x1', 'x2', 'x3', 'x4']
+    assert problem.constraints == ['x1 + 2 x2 <= 4', '3 x3 + x4 <= 6']
+    assert sparse_problem.constraints == ['2 x2 = 2', '- x1 + x4 = 5']
+
+    # constraints added after the arrays are appended to them
+    problem.add_constraint('x1 <= 1')
+    assert problem.standardize_problem().n_constraints == 3
+
+    with pytest.raises(ValueError):
+        LinearProblem.from_arrays([1, 1], [[1, 2, 3]], [4])
+    with pytest.raises(ValueError):
+        LinearProblem.from_arrays([1, 1], [[1, 2]], [4, 5])
+    with pytest.raises(ValueError):
+        LinearProblem.from_arrays([1, 1], A_ub=[[1, 2]])
@@ -0,0 +1,131 @@
+import pytest
+
+from elpee import LinearProblem, data_handler, elpee_solver, lp_handler, mps_handler
+
+MPS_FILE = """* ranged, bounded and integer model
+NAME          TESTLP
+OBJSENSE
+    MAX
+ROWS
+ N  COST
+ L  LIM1
+ G  LIM2
+ E  MYEQN
+ L  RNG
+COLUMNS
+    MARKER    'MARKER'                 'INTORG'
+    X1        COST               1.0   LIM1               1.0
+    X1        LIM2               1.0
+    MARKER    'MARKER'                 'INTEND'
+    X2        COST               2.0   LIM1               1.0
+    X2        MYEQN             -1.0   RNG                1.0
+    X3        COST              -1.0   MYEQN              1.0
+RHS
+    RHS       LIM1               4.0   LIM2               1.0
+    RHS       MYEQN              1.0   RNG                3.0
+RANGES
+    RNG       RNG                2.0
+BOUNDS
+ UP BND       X1                 4.0
+ UP BND       X3                 5.0
+ENDATA
+"""
+
+LP_FILE = """\\ same model in the CPLEX LP format
+Maximize
+ cost: x1 + 2x2
+   - x3
+Subject To
+ lim1: x1 + x2 <= 4
+ lim2: x1
+       >= 1
+ myeqn: - x2 + x3 = 1
+ 1 <= x2 <= 3   \\ ranged row
+Bounds
+ x1 <= 4
+ 5 >= x3
+Generals
+ x1
+End
+"""
+
+def solve(problem: LinearProblem) -> float:
+    problem.use_bigM(numeric=True)
+    solution = elpee_solver.solve(problem, show_steps=False, show_interpret=False, backend='dense')
+    return solution.tableau.sol_col[0]
+
+@pytest.mark.parametrize('fixed', [False, True])
+def test_read_mps(tmp_path, fixed):
+
+    file_path = tmp_path / 'model.mps'
+    file_path.write_text(MPS_FILE)
+    with pytest.warns(UserWarning, match="Integer variables of the MPS file"):
+        problem = mps_handler.read_mps(file_path, fixed=fixed)
+
+    assert problem.is_max
+    assert problem.standard_objective == {'X1': 1.0, 'X2': 2.0, 'X3': -1.0}
+    assert problem.constraints == ['X1 + X2 <= 4', 'X1 >= 1', '- X2 + X3 = 1', 'X2 >= 1', 'X2 <= 3',
+                                   'X1 <= 4', 'X3 <= 5']
+    assert solve(problem) == pytest.approx(3.0)
+
+def test_read_lp(tmp_path):
+
+    file_path = tmp_path / 'model.lp'
+    file_path.write_text(LP_FILE)
+    with pytest.warns(UserWarning, match="Integer variables of the LP file"):
+        problem = lp_handler.read_lp(file_path)
+
+    mps_path = tmp_path / 'model.mps'
+    mps_path.write_text(MPS_FILE.replace('X', 'x'))
+    with pytest.warns(UserWarning):
+        mps_problem = mps_handler.read_mps(mps_path)
+    assert problem.standard_objective == mps_problem.standard_objective
+    assert problem.standard_constraints == mps_problem.standard_constraints
+    assert solve(problem) == pytest.approx(3.0)
+
+    # model files are standardized when read as a problem file
+    with pytest.warns(UserWarning):
+        assert data_handler.read_file(str(file_path)) == lp_handler.read_lp(file_path).standardize_problem()
+
+def test_read_objective_constant(tmp_path):
+
+    lp_path = tmp_path / 'model.lp'
+    lp_path.write_text("Maximize\n obj: x + 2 y + 3\nSubject To\n c1: x + y <= 4\nEnd\n")
+    with pytest.warns(UserWarning, match="Constant 3 of the objective function is ignored") as record:
+        problem = lp_handler.read_lp(lp_path)
+    assert problem.standard_objective == {'x': 1.0, 'y': 2.0}
+    # the warning points to the caller of the reader
+    assert record[0].filename == __file__
+
+    mps_path = tmp_path / 'model.mps'
+    mps_handler.write_mps(problem, mps_path)
+    mps_path.write_text(mps_path.read_text().replace("RHS\n", "RHS\n    RHS       OBJ     -3.0\n"))
+    with pytest.warns(UserWarning, match="Constant 3 of the objective function is ignored") as record:
+        assert mps_handler.read_mps(mps_path).standard_objective == {'x': 1.0, 'y': 2.0}
+    assert record[0].filename == __file__
+
+def test_write_model_files(tmp_path):
+
+    file_path = tmp_path / 'model.mps'
+    file_path.write_text(MPS_FILE)
+    with pytest.warns(UserWarning):
+        problem = mps_handler.read_mps(file_path)
+
+    mps_handler.write_mps(problem, tmp_path / 'out.mps')
+    lp_handler.write_lp(problem, tmp_path / 'out.lp')
+    for read_problem in (mps_handler.read_mps(tmp_path / 'out.mps'), mps_handler.read_mps(tmp_path / 'out.mps', fixed=True),
+                         lp_handler.read_lp(tmp_path / 'out.lp')):
+        assert read_problem.is_max
+        assert read_problem.standard_objective == problem.standard_objective
+        assert read_problem.standard_constraints == problem.standard_constraints
+
+def test_read_free_variable(tmp_path):
+
+    file_path = tmp_path / 'model.lp'
+    file_path.write_text("Minimize\n obj: x + y\nSubject To\n c1: x + y >= 1\nBounds\n y free\nEnd\n")
+    with pytest.raises(ValueError, match="nonnegative"):
+        lp_handler.read_lp(file_path)
+
+    problem = LinearProblem()
+    with pytest.raises(ValueError):
+        problem.add_constraint_coefficients({'x': 1.0}, '<', 2.0)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+from elpee.algorithms.pricing import MultiplePricing, PartialPricing, get_candidate_keys, get_pricing_rule
+
+def create_problem():
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('19*a + 13*b + 12*c + 17*d')
+    problem.add_constraint('3*a + 2*b + c + 2*d <= 225')
+    problem.add_constraint('a + b + c + d <= 117')
+    problem.add_constraint('4*a + 3*b + 3*c + 4*d <= 420')
+    return problem
+
+def create_big_m_problem():
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('8*x0 + x1 + 8*x2')
+    problem.add_constraint('4*x0 + 5*x1 + 6*x2 <= 11')
+    problem.add_constraint('6*x0 + 2*x1 + 2*x2 >= 2')
+    problem.add_constraint('4*x0 + 5*x1 + 3*x2 >= 2')
+    return problem
+
+@pytest.mark.parametrize("backend", ["list", "dense", "sparse"])
+@pytest.mark.parametrize("pricing", ["dantzig", "partial", "multiple", "devex", "steepest-edge", "bland"])
+def test_pricing_rules(pricing, backend):
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False,
+                                  backend=backend, pricing=pricing)
+
+    assert solution.is_optimal
+    assert solution.interpret()['Sol'] == 1827.0
+
+    # round off residues of the sympy M coefficients do not stop the solve early
+    solution = elpee_solver.solve(create_big_m_problem(), show_steps=False, show_interpret=False,
+                                  backend=backend, pricing=pricing)
+
+    assert solution.is_optimal
+    assert float(solution.interpret()['Sol']) == pytest.approx(22)
+
+def test_pricing_rule_options():
+
+    rule = MultiplePricing(n_candidates=2, block_size=2)
+    assert get_pricing_rule(rule) is rule
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, pricing=rule)
+    assert solution.is_optimal
+
+    with pytest.raises(ValueError):
+        get_pricing_rule('largest')
+
+@pytest.mark.parametrize("backend", ["list", "dense", "sparse"])
+def test_partial_pricing_blocks(backend):
+
+    problem = create_problem().standardize_problem()
+    if backend == "dense":
+        problem.use_dense_tableau()
+    elif backend == "sparse":
+        problem.use_sparse_tableau()
+
+    # only the columns of the block are priced
+    candidates, costs = get_candidate_keys(problem, [4], np.arange(2, 5))
+    assert candidates.tolist() == [2]
+    assert costs.tolist() == [-12]
+
+    rule = PartialPricing(block_size=2)
+    assert [rule.select_pivot_col(problem, []) for _ in range(3)] == [1, 4, 1]
+    # blocks without improving columns (blocked or slack columns) are skipped
+    assert rule.select_pivot_col(problem, [3, 4]) == 1
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from sympy import Symbol
+
+from elpee import LinearProblem, StandardProblem, elpee_solver
+from elpee.utils.ratio_test import harris_ratio_test, select_entering_col_dual
+
+def test_harris_ratio_test():
+
+    # rows 0 and 2 tie within the tolerance - the larger pivot of row 2 is selected
+    col = np.array([1.0, -2.0, 4.0, 0.0])
+    rhs = np.array([1.0, 1.0, 4.0 + 1e-12, 0.0])
+    assert harris_ratio_test(col, rhs) == (2, False)
+
+    # degenerate rows with zero solution values are valid leaving rows
+    assert harris_ratio_test(np.array([1.0, 2.0]), np.array([3.0, 0.0])) == (1, False)
+
+    # pivot elements below the pivot tolerance are not used
+    assert harris_ratio_test(np.array([1e-12, -1.0]), np.array([0.0, 1.0])) == (-1, True)
+
+@pytest.mark.parametrize("backend", ["list", "dense", "sparse"])
+def test_large_ratio(backend):
+
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('x + y')
+    problem.add_constraint('x <= 5000000')
+    problem.add_constraint('y <= 2')
+
+    solution = elpee_solver.solve(problem, show_steps=False, show_interpret=False, backend=backend)
+
+    assert solution.is_optimal
+    assert solution.interpret()['Sol'] == 5000002.0
+
+def test_dual_ratio_test_big_m():
+
+    M = Symbol('M')
+    matrix = [[1 + 2.46e-32*M, 6, 0, 0, 0],
+              [-1, -2, 1, 0, -3],
+              [1, 1, 0, 1, 4]]
+    problem = StandardProblem(matrix=matrix, basic_vars=[0, 3, 4], n_decision_vars=2, is_max=False,
+                              n_artificials=0)
+
+    # round off residues of the coefficient of M do not exclude the column
+    assert select_entering_col_dual(problem, 1) == (1, False)
+
+    # columns with big M reduced costs are not selected
+    problem.matrix[0][0] = 1 + M
+    assert select_entering_col_dual(problem, 1) == (2, False)
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from elpee.algorithms import RevisedSimplexSolver
+from elpee.algorithms.revised_simplex import BasisFactorization
+from elpee import LinearProblem, StandardProblem
+
+def test_basis_factorization():
+
+    rng = np.random.default_rng(7)
+    basis_matrix = rng.normal(size=(6, 6))
+    factorization = BasisFactorization(refactor_frequency=10)
+    factorization.factorize(basis_matrix)
+
+    # replace two basis columns through eta updates
+    for pivot_row in [2, 4]:
+        new_col = rng.normal(size=6)
+        alpha = factorization.ftran(new_col)
+        factorization.update(pivot_row, alpha)
+        basis_matrix[:, pivot_row] = new_col
+
+    vector = rng.normal(size=6)
+    assert np.allclose(factorization.ftran(vector), np.linalg.solve(basis_matrix, vector))
+    assert np.allclose(factorization.btran(vector), np.linalg.solve(basis_matrix.T, vector))
+
+def test_revised_solver01():
+
+    matrix = [[-19,-13,-12,-17,  0,  0,  0,  0],
+              [  3,  2,  1,  2,  1,  0,  0,225],
+              [  1,  1,  1,  1,  0,  1,  0,117],
+              [  4,  3,  3,  4,  0,  0,  1,420]]
+    basic_vars = [0, 5, 6, 7]
+
+    output_matrix = [[0.0, 1.0, 0.0, 0.0, 2.0, 1.0, 3.0, 1827.0],
+                     [1.0, 1.0, 0.0, 0.0, 1.0, 2.0, -1.0, 39.0],
+                     [0.0, 1.0, 1.0, 0.0, 0.0, 4.0, -1.0, 48.0],
+                     [0.0, -1.0, 0.0, 1.0, -1.0, -5.0, 2.0, 30.0]]
+
+    problem = StandardProblem(
+        matrix=matrix,
+        basic_vars=basic_vars,
+        n_decision_vars=4,
+        is_max=True,
+        n_artificials=0
+    )
+    solution = RevisedSimplexSolver(problem).solver()
+
+    assert solution.is_optimal
+    assert sorted(solution.basic_vars) == [0, 1, 3, 4]
+    assert solution.tableau is None
+    rows = {var: row for var, row in zip(solution.basic_vars, solution.matrix)}
+    for var, row in zip([0, 1, 3, 4], output_matrix):
+        assert np.allclose(rows[var], row)
+
+@pytest.mark.parametrize("use_dual_simplex", [True, False])
+def test_revised_solver02(use_dual_simplex):
+
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('x + y')
+    problem.add_constraint('-x + y <= 2')
+    problem.add_constraint('6*x + 4*y >= 24')
+    problem.add_constraint('y >= 1')
+    if use_dual_simplex:
+        problem.use_dual_simplex()
+    else:
+        problem.use_bigM(numeric=True)
+
+    solution = RevisedSimplexSolver(problem).solver()
+
+    assert solution.is_optimal
+    assert solution.interpret() == {'Sol': 4.33, 'x': 3.33, 'y': 1.0, 'Slack_1': 4.33}
+
+def test_revised_solver03():
+
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('x + y')
+    problem.add_constraint('x - y <= 2')
+
+    solution = RevisedSimplexSolver(problem).solver()
+
+    assert not solution.is_optimal
+    assert not solution.is_optimal_reachable
+
+def test_revised_solver_zero_artificial():
+
+    # an artificial variable of an equality constraint remains basic at zero
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('6*x0 + 5*x1 + 4*x2')
+    problem.add_constraints(['2*x0 + 3*x1 + 4*x2 = 9', '5*x0 + 2*x1 + 5*x2 = 6'])
+
+    solution = RevisedSimplexSolver(problem).solver(show_steps=False, show_interpret=False)
+
+    assert solution.is_feasible
+    assert solution.is_optimal
+    assert solution.interpret()['Sol'] == 15.0
@@ -0,0 +1,74 @@
+import math
+
+import pytest
+from sympy import Symbol, sympify
+
+from elpee import LinearProblem, elpee_solver
+from elpee.datahandler.json_handler import read_json, write_json
+from elpee.datahandler.yaml_handler import read_yaml, write_yaml
+from elpee.utils.bigm import BigMValue
+from elpee.utils.utilities import convert_sympy_to_text
+
+M = Symbol('M')
+
+def create_problem():
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('2*yes + 3*b')
+    problem.add_constraints(['yes + b >= 4', 'yes + 3*b >= 6'])
+    return problem
+
+def split_value(value):
+    if isinstance(value, (int, float)):
+        return float(value), 0.0
+    value = sympify(value).expand()
+    return float(value.coeff(M, 0)), float(value.coeff(M, 1))
+
+@pytest.mark.parametrize("backend", ['list', 'dense', 'sparse'])
+@pytest.mark.parametrize("file_format", ['json', 'yaml'])
+def test_write_read(tmp_path, backend, file_format):
+
+    problem = elpee_solver.solve(create_problem(), single_iter=True, show_steps=False, show_interpret=False,
+                                 backend=backend)
+    file_path = str(tmp_path / f'problem.{file_format}')
+    write, read = (write_json, read_json) if file_format == 'json' else (write_yaml, read_yaml)
+    write(problem, file_path)
+    saved = read(file_path)
+
+    assert saved.basic_vars == problem.basic_vars
+    assert saved.var_name_list == problem.var_name_list
+    assert 'yes' in saved.var_name_list
+    assert saved.is_feasible == problem.is_feasible
+    expected = convert_sympy_to_text(problem.matrix)
+    assert len(saved.matrix) == len(expected)
+    for saved_row, row in zip(saved.matrix, expected):
+        for saved_value, value in zip(saved_row, row):
+            assert split_value(saved_value) == pytest.approx(split_value(value))
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_yaml_special_values(tmp_path, dense):
+
+    problem = create_problem().standardize_problem()
+    problem.matrix[1][0] = 1e-05
+    problem.matrix[1][1] = -2e+20
+    problem.matrix[2][0] = math.inf
+    problem.matrix[2][1] = -math.inf
+    problem.matrix[2][2] = math.nan
+    if dense:
+        problem.use_dense_tableau()
+    file_path = str(tmp_path / 'problem.yaml')
+    write_yaml(problem, file_path)
+
+    matrix = read_yaml(file_path).matrix
+    assert matrix[1][:2] == [1e-05, -2e+20]
+    assert matrix[2][:2] == [math.inf, -math.inf]
+    assert math.isnan(matrix[2][2])
+
+def test_convert_sympy_to_text():
+
+    matrix = [[BigMValue(1.5, -1.0), 2 - 3.333333*M, 1.0*M, sympify('1/3')], [1, 2.5, 0, 0]]
+    text = convert_sympy_to_text(matrix, decimals=2)
+    assert text == [["1.5 - 1.0*M", "2 - 3.33*M", "1.0*M", pytest.approx(1/3)], [1, 2.5, 0, 0]]
+    # the given matrix is not changed
+    assert matrix[0][1] == 2 - 3.333333*M
+    # float coefficients are rounded off as sympy does, keeping the text of the expression
+    assert convert_sympy_to_text([[2.0 - 3.333333*M, 0.5 + 0.0001*M]], decimals=2) == [["2.0 - 3.33*M", "0.50"]]
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from elpee import LinearProblem, Settings, elpee_solver, use_settings
+from elpee.utils import configs
+from elpee.utils.settings import DEFAULT_SETTINGS, get_settings
+
+def create_problem():
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('a + b')
+    problem.add_constraints(['3*a + b <= 1', 'a + 3*b <= 1'])
+    return problem
+
+def test_use_settings():
+
+    assert get_settings() == DEFAULT_SETTINGS
+    with use_settings(decimals=4) as settings:
+        assert get_settings() == settings == Settings(decimals=4)
+        with use_settings(width=20):
+            assert get_settings() == Settings(decimals=4, width=20)
+        assert get_settings().get_width() == configs.get_config_value('WIDTH')
+    assert get_settings() == DEFAULT_SETTINGS
+
+    with pytest.raises(ValueError):
+        with use_settings(decimals=4):
+            raise ValueError
+    assert get_settings() == DEFAULT_SETTINGS
+
+def test_settings_per_thread():
+
+    config = configs.load_config()
+    def solve(decimals):
+        with use_settings(decimals=decimals):
+            solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False)
+            return decimals, solution.interpret()['Sol']
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(solve, [1, 3, 5, 1, 3, 5]))
+    for decimals, objective_value in results:
+        assert objective_value == round(0.5, decimals)
+        assert objective_value == round(1/2, decimals)
+    # the configuration file is not changed
+    assert configs.load_config() == config
+
+def test_settings_of_solve(capsys):
+
+    solution = elpee_solver.solve(create_problem(), settings=Settings(silent=True))
+    assert solution.is_optimal
+    assert capsys.readouterr().out == ''
+
+    events = []
+    with use_settings(silent=True, events=events.append):
+        elpee_solver.solve(create_problem(), backend='dense')
+    assert events[-1].name == 'optimal'
+
+    elpee_solver.solve(create_problem(), show_steps=True, show_interpret=False, settings=Settings(decimals=4, width=9))
+    output = capsys.readouterr().out
+    assert 'Value for Objective Function = 0.5' in output
+    assert ''.join(name.center(9) for name in ['MAX', 'a', 'b', 'S1', 'S2', 'Sol']) in output.splitlines()
+
+    # pivots on values within the tolerance are not accepted
+    solution = elpee_solver.solve(create_problem(), backend='dense', settings=Settings(silent=True, pivot_tolerance=5))
+    assert not solution.is_optimal
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+from elpee.datahandler.snapshot_handler import read_snapshot, write_snapshot
+
+def create_problem():
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('2*a + 3*b')
+    problem.add_constraints(['a + b >= 4', 'a + 3*b >= 6'])
+    return problem
+
+# sympy values of the list backend are saved as float64 values
+@pytest.mark.parametrize("backend", ['list', 'dense', 'sparse', 'revised'])
+def test_snapshot_round_trip(tmp_path, backend):
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False,
+                                  backend=backend)
+    file_path = str(tmp_path / 'solution.elps')
+    write_snapshot(solution, file_path)
+
+    for mode in ['r', 'c', 'load']:
+        snapshot = read_snapshot(file_path, mode=mode)
+        if backend != 'list':
+            assert snapshot.matrix == solution.matrix
+        assert snapshot.basic_vars == solution.basic_vars
+        assert snapshot.var_name_list == solution.var_name_list
+        assert snapshot.is_optimal == solution.is_optimal
+        assert snapshot.n_iterations == solution.n_iterations
+        assert snapshot.interpret() == solution.interpret()
+
+def test_snapshot_big_m(tmp_path):
+
+    problem = create_problem().standardize_problem()
+    problem.use_dense_tableau()
+    assert problem.tableau.m_row is not None
+    file_path = str(tmp_path / 'problem.elps')
+    write_snapshot(problem, file_path)
+
+    snapshot = read_snapshot(file_path)
+    assert isinstance(snapshot.tableau.array, np.memmap)
+    assert snapshot.tableau.m_row.tolist() == problem.tableau.m_row.tolist()
+    assert snapshot.matrix == problem.matrix
+
+def test_snapshot_modes(tmp_path):
+
+    problem = create_problem().standardize_problem()
+    file_path = str(tmp_path / 'problem.elps')
+    write_snapshot(problem, file_path)
+
+    # read-only snapshots are shared and cannot be pivoted in place
+    with pytest.raises(ValueError):
+        read_snapshot(file_path).pivot(1, 1)
+    read_snapshot(file_path).copy().pivot(1, 1)
+
+    # copy-on-write changes are not written to the file
+    snapshot = read_snapshot(file_path, mode='c')
+    snapshot.pivot(1, 1)
+    assert read_snapshot(file_path).matrix != snapshot.matrix
+
+    with pytest.raises(ValueError):
+        read_snapshot(file_path, mode='w')
+
+def test_invalid_snapshot(tmp_path):
+
+    problem = create_problem().standardize_problem()
+    file_path = str(tmp_path / 'problem.elps')
+    write_snapshot(problem, file_path)
+    with open(file_path, 'rb') as file:
+        data = file.read()
+
+    with open(file_path, 'wb') as file:
+        file.write(data[:-8])
+    with pytest.raises(ValueError):
+        read_snapshot(file_path)
+
+    with open(file_path, 'wb') as file:
+        file.write(b'{}')
+    with pytest.raises(ValueError):
+        read_snapshot(file_path)
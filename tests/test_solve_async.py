@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+
+def create_problem():
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('19*a + 13*b + 12*c + 17*d')
+    problem.add_constraints(['3*a + 2*b + c + 2*d <= 225', 'a + b + c + d <= 117', '4*a + 3*b + 3*c + 4*d <= 420'])
+    return problem
+
+@pytest.mark.parametrize('offload', [False, True])
+def test_solve_async(offload):
+
+    expected = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend='dense')
+    solution = asyncio.run(elpee_solver.solve_async(create_problem(), yield_every=1, offload=offload, backend='dense'))
+    assert solution == expected
+
+    async def collect_steps():
+        steps = elpee_solver.iter_steps_async(create_problem(), yield_every=2, offload=offload, backend='dense')
+        return [step async for step in steps], steps.solution
+
+    steps, solution = asyncio.run(collect_steps())
+    assert solution == expected
+    assert [step.iteration for step in steps] == list(range(1, expected.n_iterations + 1))
+    assert all(step.phase == 'optimization' for step in steps)
+    assert (steps[0].entering, steps[0].leaving) == ('a', 'Slack_1')
+    assert steps[-1].objective_value == expected.matrix[0][-1]
+
+def test_solve_async_cancel():
+
+    async def cancel_after_first_step():
+        steps = elpee_solver.iter_steps_async(create_problem(), yield_every=1, backend='dense')
+        task = asyncio.ensure_future(steps.__anext__())
+        await task
+        task = asyncio.ensure_future(steps.run())
+        # cancelled while waiting to apply the next step
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        with pytest.raises(StopAsyncIteration):
+            await steps.__anext__()
+        return steps
+
+    steps = asyncio.run(cancel_after_first_step())
+    assert (not steps.done) and (steps.solution is None)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(elpee_solver.solve_async(create_problem(), timeout=0))
+    with pytest.raises(TypeError):
+        elpee_solver.iter_steps_async(create_problem(), show_step=True)
@@ -0,0 +1,34 @@
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+
+def create_problem(rhs):
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('5*x + 4*y')
+    problem.add_constraints(['6*x + 4*y <= 24', f'x + 2*y <= {rhs}'])
+    return problem
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_solve_many(ordered):
+
+    problems = [create_problem(rhs) for rhs in range(1, 8)]
+    problems.insert(2, None)
+    results = list(elpee_solver.solve_many(iter(problems), processes=2, chunksize=3, ordered=ordered, backend='dense'))
+
+    if ordered:
+        assert [result.index for result in results] == list(range(8))
+    results.sort(key=lambda result: result.index)
+
+    # the error of the invalid problem does not stop the batch
+    assert (results[2].solution is None) and isinstance(results[2].error, AttributeError)
+    for result, problem in zip(results[:2] + results[3:], problems[:2] + problems[3:]):
+        solution = elpee_solver.solve(problem, show_steps=False, show_interpret=False, backend='dense')
+        assert result.error is None
+        assert result.solution == solution
+
+def test_solve_many_invalid():
+
+    with pytest.raises(ValueError):
+        list(elpee_solver.solve_many([create_problem(1)], show_steps=True))
+    with pytest.raises(ValueError):
+        list(elpee_solver.solve_many([create_problem(1)], chunksize=0))
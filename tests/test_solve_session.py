@@ -0,0 +1,43 @@
+import os
+
+from elpee import LinearProblem, SolveSession, elpee_solver
+from elpee.utils.protocols.tableau import DenseTableau
+
+def create_problem():
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective('19*a + 13*b + 12*c + 17*d')
+    problem.add_constraints(['3*a + 2*b + c + 2*d <= 225', 'a + b + c + d <= 117', '4*a + 3*b + 3*c + 4*d <= 420'])
+    return problem
+
+def test_iter_steps():
+
+    expected = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend='dense')
+
+    session = elpee_solver.iter_steps(create_problem(), include_tableau=True, backend='dense')
+    assert isinstance(session, SolveSession)
+    first_step = session.step()
+    assert (first_step.phase, first_step.iteration, first_step.entering, first_step.leaving) == \
+        ('optimization', 1, 'a', 'Slack_1')
+    assert isinstance(first_step.tableau, DenseTableau)
+
+    steps = [first_step] + list(session)
+    assert session.done and (session.step() is None)
+    assert len(steps) == session.n_steps == expected.n_iterations
+    assert session.solution == expected
+    assert steps[-1].objective_value == expected.matrix[0][-1]
+
+def test_iter_steps_resume(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    session = elpee_solver.iter_steps(create_problem(), file_format='json')
+    session.step()
+    step_files = set(os.listdir('solution'))
+    # the solution folder is created once and the following steps add to it
+    session.step()
+    assert step_files < set(os.listdir('solution'))
+    assert session.run() == session.solution
+    assert session.solution.is_optimal
+
+    session = elpee_solver.iter_steps(create_problem())
+    session.close()
+    assert session.done and (session.step() is None) and (session.solution is None)
@@ -0,0 +1,68 @@
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+from elpee.utils.protocols.sparse_tableau import SparseTableau
+from elpee.utils.protocols.tableau import DenseTableau
+
+def test_sparse_tableau_pivot():
+
+    matrix = [[-19,-13,-12,-17,  0,  0,  0,  0],
+              [  3,  2,  1,  2,  1,  0,  0,225],
+              [  1,  1,  1,  1,  0,  1,  0,117],
+              [  4,  3,  3,  4,  0,  0,  1,420]]
+
+    sparse = SparseTableau.from_matrix(matrix)
+    dense = DenseTableau(matrix)
+    assert sparse.nnz == 15
+
+    for pivot_row, pivot_col_var in [(1, 1), (3, 4), (2, 3)]:
+        sparse.pivot(pivot_row, pivot_col_var)
+        dense.pivot(pivot_row, pivot_col_var)
+        assert sparse.to_list() == dense.to_list()
+        assert sparse.col_rows[pivot_col_var-1] == {pivot_row-1}
+
+    data, indices, indptr = sparse.to_csr()
+    rebuilt = SparseTableau.from_csr(sparse.objective, data, indices, indptr, sparse.rhs)
+    assert rebuilt.to_list() == sparse.to_list()
+
+def test_sparse_standardize_problem():
+
+    def create_problem():
+        problem = LinearProblem(is_maximization=False)
+        problem.add_objective('x + y + 2*z')
+        problem.add_constraint('-x + y <= 2')
+        problem.add_constraint('6*x + 4*y >= 24')
+        problem.add_constraint('y + z >= 1')
+        return problem
+
+    problem = create_problem().standardize_problem()
+    problem.use_dense_tableau()
+    sparse_problem = create_problem().standardize_problem(sparse=True)
+
+    assert isinstance(sparse_problem.tableau, SparseTableau)
+    assert sparse_problem.tableau.nnz == 11
+    assert sparse_problem.matrix == problem.matrix
+    assert sparse_problem.basic_vars == problem.basic_vars
+    assert sparse_problem.n_slack_vars == problem.n_slack_vars
+
+@pytest.mark.parametrize("use_dual_simplex", [True, False])
+def test_sparse_backend_solve(use_dual_simplex):
+
+    def create_problem():
+        problem = LinearProblem(is_maximization=False)
+        problem.add_objective('x + y')
+        problem.add_constraint('-x + y <= 2')
+        problem.add_constraint('6*x + 4*y >= 24')
+        problem.add_constraint('y >= 1')
+        if use_dual_simplex:
+            problem.use_dual_simplex()
+        return problem
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False)
+    sparse_solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False,
+                                         backend="sparse")
+
+    assert isinstance(sparse_solution.tableau, SparseTableau)
+    assert sparse_solution.is_optimal
+    assert sparse_solution.basic_vars == solution.basic_vars
+    assert sparse_solution.interpret() == solution.interpret()
@@ -0,0 +1,110 @@
+import pytest
+
+from elpee.algorithms import AllStackStarter
+from elpee import StandardProblem
+
+def test_dense_tableau01():
+
+    matrix = [[-19,-13,-12,-17,  0,  0,  0,  0],
+              [  3,  2,  1,  2,  1,  0,  0,225],
+              [  1,  1,  1,  1,  0,  1,  0,117],
+              [  4,  3,  3,  4,  0,  0,  1,420]]
+    basic_vars = [0, 5, 6, 7]
+    n_decision_vars = 4
+    is_max = True
+    n_artificials = 0
+
+    problem = StandardProblem(
+        matrix=[row.copy() for row in matrix],
+        basic_vars=basic_vars.copy(),
+        n_decision_vars=n_decision_vars,
+        is_max=is_max,
+        n_artificials=n_artificials
+    )
+    dense_problem = StandardProblem(
+        matrix=[row.copy() for row in matrix],
+        basic_vars=basic_vars.copy(),
+        n_decision_vars=n_decision_vars,
+        is_max=is_max,
+        n_artificials=n_artificials,
+        dense=True
+    )
+
+    solution = AllStackStarter(problem).solver()
+    dense_solution = AllStackStarter(dense_problem).solver()
+
+    assert dense_solution.tableau is not None
+    assert solution == dense_solution
+    assert dense_solution.interpret() == solution.interpret()
+
+def test_dense_tableau02():
+
+    matrix = [[-3, 1, 0, 0, 0],
+              [ 4, -1, 1, 0, 8],
+              [-8, -1, 0, 1, -12]]
+    basic_vars = [0, 3, 4]
+
+    output_matrix = [[0.0, 0.25, 0.75, 0.0, 6.0],
+                     [0.0, -3.0, 2.0, 1.0, 4.0],
+                     [1.0, -0.25, 0.25, 0.0, 2.0]]
+    output_basic_vars = [0, 4, 1]
+
+    problem = StandardProblem(
+        matrix=matrix,
+        basic_vars=basic_vars,
+        n_decision_vars=2,
+        is_max=True,
+        n_artificials=0,
+        dense=True
+    )
+
+    solution = AllStackStarter(problem).solver()
+
+    assert solution.matrix == output_matrix
+    assert solution.basic_vars == output_basic_vars
+    assert solution.obj_row.tolist() == output_matrix[0][:-1]
+
+def test_dense_tableau_matrix_view():
+
+    problem = StandardProblem(
+        matrix=[[-5, -4, 0, 0,  0],
+                [ 6,  4, 1, 0, 24],
+                [ 1,  2, 0, 1,  6]],
+        basic_vars=[0, 3, 4],
+        n_decision_vars=2,
+        dense=True
+    )
+
+    assert problem.n_constraints == 2
+    assert problem.n_slack_vars == 2
+    assert problem.matrix[1] == [6.0, 4.0, 1.0, 0.0, 24.0]
+
+    # assigning a list matrix keeps the problem backed by a dense tableau
+    problem.matrix = [[0, 0, 0, 0, 0], [1, 0, 1, 0, 1], [0, 1, 0, 1, 1]]
+    assert problem.tableau is not None
+    assert problem.matrix[2] == [0.0, 1.0, 0.0, 1.0, 1.0]
+
+    copied = problem.copy()
+    copied.tableau.pivot(1, 3)
+    assert problem.matrix[1] == [1.0, 0.0, 1.0, 0.0, 1.0]
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_standard_problem_pivot(dense):
+
+    problem = StandardProblem(
+        matrix=[[-5, -4, 0, 0,  0],
+                [ 6,  4, 1, 0, 24],
+                [ 1,  2, 0, 1,  6]],
+        basic_vars=[0, 3, 4],
+        n_decision_vars=2,
+        dense=dense
+    )
+
+    problem.pivot(1, 1)
+
+    assert problem.basic_vars == [0, 1, 4]
+    output_matrix = [[0.0, -2/3, 5/6, 0.0, 20.0],
+                     [1.0, 2/3, 1/6, 0.0, 4.0],
+                     [0.0, 4/3, -1/6, 1.0, 2.0]]
+    for row, output_row in zip(problem.matrix, output_matrix):
+        assert row == pytest.approx(output_row)
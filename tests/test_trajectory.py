@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+from elpee.datahandler.json_handler import problem_from_dict, problem_to_dict, read_json
+from elpee.datahandler.trajectory_handler import TrajectoryWriter, read_trajectory
+
+def create_problem():
+    problem = LinearProblem(is_maximization=False)
+    problem.add_objective('2*a + 3*b')
+    problem.add_constraints(['a + b >= 4', 'a + 3*b >= 6'])
+    return problem
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_solve_trajectory(tmp_path, monkeypatch, compress):
+
+    monkeypatch.chdir(tmp_path)
+    elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, file_format='json')
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False,
+                                  file_format='trajectory', file_path='steps.elpt', compress=compress)
+
+    trajectory = read_trajectory('steps.elpt')
+    # the last step saved again with the final status of the solution replaces its record
+    assert trajectory.step_names == ['infeasible_sol_1', 'sol_step_1', 'sol_step_2', 'sol_step_3']
+    for step_name in trajectory.step_names:
+        assert trajectory.get(step_name).matrix == read_json(f'solution/{step_name}.json').matrix
+    assert trajectory[-1].basic_vars == solution.basic_vars
+    assert trajectory[-1].is_optimal
+    assert trajectory.read_record(0)['step'] == 'infeasible_sol_1'
+
+def test_final_trajectory(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    for backend in ['dense', 'revised']:
+        elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend=backend,
+                           file_format='trajectory', freq='final')
+        assert read_trajectory('solution.elpt').step_names == ['final_sol']
+    assert not os.path.exists('solution')
+
+def test_unclosed_trajectory(tmp_path):
+
+    problem = create_problem().standardize_problem()
+    file_path = str(tmp_path / 'steps.elpt')
+    writer = TrajectoryWriter(file_path, compress=True, flush_every=2)
+    for i in range(5):
+        writer.append(problem, f'sol_step_{i+1}')
+    # records are written in batches of flush_every records
+    assert len(read_trajectory(file_path)) == 4
+    writer.flush()
+    assert read_trajectory(file_path).step_names == [f'sol_step_{i+1}' for i in range(5)]
+
+    # a partly written record is skipped
+    with open(file_path, 'ab') as file:
+        file.write(b'\x40\x00\x00\x00\x00{"step"')
+    assert len(read_trajectory(file_path)) == 5
+
+    with pytest.raises(KeyError):
+        read_trajectory(file_path).get('sol_step_6')
+    with pytest.raises(ValueError):
+        read_trajectory(__file__)
+
+@pytest.mark.parametrize("flush_every", [1, 16])
+def test_replace_trajectory_record(tmp_path, flush_every):
+
+    problem = create_problem().standardize_problem()
+    file_path = str(tmp_path / 'steps.elpt')
+    with TrajectoryWriter(file_path, flush_every=flush_every) as writer:
+        writer.append(problem, 'sol_step_1')
+        problem.pivot(1, 1)
+        writer.append(problem, 'sol_step_2')
+        problem.update_optimal_status(True)
+        writer.append(problem, 'sol_step_2')
+        assert writer.n_records == 2
+
+    trajectory = read_trajectory(file_path)
+    assert trajectory.step_names == ['sol_step_1', 'sol_step_2']
+    assert trajectory[-1].is_optimal
+    assert trajectory[-1].matrix == problem_from_dict(problem_to_dict(problem)).matrix
+
+def test_session_trajectory(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    session = elpee_solver.iter_steps(create_problem(), file_format='trajectory')
+    session.step()
+    session.close()
+    # the index footer is written once the session is closed
+    assert read_trajectory('solution.elpt').step_names == ['infeasible_sol_1']
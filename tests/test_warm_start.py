@@ -0,0 +1,52 @@
+import pytest
+
+from elpee import LinearProblem, elpee_solver
+
+def create_problem(objective='19*a + 13*b + 12*c + 17*d', rhs=(225, 117, 420)):
+    problem = LinearProblem(is_maximization=True)
+    problem.add_objective(objective)
+    problem.add_constraint(f'3*a + 2*b + c + 2*d <= {rhs[0]}')
+    problem.add_constraint(f'a + b + c + d <= {rhs[1]}')
+    problem.add_constraint(f'4*a + 3*b + 3*c + 4*d <= {rhs[2]}')
+    return problem
+
+def test_export_basis():
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False)
+
+    assert solution.export_basis() == ['a', 'c', 'd']
+    assert solution.get_variable_index('c') == 3
+    assert solution.get_variable_index('Slack_2') == 6
+    assert solution.get_variable_index('Slack_4') == -1
+
+@pytest.mark.parametrize("backend", ["list", "dense", "sparse", "revised"])
+def test_warm_start_reordered_variables(backend):
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend=backend)
+
+    # the new variable aa is sorted right after a, shifting the columns of b, c, d and the slacks
+    reordered = create_problem(objective='19*a + 13*b + 12*c + 17*d - aa')
+    reordered.add_constraint('aa <= 10')
+    warm_solution = elpee_solver.solve(reordered, show_steps=False, show_interpret=False, backend=backend,
+                                       warm_start=solution.export_basis())
+
+    assert warm_solution.is_optimal
+    assert warm_solution.n_iterations == 0
+    assert warm_solution.var_name_list[:2] == ['a', 'aa']
+    assert warm_solution.interpret() == {**solution.interpret(), 'aa': 0, 'Slack_4': 10.0}
+
+@pytest.mark.parametrize("backend", ["list", "dense", "sparse"])
+def test_warm_start_infeasible_basis(backend):
+
+    solution = elpee_solver.solve(create_problem(), show_steps=False, show_interpret=False, backend=backend)
+
+    # the basis of the previous solution is infeasible for the changed solution values
+    changed = create_problem(rhs=(225, 117, 320))
+    cold_solution = elpee_solver.solve(create_problem(rhs=(225, 117, 320)), show_steps=False,
+                                       show_interpret=False, backend=backend)
+    warm_solution = elpee_solver.solve(changed, show_steps=False, show_interpret=False, backend=backend,
+                                       warm_start=solution)
+
+    assert warm_solution.is_optimal
+    assert warm_solution.interpret()['Sol'] == cold_solution.interpret()['Sol']
+    assert warm_solution.n_iterations <= cold_solution.n_iterations